@@ -0,0 +1,49 @@
+"""Store dependencies.metadata as JSONB.
+
+Revision ID: 014
+Revises: 013
+Create Date: 2026-10-18
+
+Converts the dependencies.metadata column from JSON text to JSONB with a
+non-null '{}' default so the API can read it back as raw JSON text
+(metadata::text) and splice it into responses without a parse/dump
+round-trip per row.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '014'
+down_revision = '013'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Convert dependencies.metadata to JSONB NOT NULL DEFAULT '{}'."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("UPDATE dependencies SET metadata = '{}' WHERE metadata IS NULL")
+    op.execute(
+        "ALTER TABLE dependencies "
+        "ALTER COLUMN metadata TYPE JSONB USING metadata::jsonb"
+    )
+    op.execute("ALTER TABLE dependencies ALTER COLUMN metadata SET DEFAULT '{}'::jsonb")
+    op.execute("ALTER TABLE dependencies ALTER COLUMN metadata SET NOT NULL")
+
+
+def downgrade():
+    """Revert dependencies.metadata to nullable JSON."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("ALTER TABLE dependencies ALTER COLUMN metadata DROP NOT NULL")
+    op.execute("ALTER TABLE dependencies ALTER COLUMN metadata DROP DEFAULT")
+    op.execute(
+        "ALTER TABLE dependencies "
+        "ALTER COLUMN metadata TYPE JSON USING metadata::json"
+    )
@@ -0,0 +1,45 @@
+"""Add trigram index for entity name substring search.
+
+Revision ID: 015
+Revises: 014
+Create Date: 2026-10-18
+
+list_entities filters names with a case-insensitive substring match. A
+b-tree index cannot serve a leading-wildcard LIKE, so the query scanned the
+whole table. A pg_trgm GIN index on lower(name) lets PostgreSQL answer
+"lower(name) LIKE '%term%'" with a bitmap index scan.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '015'
+down_revision = '014'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Enable pg_trgm and create entities_name_trgm_idx."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY avoids blocking writes to entities while the index builds
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS entities_name_trgm_idx "
+            "ON entities USING GIN (lower(name) gin_trgm_ops)"
+        )
+
+
+def downgrade():
+    """Drop entities_name_trgm_idx (the pg_trgm extension is left installed)."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS entities_name_trgm_idx")
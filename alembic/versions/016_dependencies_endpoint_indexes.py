@@ -0,0 +1,57 @@
+"""Add composite (type, id) indexes on dependency endpoints.
+
+Revision ID: 016
+Revises: 015
+Create Date: 2026-10-18
+
+Every dependency lookup for a resource filters on both halves of the
+polymorphic reference, e.g. source_type = 'entity' AND source_id = 42.
+Composite indexes let PostgreSQL resolve that pair with a single index
+probe instead of intersecting the single-column indexes.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '016'
+down_revision = '015'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create ix_dependencies_source and ix_dependencies_target."""
+    # CONCURRENTLY (PostgreSQL only) avoids blocking dependency writes
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_dependencies_source',
+            'dependencies',
+            ['source_type', 'source_id'],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_dependencies_target',
+            'dependencies',
+            ['target_type', 'target_id'],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    """Drop the composite dependency endpoint indexes."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_dependencies_target',
+            table_name='dependencies',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
+        op.drop_index(
+            'ix_dependencies_source',
+            table_name='dependencies',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
@@ -0,0 +1,56 @@
+"""Add indexes for graph and map lookups.
+
+Revision ID: 017
+Revises: 016
+Create Date: 2026-10-18
+
+Migration 011 creates the base tables without secondary indexes, so the
+graph endpoints' remaining hot filters fall back to sequential scans:
+- dependencies.tenant_id: map dependency edges filtered by tenant
+- organizations.parent_id: organization subtree walk
+- entities (organization_id, type): entity filters by organization and type
+
+Index names match what SQLAlchemy's index=True / __table_args__ produce, so
+databases bootstrapped with create_all() are left unchanged.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '017'
+down_revision = '016'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_dependencies_tenant_id', 'dependencies', ['tenant_id']),
+    ('ix_organizations_parent_id', 'organizations', ['parent_id']),
+    ('ix_entities_organization_type', 'entities', ['organization_id', 'type']),
+)
+
+
+def upgrade():
+    """Create the graph lookup indexes."""
+    # CONCURRENTLY (PostgreSQL only) avoids blocking writes while building
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    """Drop the graph lookup indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
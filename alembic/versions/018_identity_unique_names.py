@@ -0,0 +1,72 @@
+"""Enforce unique identity usernames and identity group names.
+
+Revision ID: 018
+Revises: 017
+Create Date: 2026-10-18
+
+Migration 011 creates identities.username and identity_groups.name without
+the unique indexes the SQLAlchemy models declare. create_identity and
+create_group used to guard uniqueness with a SELECT before the INSERT, which
+costs a round-trip and races with concurrent creates; they now rely on these
+indexes and map the IntegrityError to the same 400 response.
+
+The handlers have always rejected duplicates, so existing data is expected to
+be unique. If it is not, the concurrent build fails and leaves an INVALID
+index behind; upgrade() drops such a leftover before building, so the
+migration can be re-run once the duplicates are resolved.
+Index names match what SQLAlchemy's unique=True, index=True produce, so
+databases bootstrapped with create_all() are left unchanged.
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '018'
+down_revision = '017'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_identities_username', 'identities', ['username']),
+    ('ix_identity_groups_name', 'identity_groups', ['name']),
+)
+
+
+def upgrade():
+    """Create the unique name indexes."""
+    bind = op.get_bind()
+    # CONCURRENTLY (PostgreSQL only) avoids blocking writes while building
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            # A failed concurrent build leaves an INVALID index that
+            # if_not_exists would otherwise keep
+            if bind.dialect.name == 'postgresql' and bind.execute(
+                sa.text(
+                    'SELECT 1 FROM pg_index i JOIN pg_class c ON c.oid = i.indexrelid '
+                    'WHERE c.relname = :name AND NOT i.indisvalid'
+                ),
+                {'name': name},
+            ).first():
+                op.drop_index(name, table_name=table, postgresql_concurrently=True)
+            op.create_index(
+                name,
+                table,
+                columns,
+                unique=True,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    """Drop the unique name indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
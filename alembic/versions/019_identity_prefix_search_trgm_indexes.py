@@ -0,0 +1,58 @@
+"""Add trigram indexes for identity and IPAM prefix substring search.
+
+Revision ID: 019
+Revises: 018
+Create Date: 2026-10-18
+
+list_identities searches username, email and full_name, and list_prefixes
+searches prefix and description, all with a case-insensitive substring match.
+A b-tree index (including a lower() text_pattern_ops one) can only serve a
+prefix-anchored LIKE, so these searches scanned the whole table. As with
+migration 015, pg_trgm GIN indexes on lower(column) let PostgreSQL answer
+"lower(column) LIKE '%term%'" with a bitmap index scan while keeping the
+substring semantics clients rely on.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '019'
+down_revision = '018'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('identities_username_trgm_idx', 'identities', 'username'),
+    ('identities_email_trgm_idx', 'identities', 'email'),
+    ('identities_full_name_trgm_idx', 'identities', 'full_name'),
+    ('ipam_prefixes_prefix_trgm_idx', 'ipam_prefixes', 'prefix'),
+    ('ipam_prefixes_description_trgm_idx', 'ipam_prefixes', 'description'),
+)
+
+
+def upgrade():
+    """Enable pg_trgm and create the lower(column) trigram indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY avoids blocking writes while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN (lower({column}) gin_trgm_ops)"
+            )
+
+
+def downgrade():
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
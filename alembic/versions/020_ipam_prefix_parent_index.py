@@ -0,0 +1,46 @@
+"""Add an index for IPAM prefix tree walks.
+
+Revision ID: 020
+Revises: 019
+Create Date: 2026-10-18
+
+The prefix tree endpoint follows ipam_prefixes.parent_id one level at a time
+in a recursive CTE and flags every returned node with an EXISTS on its
+children. Migration 011 creates parent_id without an index, so each step was
+a sequential scan of ipam_prefixes.
+
+The index name matches what SQLAlchemy's index=True produces.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '020'
+down_revision = '019'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    """Create ix_ipam_prefixes_parent_id."""
+    # CONCURRENTLY (PostgreSQL only) avoids blocking writes while building
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_ipam_prefixes_parent_id',
+            'ipam_prefixes',
+            ['parent_id'],
+            if_not_exists=True,
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade():
+    """Drop ix_ipam_prefixes_parent_id."""
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            'ix_ipam_prefixes_parent_id',
+            table_name='ipam_prefixes',
+            if_exists=True,
+            postgresql_concurrently=True,
+        )
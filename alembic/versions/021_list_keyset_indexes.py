@@ -0,0 +1,53 @@
+"""Add (created_at, id) indexes for keyset list pagination.
+
+Revision ID: 021
+Revises: 020
+Create Date: 2026-10-18
+
+list_issues, list_addresses and list_vlans page newest first, ordered by
+(created_at DESC, id DESC), and a cursor continues with a keyset comparison
+on the same pair. A composite b-tree on (created_at, id) serves both the
+ordering and the seek with a backward index scan, so a page costs the same at
+any depth instead of reading and discarding OFFSET rows.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '021'
+down_revision = '020'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ix_issues_created_at_id', 'issues', ['created_at', 'id']),
+    ('ix_ipam_addresses_created_at_id', 'ipam_addresses', ['created_at', 'id']),
+    ('ix_ipam_vlans_created_at_id', 'ipam_vlans', ['created_at', 'id']),
+)
+
+
+def upgrade():
+    """Create the keyset pagination indexes."""
+    # CONCURRENTLY (PostgreSQL only) avoids blocking writes while building
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(
+                name,
+                table,
+                columns,
+                if_not_exists=True,
+                postgresql_concurrently=True,
+            )
+
+
+def downgrade():
+    """Drop the keyset pagination indexes."""
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(
+                name,
+                table_name=table,
+                if_exists=True,
+                postgresql_concurrently=True,
+            )
@@ -0,0 +1,57 @@
+"""Add trigram indexes for IPAM address, VLAN and issue substring search.
+
+Revision ID: 022
+Revises: 021
+Create Date: 2026-10-18
+
+list_addresses searches address and description, list_vlans searches name and
+description, and issue search matches title and description, all with a
+case-insensitive substring match that scanned the whole table. As with
+migrations 015 and 019, pg_trgm GIN indexes on lower(column) let PostgreSQL
+answer "lower(column) LIKE '%term%'" with a bitmap index scan.
+"""
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '022'
+down_revision = '021'
+branch_labels = None
+depends_on = None
+
+INDEXES = (
+    ('ipam_addresses_address_trgm_idx', 'ipam_addresses', 'address'),
+    ('ipam_addresses_description_trgm_idx', 'ipam_addresses', 'description'),
+    ('ipam_vlans_name_trgm_idx', 'ipam_vlans', 'name'),
+    ('ipam_vlans_description_trgm_idx', 'ipam_vlans', 'description'),
+    ('issues_title_trgm_idx', 'issues', 'title'),
+    ('issues_description_trgm_idx', 'issues', 'description'),
+)
+
+
+def upgrade():
+    """Enable pg_trgm and create the lower(column) trigram indexes."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    # CONCURRENTLY avoids blocking writes while the indexes build
+    with op.get_context().autocommit_block():
+        for name, table, column in INDEXES:
+            op.execute(
+                f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {name} "
+                f"ON {table} USING GIN (lower({column}) gin_trgm_ops)"
+            )
+
+
+def downgrade():
+    """Drop the trigram indexes (the pg_trgm extension is left installed)."""
+    bind = op.get_bind()
+    if bind.dialect.name != 'postgresql':
+        return
+
+    with op.get_context().autocommit_block():
+        for name, _, _ in reversed(INDEXES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {name}")
@@ -93,14 +93,14 @@ async def list_api_keys():
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
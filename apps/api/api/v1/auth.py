@@ -15,7 +15,7 @@ from apps.api.auth import generate_token, login_required, verify_password
 from apps.api.auth.jwt_handler import verify_token
 from apps.api.models.dataclasses import IdentityDTO, from_pydal_row
 from apps.api.models.schemas import LoginRequest, RegisterRequest
-from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.async_utils import run_cpu_bound, run_in_threadpool
 
 bp = Blueprint("auth", __name__)
 
@@ -62,6 +62,9 @@ async def register():
             )
         return jsonify({"error": "Validation failed", "details": errors}), 422
 
+    # Hash on the CPU executor so the KDF does not hold a DB thread
+    password_hash = await run_cpu_bound(generate_password_hash, validated_data.password)
+
     # Check if username or email already exists and create user
     def create_user():
         # Check if username already exists
@@ -86,7 +89,7 @@ async def register():
             full_name=validated_data.full_name,
             identity_type="human",
             auth_provider="local",
-            password_hash=generate_password_hash(validated_data.password),
+            password_hash=password_hash,
             is_active=True,
             is_superuser=False,
             mfa_enabled=False,
@@ -6,8 +6,10 @@
 import asyncio
 import logging
 from dataclasses import asdict
+from functools import lru_cache
 from typing import Optional
 
+import orjson
 from flask import Blueprint, current_app, jsonify, request
 from penguin_libs.pydantic import RequestModel, validated_request
 from pydantic import Field
@@ -20,7 +22,9 @@ from apps.api.models.dataclasses import (
     from_pydal_row,
     from_pydal_rows,
 )
+from apps.api.utils.api_responses import ApiResponse
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.pydal_helpers import execute_sql, is_postgres, iter_sql
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +50,55 @@ RESOURCE_TABLE_MAP = {
     "organization": "organizations",
 }
 
+# PostgreSQL read path: metadata is JSONB and is read back as raw JSON text so
+# it can be spliced into the response with orjson.Fragment instead of being
+# parsed into a dict and dumped again.
+_DEP_COLUMNS_SQL = (
+    "id, tenant_id, source_type, source_id, target_type, target_id, "
+    "dependency_type, metadata::text AS metadata_json, created_at, updated_at, "
+    "village_id"
+)
+_DEP_SELECT_SQL = f"SELECT {_DEP_COLUMNS_SQL} FROM dependencies"
+
+# Structurally fixed statements, built once at import so hot handlers skip
+# query-builder compilation entirely.
+_SQL_GET_DEP = f"{_DEP_SELECT_SQL} WHERE id = %s"
+_SQL_DELETE_DEP = "DELETE FROM dependencies WHERE id = %s RETURNING id"
+_SQL_COUNT_DEPS = "SELECT COUNT(*) FROM dependencies"
+_SQL_LIST_DEPS = f"{_DEP_SELECT_SQL} ORDER BY created_at DESC LIMIT %s OFFSET %s"
+_SQL_OUTGOING_DEPS = (
+    "SELECT id, target_type, target_id, dependency_type, "
+    "metadata::text AS metadata_json FROM dependencies "
+    "WHERE source_type = %s AND source_id = %s"
+)
+_SQL_INCOMING_DEPS = (
+    "SELECT id, source_type, source_id, dependency_type, "
+    "metadata::text AS metadata_json FROM dependencies "
+    "WHERE target_type = %s AND target_id = %s"
+)
+
+# Pages larger than this are streamed row by row instead of buffered
+_STREAM_THRESHOLD = 200
+
+# Columns update_dependency may change
+_DEP_UPDATE_FIELDS = (
+    "dependency_type",
+    "metadata",
+    "source_type",
+    "source_id",
+    "target_type",
+    "target_id",
+)
+
+# Equality filters accepted by list_dependencies: (query arg, column, type)
+_DEP_FILTERS = (
+    ("source_type", "source_type", str),
+    ("source_id", "source_id", int),
+    ("target_type", "target_type", str),
+    ("target_id", "target_id", int),
+    ("dependency_type", "dependency_type", str),
+)
+
 
 # Pydantic request models
 class CreateDependencyRequest(RequestModel):
@@ -132,6 +185,52 @@ class BulkDeleteDependenciesRequest(RequestModel):
     )
 
 
+def _dependency_json(row: dict) -> dict:
+    """Turn a raw dependency row into a response dict with spliced metadata."""
+    row["metadata"] = orjson.Fragment(row.pop("metadata_json") or "{}")
+    return row
+
+
+def _dependency_filters(args) -> tuple[tuple[str, ...], list]:
+    """Extract the active list_dependencies filter columns and their values."""
+    columns = []
+    params = []
+    for arg, column, cast in _DEP_FILTERS:
+        # Test the raw value so an id of 0 still filters
+        if args.get(arg):
+            columns.append(column)
+            params.append(args.get(arg, type=cast))
+    return tuple(columns), params
+
+
+@lru_cache(maxsize=32)
+def _list_dependencies_sql(columns: tuple[str, ...]) -> tuple[str, str]:
+    """Return the (count, page) SQL for a combination of filter columns."""
+    if not columns:
+        return _SQL_COUNT_DEPS, _SQL_LIST_DEPS
+    where = " WHERE " + " AND ".join(f"{column} = %s" for column in columns)
+    return (
+        f"{_SQL_COUNT_DEPS}{where}",
+        f"{_DEP_SELECT_SQL}{where} ORDER BY created_at DESC LIMIT %s OFFSET %s",
+    )
+
+
+@lru_cache(maxsize=64)
+def _update_dependency_sql(columns: frozenset[str]) -> str:
+    """Return the UPDATE ... RETURNING SQL for a set of changed columns.
+
+    Parameters are bound in sorted column order followed by the id.
+    """
+    assignments = ", ".join(
+        f"{column} = %s::jsonb" if column == "metadata" else f"{column} = %s"
+        for column in sorted(columns)
+    )
+    return (
+        f"UPDATE dependencies SET {assignments}, updated_at = now() "
+        f"WHERE id = %s RETURNING {_DEP_COLUMNS_SQL}"
+    )
+
+
 def get_resource(db, resource_type: str, resource_id: int):
     """Get a resource by type and ID."""
     table_name = RESOURCE_TABLE_MAP.get(resource_type)
@@ -151,7 +250,8 @@ async def list_dependencies():
 
     Query Parameters:
         - page: Page number (default: 1)
-        - per_page: Items per page (default: 50, max: 1000)
+        - per_page: Items per page (default: 50, max: 1000; pages over 200
+          are streamed)
         - source_type: Filter by source type (entity, identity, project, etc.)
         - source_id: Filter by source ID
         - target_type: Filter by target type
@@ -166,6 +266,49 @@ async def list_dependencies():
     # Get pagination params
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
+    offset = (page - 1) * per_page
+
+    if is_postgres(db):
+        columns, params = _dependency_filters(request.args)
+        count_sql, page_sql = _list_dependencies_sql(columns)
+
+        if per_page > _STREAM_THRESHOLD:
+            total = await run_in_threadpool(
+                lambda: execute_sql(db, count_sql, params)[0][0]
+            )
+            # Rows are encoded as the server-side cursor yields them
+            rows = iter_sql(db, page_sql, (*params, per_page, offset))
+            return ApiResponse.stream_paginated(
+                PaginatedResponse(
+                    items=(_dependency_json(row) for row in rows),
+                    total=total,
+                    page=page,
+                    per_page=per_page,
+                    pages=(total + per_page - 1) // per_page if total > 0 else 0,
+                )
+            )
+
+        async with asyncio.TaskGroup() as tg:
+            count_task = tg.create_task(
+                run_in_threadpool(lambda: execute_sql(db, count_sql, params)[0][0])
+            )
+            rows_task = tg.create_task(
+                run_in_threadpool(
+                    lambda: execute_sql(
+                        db, page_sql, (*params, per_page, offset), as_dict=True
+                    )
+                )
+            )
+
+        total = count_task.result()
+        response = PaginatedResponse(
+            items=[_dependency_json(row) for row in rows_task.result()],
+            total=total,
+            page=page,
+            per_page=per_page,
+            pages=(total + per_page - 1) // per_page if total > 0 else 0,
+        )
+        return ApiResponse.orjson(response)
 
     # Build query
     query = db.dependencies.id > 0
@@ -189,9 +332,6 @@ async def list_dependencies():
         dep_type = request.args.get("dependency_type")
         query &= db.dependencies.dependency_type == dep_type
 
-    # Calculate pagination
-    offset = (page - 1) * per_page
-
     # Use asyncio TaskGroup for concurrent queries (Python 3.12)
     async with asyncio.TaskGroup() as tg:
         count_task = tg.create_task(run_in_threadpool(lambda: db(query).count()))
@@ -215,14 +355,14 @@ async def list_dependencies():
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
@@ -333,7 +473,7 @@ async def create_dependency(body: CreateDependencyRequest):
             target_type=target_type,
             target_id=target_id,
             dependency_type=body.dependency_type,
-            metadata=body.metadata,
+            metadata=body.metadata or {},
         )
         db.commit()
         return None, None, db.dependencies[dep_id]
@@ -362,6 +502,14 @@ async def get_dependency(id: int):
     """
     db = current_app.db
 
+    if is_postgres(db):
+        rows = await run_in_threadpool(
+            lambda: execute_sql(db, _SQL_GET_DEP, (id,), as_dict=True)
+        )
+        if not rows:
+            return jsonify({"error": "Dependency not found"}), 404
+        return ApiResponse.orjson(_dependency_json(rows[0]))
+
     row = await run_in_threadpool(lambda: db.dependencies[id])
 
     if not row:
@@ -391,11 +539,6 @@ async def update_dependency(id: int, body: UpdateDependencyRequest):
     """
     db = current_app.db
 
-    # Check if dependency exists
-    existing = await run_in_threadpool(lambda: db.dependencies[id])
-    if not existing:
-        return jsonify({"error": "Dependency not found"}), 404
-
     # Validate resource types if being updated
     if body.source_type and body.source_type not in VALID_RESOURCE_TYPES:
         return (
@@ -416,22 +559,39 @@ async def update_dependency(id: int, body: UpdateDependencyRequest):
             400,
         )
 
+    update_fields = {
+        field: value
+        for field in _DEP_UPDATE_FIELDS
+        if (value := getattr(body, field)) is not None
+    }
+
+    if is_postgres(db) and update_fields:
+        # Single UPDATE ... RETURNING; an empty result means the id is unknown
+        columns = frozenset(update_fields)
+        params = [
+            (
+                orjson.dumps(update_fields[column]).decode()
+                if column == "metadata"
+                else update_fields[column]
+            )
+            for column in sorted(columns)
+        ]
+        rows = await run_in_threadpool(
+            lambda: execute_sql(
+                db, _update_dependency_sql(columns), (*params, id), as_dict=True
+            )
+        )
+        if not rows:
+            return jsonify({"error": "Dependency not found"}), 404
+        return ApiResponse.orjson(_dependency_json(rows[0]))
+
+    # Check if dependency exists
+    existing = await run_in_threadpool(lambda: db.dependencies[id])
+    if not existing:
+        return jsonify({"error": "Dependency not found"}), 404
+
     # Update dependency
     def update_in_db():
-        update_fields = {}
-        if body.dependency_type is not None:
-            update_fields["dependency_type"] = body.dependency_type
-        if body.metadata is not None:
-            update_fields["metadata"] = body.metadata
-        if body.source_type is not None:
-            update_fields["source_type"] = body.source_type
-        if body.source_id is not None:
-            update_fields["source_id"] = body.source_id
-        if body.target_type is not None:
-            update_fields["target_type"] = body.target_type
-        if body.target_id is not None:
-            update_fields["target_id"] = body.target_id
-
         db(db.dependencies.id == id).update(**update_fields)
         db.commit()
         return db.dependencies[id]
@@ -457,6 +617,14 @@ async def delete_dependency(id: int):
     """
     db = current_app.db
 
+    if is_postgres(db):
+        deleted = await run_in_threadpool(
+            lambda: execute_sql(db, _SQL_DELETE_DEP, (id,))
+        )
+        if not deleted:
+            return jsonify({"error": "Dependency not found"}), 404
+        return "", 204
+
     # Check if dependency exists
     existing = await run_in_threadpool(lambda: db.dependencies[id])
     if not existing:
@@ -527,7 +695,7 @@ async def create_bulk_dependencies():
                     target_type=dep_req.target_type,
                     target_id=dep_req.target_id,
                     dependency_type=dep_req.dependency_type,
-                    metadata=dep_req.metadata,
+                    metadata=dep_req.metadata or {},
                 )
                 created_ids.append(dep_id)
 
@@ -612,6 +780,28 @@ async def get_resource_dependencies(resource_type: str, resource_id: int):
         return jsonify({"error": f"{resource_type.title()} not found"}), 404
 
     direction = request.args.get("direction", "all")
+    use_raw_sql = is_postgres(db)
+
+    def select_deps(column_type: str, column_id: str, peer: str):
+        if use_raw_sql:
+            sql = _SQL_OUTGOING_DEPS if peer == "target" else _SQL_INCOMING_DEPS
+            rows = execute_sql(db, sql, (resource_type, resource_id), as_dict=True)
+            return [_dependency_json(row) for row in rows]
+
+        rows = db(
+            (getattr(db.dependencies, column_type) == resource_type)
+            & (getattr(db.dependencies, column_id) == resource_id)
+        ).select()
+        return [
+            {
+                "id": dep.id,
+                f"{peer}_type": dep[f"{peer}_type"],
+                f"{peer}_id": dep[f"{peer}_id"],
+                "dependency_type": dep.dependency_type,
+                "metadata": dep.metadata,
+            }
+            for dep in rows
+        ]
 
     def get_deps():
         result = {
@@ -624,39 +814,13 @@ async def get_resource_dependencies(resource_type: str, resource_id: int):
 
         if direction in ("outgoing", "all"):
             # This resource depends on others
-            outgoing = db(
-                (db.dependencies.source_type == resource_type)
-                & (db.dependencies.source_id == resource_id)
-            ).select()
-            result["depends_on"] = [
-                {
-                    "id": dep.id,
-                    "target_type": dep.target_type,
-                    "target_id": dep.target_id,
-                    "dependency_type": dep.dependency_type,
-                    "metadata": dep.metadata,
-                }
-                for dep in outgoing
-            ]
+            result["depends_on"] = select_deps("source_type", "source_id", "target")
 
         if direction in ("incoming", "all"):
             # Others depend on this resource
-            incoming = db(
-                (db.dependencies.target_type == resource_type)
-                & (db.dependencies.target_id == resource_id)
-            ).select()
-            result["depended_by"] = [
-                {
-                    "id": dep.id,
-                    "source_type": dep.source_type,
-                    "source_id": dep.source_id,
-                    "dependency_type": dep.dependency_type,
-                    "metadata": dep.metadata,
-                }
-                for dep in incoming
-            ]
+            result["depended_by"] = select_deps("target_type", "target_id", "source")
 
         return result
 
     result = await run_in_threadpool(get_deps)
-    return jsonify(result), 200
+    return ApiResponse.orjson(result)
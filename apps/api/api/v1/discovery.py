@@ -4,26 +4,128 @@
 
 
 import logging
+import threading
+import time
 
+from cachetools import TTLCache
 from flask import Blueprint, current_app, jsonify, request
+from pydantic import ValidationError
 
 from apps.api.auth.decorators import admin_required, login_required
 from apps.api.logging_config import log_error_and_respond
+from apps.api.models.pydantic.discovery import (
+    CompleteDiscoveryJobRequest,
+    CreateDiscoveryJobRequest,
+    UpdateDiscoveryJobRequest,
+)
 from apps.api.services.discovery import DiscoveryService
+from apps.api.services.errors import NotFoundError
+from apps.api.utils.api_responses import ApiResponse
+from apps.api.utils.http_cache import not_modified, weak_etag, with_etag
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint("discovery", __name__)
 
+# Short-lived caches for polled, slowly-changing reads. list_discovery_jobs is
+# keyed on its filters; get_pending_jobs has a single key and a shorter TTL
+# because scanners poll it tightly. Writes in this process clear both; other
+# worker processes converge within the TTL.
+_jobs_cache = TTLCache(maxsize=512, ttl=10)
+_pending_cache = TTLCache(maxsize=1, ttl=2)
+_cache_lock = threading.RLock()
+_cache_stats = {"hits": 0, "misses": 0, "invalidations": 0}
+_cache_invalidated_at = {"at": None}
+
+# Reads come from the replica, which may lag a write. For this long after an
+# invalidation, fills are served but not stored, and pending jobs are read
+# from the primary so scanners don't re-run a job that was just started.
+_CACHE_SETTLE_SECONDS = 5
+
+
+def _recently_invalidated() -> bool:
+    """True within the settle window after the last cache invalidation."""
+    invalidated_at = _cache_invalidated_at["at"]
+    return (
+        invalidated_at is not None
+        and time.monotonic() - invalidated_at < _CACHE_SETTLE_SECONDS
+    )
+
+
+def _cached(cache: TTLCache, key, loader):
+    """Return cache[key], calling loader() to fill it on a miss.
+
+    loader() runs outside the lock, so its result is only stored if no
+    invalidation happened meanwhile and the settle window has passed;
+    otherwise it may predate the write.
+    """
+    with _cache_lock:
+        if key in cache:
+            _cache_stats["hits"] += 1
+            return cache[key]
+        _cache_stats["misses"] += 1
+        generation = _cache_stats["invalidations"]
+    value = loader()
+    with _cache_lock:
+        if _cache_stats["invalidations"] == generation and not _recently_invalidated():
+            cache[key] = value
+    return value
+
+
+def _invalidate_job_caches() -> None:
+    """Drop cached job listings after any job write."""
+    with _cache_lock:
+        _jobs_cache.clear()
+        _pending_cache.clear()
+        _cache_stats["invalidations"] += 1
+        _cache_invalidated_at["at"] = time.monotonic()
+
+
+def _history_etag(history: list, *parts) -> str:
+    """Build a weak ETag for a discovery history listing."""
+    return weak_etag(
+        "discovery_history",
+        *parts,
+        [(h.get("id"), h.get("status"), h.get("completed_at")) for h in history],
+    )
+
+
+def _parse_body(model):
+    """Decode and validate the request body in one pass.
+
+    Returns:
+        Tuple of (model instance, None) or (None, (error_json, 400))
+    """
+    raw = request.get_data(cache=False)
+    if not raw.strip():
+        return None, (jsonify({"error": "Request body required"}), 400)
+    try:
+        return model.model_validate_json(raw), None
+    except ValidationError as e:
+        errors = e.errors()
+        missing = [str(err["loc"][0]) for err in errors if err["type"] == "missing"]
+        if missing:
+            message = f'Missing required fields: {", ".join(missing)}'
+        else:
+            message = f"Invalid request body: {errors[0]['msg']}"
+        return None, (jsonify({"error": message}), 400)
+
 
 def get_discovery_service(read_only=False):
-    """Get DiscoveryService instance with current database.
+    """Get the app's DiscoveryService instance for the current database.
+
+    DiscoveryService holds no state beyond its DB handle, so one instance per
+    connection is kept in app.extensions instead of building one per request.
 
     Args:
         read_only: If True, uses read replica connection for queries.
     """
     db = current_app.db_read if read_only else current_app.db
-    return DiscoveryService(db)
+    services = current_app.extensions.setdefault("discovery_services", {})
+    service = services.get(read_only)
+    if service is None or service.db is not db:
+        service = services[read_only] = DiscoveryService(db)
+    return service
 
 
 # Discovery Jobs endpoints
@@ -55,11 +157,15 @@ def list_discovery_jobs():
         if enabled is not None:
             enabled_bool = enabled.lower() == "true"
 
-        jobs = service.list_jobs(
-            provider=provider, enabled=enabled_bool, organization_id=organization_id
+        jobs = _cached(
+            _jobs_cache,
+            (provider, enabled_bool, organization_id),
+            lambda: service.list_jobs(
+                provider=provider, enabled=enabled_bool, organization_id=organization_id
+            ),
         )
 
-        return jsonify({"jobs": jobs, "count": len(jobs)}), 200
+        return ApiResponse.orjson({"jobs": jobs, "count": len(jobs)})
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to process request", 500)
@@ -92,28 +198,20 @@ def create_discovery_job():
         400: Invalid request
     """
     try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "Request body required"}), 400
-
-        required = ["name", "provider", "config", "organization_id"]
-        missing = [f for f in required if f not in data]
-        if missing:
-            return (
-                jsonify({"error": f'Missing required fields: {", ".join(missing)}'}),
-                400,
-            )
+        body, error = _parse_body(CreateDiscoveryJobRequest)
+        if error:
+            return error
 
         service = get_discovery_service()
         job = service.create_job(
-            name=data["name"],
-            provider=data["provider"],
-            config=data["config"],
-            organization_id=data["organization_id"],
-            schedule_interval=data.get("schedule_interval"),
-            description=data.get("description"),
+            name=body.name,
+            provider=body.provider,
+            config=body.config,
+            organization_id=body.organization_id,
+            schedule_interval=body.schedule_interval,
+            description=body.description,
         )
+        _invalidate_job_caches()
 
         return jsonify(job), 201
 
@@ -134,11 +232,22 @@ def get_discovery_job(job_id):
     try:
         service = get_discovery_service(read_only=True)
         job = service.get_job(job_id)
-        return jsonify(job), 200
 
+        etag = weak_etag(
+            "discovery_job",
+            job_id,
+            job.get("updated_at"),
+            job.get("last_run_at"),
+            job.get("next_run_at"),
+        )
+        if cached := not_modified(etag):
+            return cached
+
+        return with_etag(ApiResponse.orjson(job), etag)
+
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Failed to process request", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Failed to process request", 404)
         return log_error_and_respond(logger, e, "Failed to process request", 500)
 
 
@@ -162,26 +271,26 @@ def update_discovery_job(job_id):
         404: Job not found
     """
     try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "Request body required"}), 400
+        body, error = _parse_body(UpdateDiscoveryJobRequest)
+        if error:
+            return error
 
         service = get_discovery_service()
         job = service.update_job(
             job_id=job_id,
-            name=data.get("name"),
-            config=data.get("config"),
-            schedule_interval=data.get("schedule_interval"),
-            description=data.get("description"),
-            enabled=data.get("enabled"),
+            name=body.name,
+            config=body.config,
+            schedule_interval=body.schedule_interval,
+            description=body.description,
+            enabled=body.enabled,
         )
+        _invalidate_job_caches()
 
         return jsonify(job), 200
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Failed to process request", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Failed to process request", 404)
         return log_error_and_respond(logger, e, "Failed to process request", 400)
 
 
@@ -198,11 +307,12 @@ def delete_discovery_job(job_id):
     try:
         service = get_discovery_service()
         result = service.delete_job(job_id)
+        _invalidate_job_caches()
         return jsonify(result), 200
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Failed to process request", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Failed to process request", 404)
         return log_error_and_respond(logger, e, "Failed to process request", 500)
 
 
@@ -221,9 +331,9 @@ def test_discovery_job(job_id):
         result = service.test_job(job_id)
         return jsonify(result), 200
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Failed to process request", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Failed to process request", 404)
         return log_error_and_respond(logger, e, "Failed to process request", 500)
 
 
@@ -255,16 +365,18 @@ def run_discovery_job(job_id):
                 "Use the worker service instead. Sunset target: v4.0.0"
             )
             result = service.run_discovery(job_id)
+            _invalidate_job_caches()
             status_code = 202 if result.get("success") else 500
             return jsonify(result), status_code
 
         # Default: queue for worker by setting next_run_at = now
         result = service.queue_job_for_worker(job_id)
+        _invalidate_job_caches()
         return jsonify(result), 202
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Failed to process request", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Failed to process request", 404)
         return log_error_and_respond(logger, e, "Failed to process request", 500)
 
 
@@ -287,7 +399,13 @@ def get_discovery_job_history(job_id):
 
         history = service.get_discovery_history(job_id=job_id, limit=limit)
 
-        return jsonify({"history": history, "count": len(history)}), 200
+        etag = _history_etag(history, job_id, limit)
+        if cached := not_modified(etag):
+            return cached
+
+        return with_etag(
+            ApiResponse.orjson({"history": history, "count": len(history)}), etag
+        )
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to process request", 500)
@@ -312,7 +430,13 @@ def get_all_discovery_history():
 
         history = service.get_discovery_history(limit=limit)
 
-        return jsonify({"history": history, "count": len(history)}), 200
+        etag = _history_etag(history, limit)
+        if cached := not_modified(etag):
+            return cached
+
+        return with_etag(
+            ApiResponse.orjson({"history": history, "count": len(history)}), etag
+        )
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to process request", 500)
@@ -334,9 +458,9 @@ def get_pending_jobs():
         200: List of pending jobs
     """
     try:
-        service = get_discovery_service(read_only=True)
-        jobs = service.get_pending_jobs()
-        return jsonify({"jobs": jobs}), 200
+        service = get_discovery_service(read_only=not _recently_invalidated())
+        jobs = _cached(_pending_cache, (), service.get_pending_jobs)
+        return ApiResponse.orjson({"jobs": jobs})
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to get pending jobs", 500)
@@ -356,11 +480,12 @@ def start_job(job_id):
     try:
         service = get_discovery_service()
         result = service.mark_job_running(job_id)
+        _invalidate_job_caches()
         return jsonify(result), 200
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Job not found", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Job not found", 404)
         return log_error_and_respond(logger, e, "Failed to start job", 500)
 
 
@@ -383,21 +508,37 @@ def complete_job(job_id):
         404: Job not found
     """
     try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"error": "Request body required"}), 400
+        body, error = _parse_body(CompleteDiscoveryJobRequest)
+        if error:
+            return error
 
         service = get_discovery_service()
         result = service.complete_job(
             job_id=job_id,
-            success=data.get("success", False),
-            results=data.get("results", {}),
-            error_message=data.get("error_message"),
+            success=body.success,
+            results=body.results,
+            error_message=body.error_message,
         )
+        _invalidate_job_caches()
         return jsonify(result), 200
 
+    except NotFoundError as e:
+        return log_error_and_respond(logger, e, "Job not found", 404)
     except Exception as e:
-        if "not found" in str(e).lower():
-            return log_error_and_respond(logger, e, "Job not found", 404)
         return log_error_and_respond(logger, e, "Failed to complete job", 500)
+
+
+@bp.route("/_cache/stats", methods=["GET"])
+@admin_required
+def get_cache_stats():
+    """
+    Get discovery job cache statistics.
+
+    Returns:
+        200: Hit/miss/invalidation counters and current cache sizes
+    """
+    with _cache_lock:
+        stats = dict(_cache_stats)
+        stats["jobs_size"] = len(_jobs_cache)
+        stats["pending_size"] = len(_pending_cache)
+    return jsonify(stats), 200
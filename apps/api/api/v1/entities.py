@@ -4,10 +4,13 @@
 
 
 import asyncio
-from dataclasses import asdict
+from dataclasses import asdict, fields
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Any
 
-from flask import Blueprint, current_app, jsonify, request
+import orjson
+from flask import Blueprint, current_app, request
 from penguin_libs.pydantic.flask_integration import validated_request
 
 from apps.api.auth.decorators import login_required
@@ -15,11 +18,11 @@ from apps.api.models.dataclasses import (
     EntityDTO,
     PaginatedResponse,
     from_pydal_row,
-    from_pydal_rows,
 )
 from apps.api.models.pydantic.entity import CreateEntityRequest, UpdateEntityRequest
 from apps.api.utils.api_responses import ApiResponse
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.http_cache import not_modified, weak_etag, with_etag
 from apps.api.utils.pydal_helpers import PaginationParams
 from apps.api.utils.validation_helpers import (
     validate_organization_and_get_tenant,
@@ -28,6 +31,185 @@ from apps.api.utils.validation_helpers import (
 
 bp = Blueprint("entities", __name__)
 
+# asyncpg statements for PostgreSQL (current_app.db_async). Column list mirrors
+# EntityDTO so records map straight onto it with EntityDTO(**dict(record)).
+_ENTITY_COLUMNS_SQL = (
+    "id, name, type, organization_id, parent_id, sub_type, external_id, "
+    "cloud_provider, region, status, COALESCE(is_managed, false) AS is_managed, "
+    "tags, metadata, last_seen_at, created_at, updated_at"
+)
+# Same columns for penguin-dal projections (list_entities fallback)
+_ENTITY_FIELDS = tuple(f.name for f in fields(EntityDTO))
+_SQL_GET_ENTITY = f"SELECT {_ENTITY_COLUMNS_SQL} FROM entities WHERE id = $1"
+_SQL_INSERT_ENTITY = (
+    "INSERT INTO entities (name, type, organization_id, parent_id, sub_type, "
+    "tags, metadata, status, is_managed, created_at, updated_at) "
+    "VALUES ($1, $2, $3, $4, $5, $6, $7, 'active', false, now(), now()) "
+    f"RETURNING {_ENTITY_COLUMNS_SQL}"
+)
+# Server-side shallow merge of the attributes patch into metadata (a JSON
+# column, so it round-trips through jsonb for the || operator)
+_SQL_PATCH_ENTITY_ATTRIBUTES = (
+    "UPDATE entities SET "
+    "metadata = (COALESCE(metadata::jsonb, '{}'::jsonb) || $2::jsonb)::json, "
+    f"updated_at = now() WHERE id = $1 RETURNING {_ENTITY_COLUMNS_SQL}"
+)
+# Dependency check and delete in one statement: the DELETE only fires when no
+# dependency references the entity. All CTEs share one snapshot, so "found"
+# reflects whether the entity existed before the delete.
+_SQL_DELETE_ENTITY = (
+    "WITH deps AS ("
+    "SELECT count(*) AS n FROM dependencies "
+    "WHERE (source_type = 'entity' AND source_id = $1) "
+    "OR (target_type = 'entity' AND target_id = $1)"
+    "), deleted AS ("
+    "DELETE FROM entities WHERE id = $1 AND (SELECT n FROM deps) = 0 RETURNING id"
+    ") SELECT EXISTS (SELECT 1 FROM entities WHERE id = $1) AS found, "
+    "(SELECT n FROM deps) AS deps, EXISTS (SELECT 1 FROM deleted) AS deleted"
+)
+
+# get_entity_dependencies: both directions in one UNION ALL, joined onto the
+# entity row so existence and edges come back in a single round-trip. Only the
+# halves the requested direction needs are included.
+_SQL_ENTITY_DEPS_OUT = (
+    "SELECT 'out' AS dir, id, target_type AS peer_type, target_id AS peer_id, "
+    "dependency_type, metadata FROM dependencies "
+    "WHERE source_type = 'entity' AND source_id = $1"
+)
+_SQL_ENTITY_DEPS_IN = (
+    "SELECT 'in' AS dir, id, source_type AS peer_type, source_id AS peer_id, "
+    "dependency_type, metadata FROM dependencies "
+    "WHERE target_type = 'entity' AND target_id = $1"
+)
+_SQL_ENTITY_DEPENDENCIES = {
+    direction: (
+        "SELECT e.id AS entity_id, e.name AS entity_name, d.* "
+        "FROM entities e LEFT JOIN (" + deps + ") d ON true WHERE e.id = $1"
+    )
+    for direction, deps in (
+        ("outgoing", _SQL_ENTITY_DEPS_OUT),
+        ("incoming", _SQL_ENTITY_DEPS_IN),
+        ("all", f"{_SQL_ENTITY_DEPS_OUT} UNION ALL {_SQL_ENTITY_DEPS_IN}"),
+    )
+}
+
+
+# list_entities filter spec: (query arg, column, op, caster). Built once at
+# import so each request is a single pass over the args actually supplied.
+_ENTITY_FILTERS = (
+    ("entity_type", "type", "eq", str),
+    ("organization_id", "organization_id", "eq", int),
+    ("name", "name", "contains", str),
+)
+
+
+def _active_entity_filters(args) -> list[tuple[str, str, object]]:
+    """Return (column, op, value) for each list_entities filter present in args."""
+    filters = []
+    for arg, column, op, caster in _ENTITY_FILTERS:
+        raw = args.get(arg)
+        if not raw:
+            continue
+        try:
+            filters.append((column, op, caster(raw)))
+        except ValueError:
+            continue
+    return filters
+
+
+def _entity_filters(args) -> tuple[str, list]:
+    """Build the list_entities WHERE clause and positional params for asyncpg."""
+    clauses = []
+    params = []
+    for column, op, value in _active_entity_filters(args):
+        if op == "contains":
+            # lower(name) LIKE matches the entities_name_trgm_idx GIN expression
+            params.append(f"%{value.lower()}%")
+            clauses.append(f"lower({column}) LIKE ${len(params)}")
+        else:
+            params.append(value)
+            clauses.append(f"{column} = ${len(params)}")
+    where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def _entity_query(db, args):
+    """Build the list_entities penguin-dal query from the same filter spec."""
+    query = db.entities.id > 0
+    for column, op, value in _active_entity_filters(args):
+        field = getattr(db.entities, column)
+        if op == "contains":
+            query &= field.ilike(f"%{value}%")
+        else:
+            query &= field == value
+    return query
+
+
+# UpdateEntityRequest attribute -> entities column
+_ENTITY_UPDATE_FIELDS = (
+    ("name", "name"),
+    ("entity_type", "type"),
+    ("organization_id", "organization_id"),
+    ("parent_id", "parent_id"),
+    ("sub_type", "sub_type"),
+    ("attributes", "metadata"),
+    ("tags", "tags"),
+)
+
+
+def _entity_update_fields(body: UpdateEntityRequest) -> dict[str, Any]:
+    """Map the non-null fields of an update request onto entity columns."""
+    return {
+        column: value
+        for attr, column in _ENTITY_UPDATE_FIELDS
+        if (value := getattr(body, attr)) is not None
+    }
+
+
+@lru_cache(maxsize=128)
+def _update_entity_sql(columns: tuple[str, ...]) -> str:
+    """Build the UPDATE ... RETURNING statement for one set of changed columns.
+
+    Columns come from _ENTITY_UPDATE_FIELDS only, so at most 2^7 variants.
+    """
+    assignments = "".join(
+        f"{column} = ${position}, " for position, column in enumerate(columns, 2)
+    )
+    return (
+        f"UPDATE entities SET {assignments}updated_at = now() "
+        f"WHERE id = $1 RETURNING {_ENTITY_COLUMNS_SQL}"
+    )
+
+
+async def _list_entities_async(pool, pagination: PaginationParams):
+    """Fetch one page of entities and the filtered total in a single query.
+
+    COUNT(*) OVER () rides along on every row, so the predicate is evaluated
+    once in one round-trip. A page past the end returns no rows to carry the
+    total, so only then is a separate count issued.
+    """
+    where, params = _entity_filters(request.args)
+    n = len(params)
+    page_sql = (
+        f"SELECT {_ENTITY_COLUMNS_SQL}, count(*) OVER () AS _total "
+        f"FROM entities{where} ORDER BY name LIMIT ${n + 1} OFFSET ${n + 2}"
+    )
+    rows = [
+        dict(record)
+        for record in await pool.fetch(
+            page_sql, *params, pagination.per_page, pagination.offset
+        )
+    ]
+    if rows:
+        total = rows[0]["_total"]
+        for row in rows:
+            del row["_total"]
+    elif pagination.offset:
+        total = await pool.fetchval(f"SELECT count(*) FROM entities{where}", *params)
+    else:
+        total = 0
+    return total, rows
+
 
 @bp.route("", methods=["GET"])
 @login_required
@@ -45,27 +227,32 @@ async def list_entities():
 
     Returns:
         200: List of entities with pagination metadata
+        304: Not modified (If-None-Match matched the page's ETag)
     """
-    db = current_app.db_read
-
-    # Get pagination params using helper
     pagination = PaginationParams.from_request()
 
-    # Build query
-    query = db.entities.id > 0
-
-    # Apply filters
-    if request.args.get("entity_type"):
-        entity_type = request.args.get("entity_type")
-        query &= db.entities.type == entity_type
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        total, rows = await _list_entities_async(pool, pagination)
+        etag = weak_etag(
+            request.query_string,
+            total,
+            [(row["id"], row["updated_at"]) for row in rows],
+        )
+        if cached := not_modified(etag):
+            return cached
+        response = PaginatedResponse(
+            items=rows,
+            total=total,
+            page=pagination.page,
+            per_page=pagination.per_page,
+            pages=pagination.calculate_pages(total),
+        )
+        return with_etag(ApiResponse.orjson(response), etag)
 
-    if request.args.get("organization_id"):
-        organization_id = request.args.get("organization_id", type=int)
-        query &= db.entities.organization_id == organization_id
+    db = current_app.db_read
 
-    if request.args.get("name"):
-        name = request.args.get("name")
-        query &= db.entities.name.ilike(f"%{name}%")
+    query = _entity_query(db, request.args)
 
     # Use asyncio TaskGroup for concurrent queries (Python 3.12)
     async with asyncio.TaskGroup() as tg:
@@ -73,6 +260,7 @@ async def list_entities():
         rows_task = tg.create_task(
             run_in_threadpool(
                 lambda: db(query).select(
+                    *(getattr(db.entities, name) for name in _ENTITY_FIELDS),
                     orderby=db.entities.name,
                     limitby=(
                         pagination.offset,
@@ -85,22 +273,28 @@ async def list_entities():
     total = count_task.result()
     rows = rows_task.result()
 
+    # Page identity: filters/paging from the query string plus the total and
+    # each row's (id, updated_at), so any change on the page busts the ETag
+    etag = weak_etag(
+        request.query_string, total, [(row.id, row.updated_at) for row in rows]
+    )
+    if cached := not_modified(etag):
+        return cached
+
     # Calculate total pages using helper
     pages = pagination.calculate_pages(total)
 
-    # Convert PyDAL rows to DTOs
-    items = from_pydal_rows(rows, EntityDTO)
-
-    # Create paginated response
+    # Create paginated response; rows go straight to orjson as dicts, the
+    # DTO layer is kept for single-object responses only
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=[row.as_dict() for row in rows],
         total=total,
         page=pagination.page,
         per_page=pagination.per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return with_etag(ApiResponse.orjson(response), etag)
 
 
 @bp.route("", methods=["POST"])
@@ -126,6 +320,20 @@ async def create_entity(body: CreateEntityRequest):
     if error:
         return error
 
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        record = await pool.fetchrow(
+            _SQL_INSERT_ENTITY,
+            body.name,
+            body.entity_type,
+            body.organization_id,
+            body.parent_id,
+            body.sub_type,
+            body.tags or [],
+            body.attributes,
+        )
+        return ApiResponse.created(asdict(EntityDTO(**dict(record))))
+
     # Create entity in database
     def create_in_db():
         now = datetime.now(timezone.utc)
@@ -164,17 +372,32 @@ async def get_entity(id: int):
 
     Returns:
         200: Entity details
+        304: Not modified (If-None-Match matched the entity's ETag)
         404: Entity not found
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_SQL_GET_ENTITY, id)
+        if record is None:
+            return ApiResponse.not_found("Entity", id)
+        etag = weak_etag("entity", record["id"], record["updated_at"])
+        if cached := not_modified(etag):
+            return cached
+        return with_etag(ApiResponse.orjson(EntityDTO(**dict(record))), etag)
+
+    db = current_app.db_read
 
     # Validate resource exists using helper
     row, error = await validate_resource_exists(db.entities, id, "Entity")
     if error:
         return error
 
+    etag = weak_etag("entity", row.id, row.updated_at)
+    if cached := not_modified(etag):
+        return cached
+
     entity_dto = from_pydal_row(row, EntityDTO)
-    return ApiResponse.success(asdict(entity_dto))
+    return with_etag(ApiResponse.orjson(entity_dto), etag)
 
 
 @bp.route("/<int:id>", methods=["PATCH", "PUT"])
@@ -194,13 +417,6 @@ async def update_entity(id: int, body: UpdateEntityRequest):
         400: Validation error
         404: Entity not found
     """
-    db = current_app.db
-
-    # Check if entity exists
-    existing, error = await validate_resource_exists(db.entities, id, "Entity")
-    if error:
-        return error
-
     # If organization is being changed, validate and get tenant
     org_tenant_id = None
     if body.organization_id is not None:
@@ -210,31 +426,32 @@ async def update_entity(id: int, body: UpdateEntityRequest):
         if error:
             return error
 
+    update_fields = _entity_update_fields(body)
+
+    # No existence pre-check: an UPDATE that matches no row is the 404
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        record = await pool.fetchrow(
+            _update_entity_sql(tuple(update_fields)), id, *update_fields.values()
+        )
+        if record is None:
+            return ApiResponse.not_found("Entity", id)
+        return ApiResponse.success(asdict(EntityDTO(**dict(record))))
+
+    db = current_app.db
+
     # Update entity
     def update_in_db():
-        update_fields = {}
-        if body.name is not None:
-            update_fields["name"] = body.name
-        if body.entity_type is not None:
-            update_fields["type"] = body.entity_type
-        if body.organization_id is not None:
-            update_fields["organization_id"] = body.organization_id
-        if body.parent_id is not None:
-            update_fields["parent_id"] = body.parent_id
-        if body.sub_type is not None:
-            update_fields["sub_type"] = body.sub_type
-        if body.attributes is not None:
-            update_fields["metadata"] = body.attributes
-        if body.tags is not None:
-            update_fields["tags"] = body.tags
-
         update_fields["updated_at"] = datetime.now(timezone.utc)
 
-        db(db.entities.id == id).update(**update_fields)
+        if not db(db.entities.id == id).update(**update_fields):
+            return None
         db.commit()
         return db.entities[id]
 
     row = await run_in_threadpool(update_in_db)
+    if row is None:
+        return ApiResponse.not_found("Entity", id)
 
     entity_dto = from_pydal_row(row, EntityDTO)
     return ApiResponse.success(asdict(entity_dto))
@@ -253,6 +470,17 @@ async def delete_entity(id: int):
         404: Entity not found
         400: Cannot delete entity with dependencies
     """
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        result = await pool.fetchrow(_SQL_DELETE_ENTITY, id)
+        if not result["found"]:
+            return ApiResponse.not_found("Entity", id)
+        if not result["deleted"]:
+            return ApiResponse.bad_request(
+                f"Cannot delete entity with {result['deps']} dependencies. Remove dependencies first."
+            )
+        return ApiResponse.no_content()
+
     db = current_app.db
 
     # Check if entity exists
@@ -311,15 +539,51 @@ async def get_entity_dependencies(id: int):
         200: Dependencies information
         404: Entity not found
     """
-    db = current_app.db
+    direction = request.args.get("direction", "all")
+
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None and direction in _SQL_ENTITY_DEPENDENCIES:
+        records = await pool.fetch(_SQL_ENTITY_DEPENDENCIES[direction], id)
+        if not records:
+            return ApiResponse.not_found("Entity", id)
+        result = {
+            "entity_id": records[0]["entity_id"],
+            "entity_name": records[0]["entity_name"],
+        }
+        if direction in ("outgoing", "all"):
+            result["depends_on"] = []
+        if direction in ("incoming", "all"):
+            result["depended_by"] = []
+        for r in records:
+            if r["dir"] == "out":
+                result["depends_on"].append(
+                    {
+                        "id": r["id"],
+                        "target_type": r["peer_type"],
+                        "target_id": r["peer_id"],
+                        "dependency_type": r["dependency_type"],
+                        "metadata": r["metadata"],
+                    }
+                )
+            elif r["dir"] == "in":
+                result["depended_by"].append(
+                    {
+                        "id": r["id"],
+                        "source_type": r["peer_type"],
+                        "source_id": r["peer_id"],
+                        "dependency_type": r["dependency_type"],
+                        "metadata": r["metadata"],
+                    }
+                )
+        return ApiResponse.orjson(result)
+
+    db = current_app.db_read
 
     # Check if entity exists
     entity, error = await validate_resource_exists(db.entities, id, "Entity")
     if error:
         return error
 
-    direction = request.args.get("direction", "all")
-
     def get_dependencies():
         result = {
             "entity_id": entity.id,
@@ -363,7 +627,7 @@ async def get_entity_dependencies(id: int):
         return result
 
     result = await run_in_threadpool(get_dependencies)
-    return ApiResponse.success(result)
+    return ApiResponse.orjson(result)
 
 
 @bp.route("/<int:id>/attributes", methods=["PATCH"])
@@ -379,29 +643,50 @@ async def update_entity_attributes(id: int):
 
     Returns:
         200: Updated entity
+        400: Body is not a JSON object
         404: Entity not found
     """
+    try:
+        data = orjson.loads(request.get_data(cache=False))
+    except orjson.JSONDecodeError:
+        data = None
+    if not isinstance(data, dict):
+        return ApiResponse.bad_request("Attributes must be a JSON object")
+
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        # Atomic merge: no read-modify-write window for concurrent patches
+        record = await pool.fetchrow(_SQL_PATCH_ENTITY_ATTRIBUTES, id, data)
+        if record is None:
+            return ApiResponse.not_found("Entity", id)
+        return ApiResponse.success(asdict(EntityDTO(**dict(record))))
+
     db = current_app.db
 
-    # Check if entity exists
-    existing, error = await validate_resource_exists(db.entities, id, "Entity")
+    # Existence check reads from the replica; the write below goes to primary
+    existing, error = await validate_resource_exists(
+        current_app.db_read.entities, id, "Entity"
+    )
     if error:
         return error
 
-    data = request.get_json()
-    if not isinstance(data, dict):
-        return ApiResponse.bad_request("Attributes must be a JSON object")
-
-    # Update attributes
+    # Update attributes (stored in the metadata column)
     def update_attributes():
-        current_attrs = existing.attributes or {}
+        # Merge onto the primary's copy; the replica row may lag behind
+        row = db.entities[id]
+        if row is None:
+            return None
+        current_attrs = dict(row.metadata or {})
         current_attrs.update(data)
+        now = datetime.now(timezone.utc)
 
-        db(db.entities.id == id).update(attributes=current_attrs)
+        db(db.entities.id == id).update(metadata=current_attrs, updated_at=now)
         db.commit()
-        return db.entities[id]
+        return {**row.as_dict(), "metadata": current_attrs, "updated_at": now}
 
-    row = await run_in_threadpool(update_attributes)
+    record = await run_in_threadpool(update_attributes)
+    if record is None:
+        # The replica still had the row, but it is gone from the primary
+        return ApiResponse.not_found("Entity", id)
 
-    entity_dto = from_pydal_row(row, EntityDTO)
-    return ApiResponse.success(asdict(entity_dto))
+    return ApiResponse.success(asdict(EntityDTO(**record)))
@@ -3,13 +3,23 @@
 # flake8: noqa: E501
 
 
+import asyncio
+import heapq
+import threading
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
 from typing import Dict
 
 import networkx as nx
+from cachetools import TTLCache
 from flask import Blueprint, current_app, jsonify, request
 
 from apps.api.auth.decorators import login_required
+from apps.api.utils.api_responses import ApiResponse
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.pydal_helpers import execute_sql, is_postgres
 
 bp = Blueprint("graph", __name__)
 
@@ -23,6 +33,126 @@ VALID_RESOURCE_TYPES = [
     "issue",
 ]
 
+# Hierarchical map edges: (child resource type, child field holding the
+# parent id, parent resource type, edge type)
+HIERARCHICAL_EDGES = (
+    ("organization", "parent_id", "organization", "parent_of"),
+    ("entity", "organization_id", "organization", "contains"),
+    ("entity", "parent_id", "entity", "parent_of"),
+    ("identity", "organization_id", "organization", "contains"),
+    ("project", "organization_id", "organization", "contains"),
+    ("milestone", "organization_id", "organization", "contains"),
+    ("issue", "organization_id", "organization", "contains"),
+)
+
+# vis.js (shape, color) node styles for the map, by resource type
+_RESOURCE_STYLES = {
+    "organization": ("box", "#3498db"),
+    "entity": ("circle", "#e74c3c"),
+    "identity": ("triangle", "#9b59b6"),
+    "project": ("square", "#27ae60"),
+    "milestone": ("star", "#f39c12"),
+    "issue": ("diamond", "#e67e22"),
+}
+
+# Map entity subtype overrides of the "entity" resource style
+_ENTITY_SUBTYPE_STYLES = {
+    "datacenter": ("box", "#2c3e50"),
+    "vpc": ("box", "#2980b9"),
+    "subnet": ("ellipse", "#1abc9c"),
+    "compute": ("circle", "#e74c3c"),
+    "network": ("diamond", "#f39c12"),
+    "storage": ("box", "#8e44ad"),
+    "security": ("hexagon", "#c0392b"),
+    "user": ("triangle", "#9b59b6"),
+}
+
+# Dependency graph node styles, by entity type
+_ENTITY_TYPE_STYLES = {
+    "datacenter": ("box", "#3498db"),
+    "vpc": ("box", "#2980b9"),
+    "subnet": ("ellipse", "#1abc9c"),
+    "compute": ("circle", "#e74c3c"),
+    "network": ("diamond", "#f39c12"),
+    "user": ("triangle", "#9b59b6"),
+    "security_issue": ("star", "#e67e22"),
+}
+
+_DEFAULT_NODE_STYLE = ("dot", "#95a5a6")
+
+# vis.js (color, dashes) edge styles, by dependency type
+_EDGE_STYLES = {
+    "depends_on": ("#34495e", False),  # solid
+    "related_to": ("#95a5a6", True),  # dashed
+    "part_of": ("#2ecc71", False),  # solid green
+}
+
+_DEFAULT_EDGE_STYLE = ("#7f8c8d", False)
+
+# Upper bound on entities returned by a centered (entity_id) graph request,
+# matching the map endpoint's default node limit
+MAX_SUBGRAPH_NODES = 500
+
+# Upper bound on cycles enumerated by analyze_graph; simple_cycles is
+# exponential in the worst case, so circular_dependencies saturates here
+MAX_CYCLES_COUNTED = 1000
+
+# Process-local cache for analyze_graph results and the find_path graph. Keys
+# include a change stamp of entities/dependencies, so any write made through
+# any process is picked up on the next request; the TTL only bounds memory.
+_graph_cache = TTLCache(maxsize=32, ttl=300)
+_graph_cache_lock = threading.RLock()
+_SQL_GRAPH_STAMP = (
+    "SELECT (SELECT count(*) FROM entities), (SELECT max(updated_at) FROM entities), "
+    "(SELECT count(*) FROM dependencies), (SELECT max(id) FROM dependencies), "
+    "(SELECT max(updated_at) FROM dependencies)"
+)
+
+# Organization subtree in one round-trip; UNION (not UNION ALL) stops the
+# walk if parent_id ever forms a cycle
+_SQL_ORG_TREE = (
+    "WITH RECURSIVE org_tree(id) AS ("
+    "SELECT id FROM organizations WHERE id = %s "
+    "UNION SELECT o.id FROM organizations o JOIN org_tree t ON o.parent_id = t.id"
+    ") SELECT id FROM org_tree"
+)
+
+# asyncpg statements for the get_map resource loads (current_app.db_async_read).
+# NULL parameters disable their filter. entities, milestones and issues have
+# no tenant_id column, so their tenant filter goes through the owning
+# organization.
+_SQL_MAP_RESOURCES = {
+    "entity": (
+        "SELECT id, name, type, organization_id, parent_id FROM entities "
+        "WHERE ($1::int IS NULL OR organization_id IN ("
+        "SELECT id FROM organizations WHERE tenant_id = $1)) "
+        "AND ($2::int[] IS NULL OR organization_id = ANY($2)) "
+        "AND ($3::text[] IS NULL OR type = ANY($3)) LIMIT $4"
+    ),
+    "identity": (
+        "SELECT id, display_name, username, type FROM identities "
+        "WHERE ($1::int IS NULL OR tenant_id = $1) LIMIT $2"
+    ),
+    # projects have no tenant_id; a tenant filter only requires an owning org
+    "project": (
+        "SELECT id, name, organization_id, status FROM projects "
+        "WHERE ($1::int IS NULL OR organization_id > 0) "
+        "AND ($2::int[] IS NULL OR organization_id = ANY($2)) LIMIT $3"
+    ),
+    "milestone": (
+        "SELECT id, title, organization_id, status FROM milestones "
+        "WHERE ($1::int IS NULL OR organization_id IN ("
+        "SELECT id FROM organizations WHERE tenant_id = $1)) "
+        "AND ($2::int[] IS NULL OR organization_id = ANY($2)) LIMIT $3"
+    ),
+    "issue": (
+        "SELECT id, title, issue_type, organization_id, status, priority FROM issues "
+        "WHERE ($1::int IS NULL OR organization_id IN ("
+        "SELECT id FROM organizations WHERE tenant_id = $1)) "
+        "AND ($2::int[] IS NULL OR organization_id = ANY($2)) LIMIT $3"
+    ),
+}
+
 
 @bp.route("", methods=["GET"])
 async def get_graph():
@@ -53,6 +183,16 @@ async def get_graph():
     include_metadata = request.args.get("include_metadata", "false").lower() == "true"
 
     def get_graph_data():
+        # Only the columns the nodes use; metadata is the heavy one
+        entity_fields = [
+            db.entities.id,
+            db.entities.name,
+            db.entities.type,
+            db.entities.organization_id,
+        ]
+        if include_metadata:
+            entity_fields.append(db.entities.metadata)
+
         # Build entity query
         query = db.entities.id > 0
 
@@ -68,10 +208,10 @@ async def get_graph():
             if not entity:
                 return None, "Entity not found", 404
 
-            entities = _get_entity_subgraph(db, entity, depth)
+            entities = _get_entity_subgraph(db, entity, depth, entity_fields)
         else:
             # Get all entities matching filters
-            entities = db(query).select()
+            entities = db(query).select(*entity_fields)
 
         # Get entity IDs for dependency filtering
         entity_ids = [e.id for e in entities]
@@ -98,40 +238,48 @@ async def get_graph():
             & (db.dependencies.source_id.belongs(entity_ids))
             & (db.dependencies.target_type == "entity")
             & (db.dependencies.target_id.belongs(entity_ids))
-        ).select()
+        ).select(
+            db.dependencies.id,
+            db.dependencies.source_id,
+            db.dependencies.target_id,
+            db.dependencies.dependency_type,
+        )
 
-        # Build vis.js compatible graph data
-        nodes = []
-        for entity in entities:
-            node = {
+        # Build vis.js compatible graph data, looking each style up once per
+        # distinct type rather than once per row
+        node_styles = {t: _get_node_style(t) for t in {e.type for e in entities}}
+        nodes = [
+            {
                 "id": entity.id,
                 "label": entity.name,
                 "type": entity.type,
                 "organization_id": entity.organization_id,
+                **(
+                    {"metadata": entity.metadata}
+                    if include_metadata and entity.metadata
+                    else {}
+                ),
+                "shape": node_styles[entity.type][0],
+                "color": node_styles[entity.type][1],
             }
+            for entity in entities
+        ]
 
-            if include_metadata and entity.metadata:
-                node["metadata"] = entity.metadata
-
-            # Add visual styling based on entity type
-            node["shape"], node["color"] = _get_node_style(entity.type)
-
-            nodes.append(node)
-
-        edges = []
-        for dep in dependencies:
-            edge = {
+        edge_styles = {
+            t: _get_edge_style(t) for t in {dep.dependency_type for dep in dependencies}
+        }
+        edges = [
+            {
                 "id": dep.id,
                 "from": dep.source_id,
                 "to": dep.target_id,
                 "type": dep.dependency_type,
                 "arrows": "to",
+                "color": edge_styles[dep.dependency_type][0],
+                "dashes": edge_styles[dep.dependency_type][1],
             }
-
-            # Add visual styling based on dependency type
-            edge["color"], edge["dashes"] = _get_edge_style(dep.dependency_type)
-
-            edges.append(edge)
+            for dep in dependencies
+        ]
 
         return (
             {
@@ -151,7 +299,7 @@ async def get_graph():
     if error:
         return jsonify({"error": error}), status
 
-    return jsonify(result), status
+    return ApiResponse.orjson(result, status)
 
 
 @bp.route("/analyze", methods=["GET"])
@@ -170,12 +318,15 @@ async def analyze_graph():
     org_id = request.args.get("organization_id", type=int)
 
     def analyze():
+        return _graph_cached(("analyze", org_id, _graph_stamp(db)), build_analysis)
+
+    def build_analysis():
         # Build query
         query = db.entities.id > 0
         if org_id:
             query &= db.entities.organization_id == org_id
 
-        entities = db(query).select()
+        entities = db(query).select(db.entities.id, db.entities.name, db.entities.type)
         entity_ids = [e.id for e in entities]
 
         # Early return if no entities found
@@ -204,22 +355,22 @@ async def analyze_graph():
             & (db.dependencies.source_id.belongs(entity_ids))
             & (db.dependencies.target_type == "entity")
             & (db.dependencies.target_id.belongs(entity_ids))
-        ).select()
+        ).select(db.dependencies.source_id, db.dependencies.target_id)
 
-        # Build NetworkX graph for analysis
-        G = nx.DiGraph()
+        # Unique (source, target) pairs: the DiGraph collapses parallel
+        # dependencies, and degrees are counted over the same pairs
+        edge_pairs = {(dep.source_id, dep.target_id) for dep in dependencies}
+        names = {entity.id: entity.name for entity in entities}
 
-        for entity in entities:
-            G.add_node(
-                entity.id,
-                **{
-                    "name": entity.name,
-                    "type": entity.type,
-                },
-            )
+        # Build NetworkX graph for the structural checks (DAG, cycles)
+        G = nx.DiGraph()
+        G.add_nodes_from(entity_ids)
+        G.add_edges_from(edge_pairs)
 
-        for dep in dependencies:
-            G.add_edge(dep.source_id, dep.target_id)
+        # Degrees counted straight off the edge list (C-level Counter loop)
+        # rather than through NetworkX degree views
+        out_degree = Counter(source for source, _ in edge_pairs)
+        in_degree = Counter(target for _, target in edge_pairs)
 
         # Calculate metrics
         analysis = {
@@ -238,32 +389,36 @@ async def analyze_graph():
 
         # Node centrality (most connected/important entities)
         if len(entities) > 0:
-            in_degree = dict(G.in_degree())
-            out_degree = dict(G.out_degree())
-
             # Top 10 most depended upon (high in-degree)
-            most_depended = sorted(in_degree.items(), key=lambda x: x[1], reverse=True)[
-                :10
-            ]
+            most_depended = heapq.nlargest(10, in_degree.items(), key=itemgetter(1))
             analysis["centrality"]["most_depended_upon"] = [
-                {"entity_id": eid, "name": G.nodes[eid]["name"], "in_degree": deg}
+                {"entity_id": eid, "name": names[eid], "in_degree": deg}
                 for eid, deg in most_depended
                 if deg > 0
             ]
 
             # Top 10 with most dependencies (high out-degree)
-            most_dependent = sorted(
-                out_degree.items(), key=lambda x: x[1], reverse=True
-            )[:10]
+            most_dependent = heapq.nlargest(10, out_degree.items(), key=itemgetter(1))
             analysis["centrality"]["most_dependent"] = [
-                {"entity_id": eid, "name": G.nodes[eid]["name"], "out_degree": deg}
+                {"entity_id": eid, "name": names[eid], "out_degree": deg}
                 for eid, deg in most_dependent
                 if deg > 0
             ]
 
-        # Detect cycles (circular dependencies)
+        # Detect cycles (circular dependencies). Every cycle lies inside one
+        # strongly connected component, so acyclic graphs skip enumeration and
+        # the rest enumerate only non-trivial components, up to a budget.
         try:
-            cycles = list(nx.simple_cycles(G))
+            cycles = []
+            if not analysis["graph_metrics"]["is_directed_acyclic"]:
+                for scc in nx.strongly_connected_components(G):
+                    node = next(iter(scc))
+                    if len(scc) == 1 and not G.has_edge(node, node):
+                        continue  # Single node without a self-loop
+                    budget = MAX_CYCLES_COUNTED - len(cycles)
+                    if budget <= 0:
+                        break
+                    cycles.extend(islice(nx.simple_cycles(G.subgraph(scc)), budget))
             analysis["issues"] = {
                 "circular_dependencies": len(cycles),
                 "cycles": cycles[:5] if cycles else [],  # Return first 5 cycles
@@ -272,13 +427,14 @@ async def analyze_graph():
             analysis["issues"] = {"circular_dependencies": 0, "cycles": []}
 
         # Find isolated entities (no dependencies)
-        isolated = [n for n in G.nodes() if G.degree(n) == 0]
-        analysis["issues"]["isolated_entities"] = len(isolated)
+        analysis["issues"]["isolated_entities"] = len(entities) - len(
+            out_degree.keys() | in_degree.keys()
+        )
 
         return analysis
 
     analysis = await run_in_threadpool(analyze)
-    return jsonify(analysis), 200
+    return ApiResponse.orjson(analysis)
 
 
 @bp.route("/path", methods=["GET"])
@@ -312,45 +468,23 @@ async def find_path():
         if not to_entity:
             return None, "Target entity not found", 404
 
-        # Build graph - only include entity dependencies
-        dependencies = db(
-            (db.dependencies.source_type == "entity")
-            & (db.dependencies.target_type == "entity")
-        ).select()
-        G = nx.DiGraph()
-
-        for dep in dependencies:
-            G.add_edge(dep.source_id, dep.target_id, dependency_id=dep.id)
-
-        # Find path
-        try:
-            path = nx.shortest_path(G, from_id, to_id)
-            path_length = len(path) - 1
-
-            # Get entities in path
-            entities_in_path = db(db.entities.id.belongs(path)).select()
-            entity_map = {e.id: e for e in entities_in_path}
-
-            path_details = [
-                {
-                    "id": eid,
-                    "name": entity_map[eid].name,
-                    "type": entity_map[eid].type,
-                }
-                for eid in path
-            ]
+        # Adjacency lists in both directions - only entity dependencies
+        def build_adjacency():
+            dependencies = db(
+                (db.dependencies.source_type == "entity")
+                & (db.dependencies.target_type == "entity")
+            ).select(db.dependencies.source_id, db.dependencies.target_id)
+            succ = defaultdict(list)
+            pred = defaultdict(list)
+            for dep in dependencies:
+                succ[dep.source_id].append(dep.target_id)
+                pred[dep.target_id].append(dep.source_id)
+            return dict(succ), dict(pred)
 
-            return (
-                {
-                    "path_exists": True,
-                    "path_length": path_length,
-                    "path": path_details,
-                },
-                None,
-                200,
-            )
+        succ, pred = _graph_cached(("path", _graph_stamp(db)), build_adjacency)
 
-        except nx.NetworkXNoPath:
+        path = _shortest_path(succ, pred, from_id, to_id)
+        if path is None:
             return (
                 {
                     "path_exists": False,
@@ -360,12 +494,37 @@ async def find_path():
                 200,
             )
 
+        # Get entities in path
+        entities_in_path = db(db.entities.id.belongs(path)).select(
+            db.entities.id, db.entities.name, db.entities.type
+        )
+        entity_map = {e.id: e for e in entities_in_path}
+
+        path_details = [
+            {
+                "id": eid,
+                "name": entity_map[eid].name,
+                "type": entity_map[eid].type,
+            }
+            for eid in path
+        ]
+
+        return (
+            {
+                "path_exists": True,
+                "path_length": len(path) - 1,
+                "path": path_details,
+            },
+            None,
+            200,
+        )
+
     result, error, status = await run_in_threadpool(find_path_impl)
 
     if error:
         return jsonify({"error": error}), status
 
-    return jsonify(result), status
+    return ApiResponse.orjson(result, status)
 
 
 @bp.route("/map", methods=["GET"])
@@ -413,10 +572,160 @@ async def get_map():
         else []
     )
 
+    def load_orgs():
+        org_query = db.organizations.id > 0
+        org_tree = set()
+        if tenant_id:
+            org_query &= db.organizations.tenant_id == tenant_id
+        if org_id:
+            # Get this org and all children recursively
+            org_tree = _get_org_tree(db, org_id)
+            if org_tree:
+                org_query &= db.organizations.id.belongs(list(org_tree))
+        return org_tree, db(org_query).select(
+            db.organizations.id,
+            db.organizations.name,
+            db.organizations.organization_type,
+            db.organizations.parent_id,
+            limitby=(0, limit),
+        )
+
+    # Organizations first: the other resource filters depend on their ids
+    org_ids_to_include = set()
+    orgs = []
+    if "organization" in resource_types:
+        org_ids_to_include, orgs = await run_in_threadpool(load_orgs)
+        org_ids_to_include.update(org.id for org in orgs)
+    org_id_list = list(org_ids_to_include)
+    # Organizations fill the node budget first; later loads only fetch what
+    # is left of it and are skipped once it is spent
+    remaining = limit - len(orgs)
+
+    def load_entities():
+        entity_query = db.entities.id > 0
+        if tenant_id:
+            entity_query &= db.entities.tenant_id == tenant_id
+        if org_id_list:
+            entity_query &= db.entities.organization_id.belongs(org_id_list)
+        elif org_id:
+            entity_query &= db.entities.organization_id == org_id
+        if entity_types:
+            entity_query &= db.entities.type.belongs(entity_types)
+        return db(entity_query).select(
+            db.entities.id,
+            db.entities.name,
+            db.entities.type,
+            db.entities.organization_id,
+            db.entities.parent_id,
+            limitby=(0, remaining),
+        )
+
+    def load_identities():
+        identity_query = db.identities.id > 0
+        if tenant_id:
+            identity_query &= db.identities.tenant_id == tenant_id
+        return db(identity_query).select(
+            db.identities.id,
+            db.identities.display_name,
+            db.identities.username,
+            db.identities.type,
+            limitby=(0, remaining),
+        )
+
+    def load_projects():
+        project_query = db.projects.id > 0
+        if tenant_id:
+            project_query &= (
+                db.projects.organization_id > 0
+            )  # tenant_id not in projects
+        if org_id_list:
+            project_query &= db.projects.organization_id.belongs(org_id_list)
+        return db(project_query).select(
+            db.projects.id,
+            db.projects.name,
+            db.projects.organization_id,
+            db.projects.status,
+            limitby=(0, remaining),
+        )
+
+    def load_milestones():
+        milestone_query = db.milestones.id > 0
+        if tenant_id:
+            milestone_query &= db.milestones.tenant_id == tenant_id
+        if org_id_list:
+            milestone_query &= db.milestones.organization_id.belongs(org_id_list)
+        return db(milestone_query).select(
+            db.milestones.id,
+            db.milestones.title,
+            db.milestones.organization_id,
+            db.milestones.status,
+            limitby=(0, remaining),
+        )
+
+    def load_issues():
+        issue_query = db.issues.id > 0
+        if tenant_id:
+            issue_query &= db.issues.tenant_id == tenant_id
+        if org_id_list:
+            issue_query &= db.issues.organization_id.belongs(org_id_list)
+        return db(issue_query).select(
+            db.issues.id,
+            db.issues.title,
+            db.issues.issue_type,
+            db.issues.organization_id,
+            db.issues.status,
+            db.issues.priority,
+            limitby=(0, remaining),
+        )
+
+    # The remaining selects are independent; run them concurrently
+    loaders = {
+        resource_type: loader
+        for resource_type, loader in (
+            ("entity", load_entities),
+            ("identity", load_identities),
+            ("project", load_projects),
+            ("milestone", load_milestones),
+            ("issue", load_issues),
+        )
+        if resource_type in resource_types and remaining > 0
+    }
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        # Each asyncpg fetch checks out its own connection, so the loads run
+        # concurrently on the database instead of on executor threads
+        scoped_org_ids = org_id_list or None
+        map_args = {
+            "entity": (
+                tenant_id,
+                scoped_org_ids or ([org_id] if org_id else None),
+                entity_types or None,
+                remaining,
+            ),
+            "identity": (tenant_id, remaining),
+            "project": (tenant_id, scoped_org_ids, remaining),
+            "milestone": (tenant_id, scoped_org_ids, remaining),
+            "issue": (tenant_id, scoped_org_ids, remaining),
+        }
+        fetches = {
+            resource_type: pool.fetch(
+                _SQL_MAP_RESOURCES[resource_type], *map_args[resource_type]
+            )
+            for resource_type in loaders
+        }
+    else:
+        fetches = {
+            resource_type: run_in_threadpool(loader)
+            for resource_type, loader in loaders.items()
+        }
+    loaded = await asyncio.gather(*fetches.values())
+    rows = dict(zip(fetches, loaded))
+
     def get_map_data():
         nodes = []
         edges = []
-        node_ids = set()  # Track unique node IDs as "type:id"
+        node_ids = set()  # Track unique nodes as (resource_type, resource_id)
+        nodes_by_type = defaultdict(list)
 
         # Helper to add a node
         def add_node(
@@ -426,15 +735,15 @@ async def get_map():
             subtype: str = None,
             extra: dict = None,
         ):
-            node_key = f"{resource_type}:{resource_id}"
-            if node_key in node_ids:
+            key = (resource_type, resource_id)
+            if key in node_ids:
                 return
             if len(nodes) >= limit:
                 return
-            node_ids.add(node_key)
+            node_ids.add(key)
 
             node = {
-                "id": node_key,
+                "id": f"{resource_type}:{resource_id}",
                 "label": label,
                 "resource_type": resource_type,
                 "resource_id": resource_id,
@@ -446,272 +755,126 @@ async def get_map():
             if extra:
                 node.update(extra)
             nodes.append(node)
+            nodes_by_type[resource_type].append(node)
+
+        # Nodes are added in resource-type order, so truncation at limit
+        # drops the same resources the sequential queries used to
+        for org in orgs:
+            add_node(
+                "organization",
+                org.id,
+                org.name,
+                org.organization_type,
+                {
+                    "parent_id": org.parent_id,
+                    "organization_type": org.organization_type,
+                },
+            )
 
-        # Helper to add an edge
-        def add_edge(
-            from_type: str,
-            from_id: int,
-            to_type: str,
-            to_id: int,
-            edge_type: str,
-            is_hierarchical: bool = False,
-        ):
-            from_key = f"{from_type}:{from_id}"
-            to_key = f"{to_type}:{to_id}"
-            # Only add edge if both nodes exist
-            if from_key not in node_ids or to_key not in node_ids:
-                return
-            edge = {
-                "id": f"{from_key}->{to_key}",
-                "from": from_key,
-                "to": to_key,
-                "type": edge_type,
-                "arrows": "to",
-                "is_hierarchical": is_hierarchical,
-            }
-            edge["color"], edge["dashes"] = _get_edge_style(edge_type)
-            edges.append(edge)
-
-        # Get organizations that match filters
-        org_ids_to_include = set()
-        if "organization" in resource_types:
-            org_query = db.organizations.id > 0
-            if tenant_id:
-                org_query &= db.organizations.tenant_id == tenant_id
-            if org_id:
-                # Get this org and all children recursively
-                org_ids_to_include = _get_org_tree(db, org_id)
-                if org_ids_to_include:
-                    org_query &= db.organizations.id.belongs(list(org_ids_to_include))
-
-            orgs = db(org_query).select(limitby=(0, limit))
-            for org in orgs:
-                add_node(
-                    "organization",
-                    org.id,
-                    org.name,
-                    org.organization_type,
-                    {
-                        "parent_id": org.parent_id,
-                        "organization_type": org.organization_type,
-                    },
-                )
-                org_ids_to_include.add(org.id)
-
-        # Get entities
-        if "entity" in resource_types:
-            entity_query = db.entities.id > 0
-            if tenant_id:
-                entity_query &= db.entities.tenant_id == tenant_id
-            if org_ids_to_include:
-                entity_query &= db.entities.organization_id.belongs(
-                    list(org_ids_to_include)
-                )
-            elif org_id:
-                entity_query &= db.entities.organization_id == org_id
-            if entity_types:
-                entity_query &= db.entities.type.belongs(entity_types)
-
-            entities = db(entity_query).select(limitby=(0, limit))
-            for entity in entities:
-                add_node(
-                    "entity",
-                    entity.id,
-                    entity.name,
-                    entity.type,
-                    {
-                        "organization_id": entity.organization_id,
-                        "parent_id": entity.parent_id,
-                    },
-                )
-
-        # Get identities
-        if "identity" in resource_types:
-            identity_query = db.identities.id > 0
-            if tenant_id:
-                identity_query &= db.identities.tenant_id == tenant_id
-
-            identities = db(identity_query).select(limitby=(0, limit))
-            for identity in identities:
-                label = identity.display_name or identity.username
-                add_node(
-                    "identity",
-                    identity.id,
-                    label,
-                    identity.type,
-                    {},
-                )
-
-        # Get projects
-        if "project" in resource_types:
-            project_query = db.projects.id > 0
-            if tenant_id:
-                project_query &= (
-                    db.projects.organization_id > 0
-                )  # tenant_id not in projects
-            if org_ids_to_include:
-                project_query &= db.projects.organization_id.belongs(
-                    list(org_ids_to_include)
-                )
+        # Resource rows are read by key: they are asyncpg records on
+        # PostgreSQL and penguin-dal rows otherwise
+        for entity in rows.get("entity", []):
+            add_node(
+                "entity",
+                entity["id"],
+                entity["name"],
+                entity["type"],
+                {
+                    "organization_id": entity["organization_id"],
+                    "parent_id": entity["parent_id"],
+                },
+            )
 
-            projects = db(project_query).select(limitby=(0, limit))
-            for project in projects:
-                add_node(
-                    "project",
-                    project.id,
-                    project.name,
-                    "project",
-                    {
-                        "organization_id": project.organization_id,
-                        "status": project.status,
-                    },
-                )
+        for identity in rows.get("identity", []):
+            label = identity["display_name"] or identity["username"]
+            add_node(
+                "identity",
+                identity["id"],
+                label,
+                identity["type"],
+                {},
+            )
 
-        # Get milestones
-        if "milestone" in resource_types:
-            milestone_query = db.milestones.id > 0
-            if tenant_id:
-                milestone_query &= db.milestones.tenant_id == tenant_id
-            if org_ids_to_include:
-                milestone_query &= db.milestones.organization_id.belongs(
-                    list(org_ids_to_include)
-                )
+        for project in rows.get("project", []):
+            add_node(
+                "project",
+                project["id"],
+                project["name"],
+                "project",
+                {
+                    "organization_id": project["organization_id"],
+                    "status": project["status"],
+                },
+            )
 
-            milestones = db(milestone_query).select(limitby=(0, limit))
-            for milestone in milestones:
-                add_node(
-                    "milestone",
-                    milestone.id,
-                    milestone.title,
-                    "milestone",
-                    {
-                        "organization_id": milestone.organization_id,
-                        "status": milestone.status,
-                    },
-                )
+        for milestone in rows.get("milestone", []):
+            add_node(
+                "milestone",
+                milestone["id"],
+                milestone["title"],
+                "milestone",
+                {
+                    "organization_id": milestone["organization_id"],
+                    "status": milestone["status"],
+                },
+            )
 
-        # Get issues
-        if "issue" in resource_types:
-            issue_query = db.issues.id > 0
-            if tenant_id:
-                issue_query &= db.issues.tenant_id == tenant_id
-            if org_ids_to_include:
-                issue_query &= db.issues.organization_id.belongs(
-                    list(org_ids_to_include)
-                )
+        for issue in rows.get("issue", []):
+            add_node(
+                "issue",
+                issue["id"],
+                issue["title"],
+                issue["issue_type"],
+                {
+                    "organization_id": issue["organization_id"],
+                    "status": issue["status"],
+                    "priority": issue["priority"],
+                },
+            )
 
-            issues = db(issue_query).select(limitby=(0, limit))
-            for issue in issues:
-                add_node(
-                    "issue",
-                    issue.id,
-                    issue.title,
-                    issue.issue_type,
+        # Add hierarchical edges, one pass per relationship over the nodes of
+        # the child type; both endpoints must be on the map
+        if include_hierarchical:
+            for child_type, field, parent_type, edge_type in HIERARCHICAL_EDGES:
+                color, dashes = _get_edge_style(edge_type)
+                edges.extend(
                     {
-                        "organization_id": issue.organization_id,
-                        "status": issue.status,
-                        "priority": issue.priority,
-                    },
+                        "id": f"{parent_type}:{node[field]}->{node['id']}",
+                        "from": f"{parent_type}:{node[field]}",
+                        "to": node["id"],
+                        "type": edge_type,
+                        "arrows": "to",
+                        "is_hierarchical": True,
+                        "color": color,
+                        "dashes": dashes,
+                    }
+                    for node in nodes_by_type[child_type]
+                    if node.get(field) and (parent_type, node[field]) in node_ids
                 )
 
-        # Add hierarchical edges
-        if include_hierarchical:
-            for node in nodes:
-                resource_type = node["resource_type"]
-
-                # Organization parent relationships
-                if resource_type == "organization" and node.get("parent_id"):
-                    add_edge(
-                        "organization",
-                        node.get("parent_id"),
-                        "organization",
-                        node["resource_id"],
-                        "parent_of",
-                        True,
-                    )
-
-                # Entity to organization
-                if resource_type == "entity" and node.get("organization_id"):
-                    add_edge(
-                        "organization",
-                        node.get("organization_id"),
-                        "entity",
-                        node["resource_id"],
-                        "contains",
-                        True,
-                    )
-
-                # Entity parent relationships
-                if resource_type == "entity" and node.get("parent_id"):
-                    add_edge(
-                        "entity",
-                        node.get("parent_id"),
-                        "entity",
-                        node["resource_id"],
-                        "parent_of",
-                        True,
-                    )
-
-                # Identity to organization
-                if resource_type == "identity" and node.get("organization_id"):
-                    add_edge(
-                        "organization",
-                        node.get("organization_id"),
-                        "identity",
-                        node["resource_id"],
-                        "contains",
-                        True,
-                    )
-
-                # Project to organization
-                if resource_type == "project" and node.get("organization_id"):
-                    add_edge(
-                        "organization",
-                        node.get("organization_id"),
-                        "project",
-                        node["resource_id"],
-                        "contains",
-                        True,
-                    )
-
-                # Milestone to organization
-                if resource_type == "milestone" and node.get("organization_id"):
-                    add_edge(
-                        "organization",
-                        node.get("organization_id"),
-                        "milestone",
-                        node["resource_id"],
-                        "contains",
-                        True,
-                    )
-
-                # Issue to organization
-                if resource_type == "issue" and node.get("organization_id"):
-                    add_edge(
-                        "organization",
-                        node.get("organization_id"),
-                        "issue",
-                        node["resource_id"],
-                        "contains",
-                        True,
-                    )
-
-        # Add polymorphic dependency edges
-        if include_dependencies:
-            dep_query = db.dependencies.id > 0
-            if tenant_id:
-                dep_query &= db.dependencies.tenant_id == tenant_id
-
-            dependencies = db(dep_query).select()
-            for dep in dependencies:
-                add_edge(
-                    dep.source_type,
-                    dep.source_id,
-                    dep.target_type,
-                    dep.target_id,
-                    dep.dependency_type,
-                    False,
-                )
+        # Add polymorphic dependency edges whose endpoints are both on the map;
+        # the endpoint filter runs in SQL so unrelated edges never load
+        dependencies = (
+            _load_map_dependencies(db, node_ids, tenant_id)
+            if include_dependencies and node_ids
+            else []
+        )
+        edge_styles = {
+            t: _get_edge_style(t) for t in {dep.dependency_type for dep in dependencies}
+        }
+        edges.extend(
+            {
+                "id": f"{dep.source_type}:{dep.source_id}->{dep.target_type}:{dep.target_id}",
+                "from": f"{dep.source_type}:{dep.source_id}",
+                "to": f"{dep.target_type}:{dep.target_id}",
+                "type": dep.dependency_type,
+                "arrows": "to",
+                "is_hierarchical": False,
+                "color": edge_styles[dep.dependency_type][0],
+                "dashes": edge_styles[dep.dependency_type][1],
+            }
+            for dep in dependencies
+        )
 
         return {
             "nodes": nodes,
@@ -725,49 +888,97 @@ async def get_map():
         }
 
     result = await run_in_threadpool(get_map_data)
-    return jsonify(result), 200
+    return ApiResponse.orjson(result)
+
+
+def _graph_stamp(db) -> tuple:
+    """Return a cheap marker that changes whenever entities or dependencies do.
+
+    The statement is plain SQL, so it runs on every backend.
+    """
+    return execute_sql(db, _SQL_GRAPH_STAMP)[0]
+
+
+def _graph_cached(key: tuple, loader):
+    """Return _graph_cache[key], calling loader() to fill it on a miss."""
+    with _graph_cache_lock:
+        if key in _graph_cache:
+            return _graph_cache[key]
+    value = loader()
+    with _graph_cache_lock:
+        _graph_cache[key] = value
+    return value
+
+
+def _load_map_dependencies(db, node_ids: set, tenant_id: int = None):
+    """
+    Load dependencies whose source and target are both in node_ids.
+
+    Args:
+        db: PyDAL database instance
+        node_ids: Set of (resource_type, resource_id) tuples on the map
+        tenant_id: Optional tenant filter
+
+    Returns:
+        Dependency rows (type/id of both ends and dependency_type)
+    """
+    ids_by_type = defaultdict(list)
+    for resource_type, resource_id in node_ids:
+        ids_by_type[resource_type].append(resource_id)
+
+    source_query = target_query = None
+    for resource_type, ids in ids_by_type.items():
+        source = (db.dependencies.source_type == resource_type) & (
+            db.dependencies.source_id.belongs(ids)
+        )
+        target = (db.dependencies.target_type == resource_type) & (
+            db.dependencies.target_id.belongs(ids)
+        )
+        source_query = source if source_query is None else source_query | source
+        target_query = target if target_query is None else target_query | target
+
+    query = source_query & target_query
+    if tenant_id:
+        query &= db.dependencies.tenant_id == tenant_id
+
+    return db(query).select(
+        db.dependencies.source_type,
+        db.dependencies.source_id,
+        db.dependencies.target_type,
+        db.dependencies.target_id,
+        db.dependencies.dependency_type,
+    )
 
 
 def _get_org_tree(db, org_id: int) -> set:
     """Get organization and all its children recursively."""
+    if is_postgres(db):
+        rows = execute_sql(db, _SQL_ORG_TREE, (org_id,))
+        return {row[0] for row in rows} | {org_id}
+
+    # One query per tree level; visited guards against parent_id cycles
     org_ids = {org_id}
-    children = db(db.organizations.parent_id == org_id).select()
-    for child in children:
-        org_ids.update(_get_org_tree(db, child.id))
+    frontier = [org_id]
+    while frontier:
+        children = db(db.organizations.parent_id.belongs(frontier)).select(
+            db.organizations.id
+        )
+        frontier = [child.id for child in children if child.id not in org_ids]
+        org_ids.update(frontier)
     return org_ids
 
 
+@lru_cache(maxsize=256)
 def _get_node_style_by_resource(resource_type: str, subtype: str = None) -> tuple:
     """Get vis.js node styling based on resource type and subtype."""
-    # Resource type base styles
-    resource_styles = {
-        "organization": ("box", "#3498db"),
-        "entity": ("circle", "#e74c3c"),
-        "identity": ("triangle", "#9b59b6"),
-        "project": ("square", "#27ae60"),
-        "milestone": ("star", "#f39c12"),
-        "issue": ("diamond", "#e67e22"),
-    }
-
-    # Entity subtype overrides
-    entity_subtypes = {
-        "datacenter": ("box", "#2c3e50"),
-        "vpc": ("box", "#2980b9"),
-        "subnet": ("ellipse", "#1abc9c"),
-        "compute": ("circle", "#e74c3c"),
-        "network": ("diamond", "#f39c12"),
-        "storage": ("box", "#8e44ad"),
-        "security": ("hexagon", "#c0392b"),
-        "user": ("triangle", "#9b59b6"),
-    }
-
-    if resource_type == "entity" and subtype in entity_subtypes:
-        return entity_subtypes[subtype]
+    if resource_type == "entity" and subtype in _ENTITY_SUBTYPE_STYLES:
+        return _ENTITY_SUBTYPE_STYLES[subtype]
+    return _RESOURCE_STYLES.get(resource_type, _DEFAULT_NODE_STYLE)
 
-    return resource_styles.get(resource_type, ("dot", "#95a5a6"))
 
-
-def _get_entity_subgraph(db, entity, depth: int):
+def _get_entity_subgraph(
+    db, entity, depth: int, fields=(), max_nodes: int = MAX_SUBGRAPH_NODES
+):
     """
     Get entities within depth distance from given entity.
 
@@ -775,6 +986,8 @@ def _get_entity_subgraph(db, entity, depth: int):
         db: PyDAL database instance
         entity: Center entity (PyDAL row)
         depth: Maximum depth (-1 for unlimited)
+        fields: Entity columns to select for discovered entities (default: all)
+        max_nodes: Stop expanding once the subgraph holds this many entities
 
     Returns:
         List of entities in subgraph
@@ -783,47 +996,98 @@ def _get_entity_subgraph(db, entity, depth: int):
         depth = 9999
 
     visited = {entity.id}
-    current_level = [entity]
+    current_ids = [entity.id]
     all_entities = [entity]
 
+    # One dependency query (both directions) and one entity fetch per level
     for _ in range(depth):
-        if not current_level:
+        if not current_ids or len(all_entities) >= max_nodes:
             break
 
-        next_level = []
+        edges = db(
+            (db.dependencies.source_type == "entity")
+            & (db.dependencies.target_type == "entity")
+            & (
+                db.dependencies.source_id.belongs(current_ids)
+                | db.dependencies.target_id.belongs(current_ids)
+            )
+        ).select(db.dependencies.source_id, db.dependencies.target_id)
 
-        for e in current_level:
-            # Get outgoing dependencies (this entity depends on others)
-            outgoing = db(
-                (db.dependencies.source_type == "entity")
-                & (db.dependencies.source_id == e.id)
-            ).select()
-            for dep in outgoing:
-                if dep.target_id not in visited:
-                    visited.add(dep.target_id)
-                    target = db.entities[dep.target_id]
-                    if target:
-                        next_level.append(target)
-                        all_entities.append(target)
-
-            # Get incoming dependencies (others depend on this entity)
-            incoming = db(
-                (db.dependencies.target_type == "entity")
-                & (db.dependencies.target_id == e.id)
-            ).select()
-            for dep in incoming:
-                if dep.source_id not in visited:
-                    visited.add(dep.source_id)
-                    source = db.entities[dep.source_id]
-                    if source:
-                        next_level.append(source)
-                        all_entities.append(source)
-
-        current_level = next_level
+        # One end of every edge is on the frontier; the other is a neighbor
+        new_ids = {dep.source_id for dep in edges}
+        new_ids.update(dep.target_id for dep in edges)
+        new_ids -= visited
+        if not new_ids:
+            break
+        new_ids = sorted(new_ids)[: max_nodes - len(all_entities)]
+        visited.update(new_ids)
+
+        neighbors = db(db.entities.id.belongs(new_ids)).select(*fields)
+        all_entities.extend(neighbors)
+        current_ids = [e.id for e in neighbors]
 
     return all_entities
 
 
+def _shortest_path(succ: dict, pred: dict, source: int, target: int):
+    """
+    Find a shortest directed path with a bidirectional breadth-first search.
+
+    Each step expands the smaller frontier, so the search meets in the middle
+    instead of exploring every node within the full path length of source.
+
+    Args:
+        succ: Node id -> list of successor ids
+        pred: Node id -> list of predecessor ids
+        source: Start node id
+        target: End node id
+
+    Returns:
+        List of node ids from source to target, or None if no path exists
+    """
+    if source == target:
+        return [source]
+
+    fwd_parent = {source: None}
+    bwd_parent = {target: None}
+    fwd_frontier = [source]
+    bwd_frontier = [target]
+
+    while fwd_frontier and bwd_frontier:
+        forward = len(fwd_frontier) <= len(bwd_frontier)
+        frontier, adjacency, seen, other = (
+            (fwd_frontier, succ, fwd_parent, bwd_parent)
+            if forward
+            else (bwd_frontier, pred, bwd_parent, fwd_parent)
+        )
+        next_frontier = []
+        for node in frontier:
+            for neighbor in adjacency.get(node, ()):
+                if neighbor in seen:
+                    continue
+                seen[neighbor] = node
+                if neighbor in other:
+                    # Stitch source -> meeting node -> target
+                    path = []
+                    step = neighbor
+                    while step is not None:
+                        path.append(step)
+                        step = fwd_parent[step]
+                    path.reverse()
+                    step = bwd_parent[neighbor]
+                    while step is not None:
+                        path.append(step)
+                        step = bwd_parent[step]
+                    return path
+                next_frontier.append(neighbor)
+        if forward:
+            fwd_frontier = next_frontier
+        else:
+            bwd_frontier = next_frontier
+
+    return None
+
+
 def _count_by_type(entities) -> Dict[str, int]:
     """Count entities by type."""
     counts = {}
@@ -833,25 +1097,13 @@ def _count_by_type(entities) -> Dict[str, int]:
     return counts
 
 
+@lru_cache(maxsize=256)
 def _get_node_style(entity_type: str) -> tuple:
     """Get vis.js node styling based on entity type."""
-    styles = {
-        "datacenter": ("box", "#3498db"),
-        "vpc": ("box", "#2980b9"),
-        "subnet": ("ellipse", "#1abc9c"),
-        "compute": ("circle", "#e74c3c"),
-        "network": ("diamond", "#f39c12"),
-        "user": ("triangle", "#9b59b6"),
-        "security_issue": ("star", "#e67e22"),
-    }
-    return styles.get(entity_type, ("dot", "#95a5a6"))
+    return _ENTITY_TYPE_STYLES.get(entity_type, _DEFAULT_NODE_STYLE)
 
 
+@lru_cache(maxsize=256)
 def _get_edge_style(dependency_type: str) -> tuple:
     """Get vis.js edge styling based on dependency type."""
-    styles = {
-        "depends_on": ("#34495e", False),  # solid
-        "related_to": ("#95a5a6", True),  # dashed
-        "part_of": ("#2ecc71", False),  # solid green
-    }
-    return styles.get(dependency_type, ("#7f8c8d", False))
+    return _EDGE_STYLES.get(dependency_type, _DEFAULT_EDGE_STYLE)
@@ -7,22 +7,196 @@ Enterprise feature for group ownership, access requests, and provider write-back
 
 
 import logging
+import threading
+import time
+from typing import Optional
 
-from flask import Blueprint, current_app, g, jsonify, request
+import orjson
+from cachetools import TTLCache
+from flask import Blueprint, Response, current_app, g, jsonify, request
+from penguin_libs.pydantic.flask_integration import ValidationErrorResponse
+from pydantic import ValidationError
 
-from apps.api.auth.decorators import login_required
+from apps.api.auth.jwt_handler import get_current_user
 from apps.api.licensing_fallback import license_required
 from apps.api.logging_config import log_error_and_respond
+from apps.api.models.pydantic import (
+    AddGroupMemberRequest,
+    ApproveOrDenyRequestRequest,
+    BulkApproveRequestsRequest,
+    CreateAccessRequestRequest,
+    UpdateGroupRequest,
+)
 from apps.api.services.group_membership import GroupMembershipService
+from apps.api.utils.api_responses import ApiResponse
+from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.http_cache import not_modified, weak_etag, with_etag
 
 logger = logging.getLogger(__name__)
 
 bp = Blueprint("group_membership", __name__)
 
+# Fixed error bodies, encoded once at import for the rejection paths.
+_ERR_AUTH_REQUIRED = orjson.dumps({"error": "Authentication required"})
+_ERR_GROUP_NOT_FOUND = orjson.dumps({"error": "Group not found"})
+_ERR_NOT_GROUP_MANAGER = orjson.dumps({"error": "Not authorized to update this group"})
+_ERR_NO_IDENTITY = orjson.dumps({"error": "Identity not found for current user"})
+_ERR_CANNOT_VIEW_REQUESTS = orjson.dumps({"error": "Not authorized to view requests"})
+_ERR_CANNOT_ADD_MEMBERS = orjson.dumps({"error": "Not authorized to add members"})
+_ERR_CANNOT_REMOVE_MEMBERS = orjson.dumps({"error": "Not authorized to remove members"})
 
-def get_service():
-    """Get GroupMembershipService instance."""
-    return GroupMembershipService(current_app.db)
+
+def _error_response(body: bytes, status_code: int) -> Response:
+    """Build an error response from a pre-encoded JSON body."""
+    return Response(body, status=status_code, mimetype="application/json")
+
+
+# Short-lived cache for polled group reads (dashboards, UI refresh). Entries
+# hold (etag, encoded payload) so repeat reads skip the database and the
+# serializer, and revalidations get a 304. Group, membership and request writes
+# in this process clear it; other worker processes converge within the TTL.
+_groups_cache = TTLCache(maxsize=512, ttl=30)
+_groups_cache_lock = threading.RLock()
+# Bumped on every invalidation; a fill only stores if it is unchanged
+_groups_cache_state = {"generation": 0, "invalidated_at": None}
+
+# Reads come from the replica, which may lag a write; fills this soon after an
+# invalidation are served but not stored
+_GROUPS_CACHE_SETTLE_SECONDS = 5
+
+
+async def _cached_group_payload(key, loader):
+    """Return (etag, orjson Fragment) for key, awaiting loader() on a miss.
+
+    A None payload (group not found) is returned but not cached. Neither is a
+    payload whose fill overlapped an invalidation or started within the
+    settle window after one, since it may predate the write.
+    """
+    with _groups_cache_lock:
+        entry = _groups_cache.get(key)
+        generation = _groups_cache_state["generation"]
+    if entry is None:
+        payload = await loader()
+        if payload is None:
+            return None, None
+        # Encode once per fill; hits splice the bytes without re-serializing
+        raw = orjson.dumps(payload, option=orjson.OPT_NAIVE_UTC)
+        entry = (weak_etag(key, raw), orjson.Fragment(raw))
+        with _groups_cache_lock:
+            invalidated_at = _groups_cache_state["invalidated_at"]
+            if _groups_cache_state["generation"] == generation and (
+                invalidated_at is None
+                or time.monotonic() - invalidated_at >= _GROUPS_CACHE_SETTLE_SECONDS
+            ):
+                _groups_cache[key] = entry
+    return entry
+
+
+def _invalidate_group_caches() -> None:
+    """Drop cached group reads after any group, membership or request write."""
+    with _groups_cache_lock:
+        _groups_cache.clear()
+        _groups_cache_state["generation"] += 1
+        _groups_cache_state["invalidated_at"] = time.monotonic()
+
+
+def get_service(read_only=False):
+    """Get the app's GroupMembershipService instance.
+
+    GroupMembershipService holds no state beyond its DB handles, so one
+    instance per connection is kept in app.extensions instead of building one
+    per request.
+
+    Args:
+        read_only: If True, uses read replica connection for queries.
+    """
+    if read_only:
+        db = current_app.db_read
+        pool = getattr(current_app, "db_async_read", None)
+    else:
+        db = current_app.db
+        pool = getattr(current_app, "db_async", None)
+    services = current_app.extensions.setdefault("group_membership_services", {})
+    service = services.get(read_only)
+    if service is None or service.db is not db:
+        service = services[read_only] = GroupMembershipService(db, pool=pool)
+    return service
+
+
+def _parse_body(model):
+    """Decode and validate the JSON body in one pass; an empty body is {}.
+
+    Requests that carry no body (approve/deny without a comment) are
+    validated as {} without reading the input stream.
+    """
+    if not request.content_length and "Transfer-Encoding" not in request.headers:
+        return model.model_validate({})
+    return model.model_validate_json(request.get_data(cache=False) or b"{}")
+
+
+def _page_args(default_limit: int = 50) -> dict:
+    """Read offset or keyset pagination arguments from the query string.
+
+    Offset pages include the total by default as before; cursor pages skip
+    the COUNT unless include_total=true is passed.
+    """
+    cursor = request.args.get("cursor") or None
+    include_total = request.args.get("include_total", "false" if cursor else "true")
+    return {
+        "limit": request.args.get("limit", default_limit, type=int),
+        "offset": request.args.get("offset", 0, type=int),
+        "cursor": cursor,
+        "include_total": include_total.lower() == "true",
+    }
+
+
+def _can_manage_group(service, identity_id: Optional[int], group_id: int) -> bool:
+    """Check whether the current user may manage a group as admin or owner.
+
+    Admin status comes from the user object, so admins skip the ownership
+    lookup entirely. Users without an identity are not ownership-checked.
+    """
+    if g.is_admin or not identity_id:
+        return True
+    return _is_group_owner(service, identity_id, group_id)
+
+
+def _is_group_owner(service, identity_id: int, group_id: int) -> bool:
+    """Check group ownership at most once per (identity, group) per request."""
+    cache = g.setdefault("_group_owner_cache", {})
+    key = (identity_id, group_id)
+    if key not in cache:
+        cache[key] = service.is_group_owner(identity_id, group_id)
+    return cache[key]
+
+
+@bp.before_request
+def _require_enterprise_login():
+    """Authenticate and license-check every request once, before dispatch.
+
+    Every endpoint here needs both checks, so they run as one blueprint hook
+    instead of a login_required/license_required stack on each view. CORS
+    preflights carry no credentials and never reached the view decorators,
+    so they pass through to Flask's automatic OPTIONS response.
+    """
+    if request.method == "OPTIONS":
+        return None
+    return _check_enterprise_login()
+
+
+@license_required("enterprise")
+def _check_enterprise_login():
+    """Resolve the current user onto g, or reject the request.
+
+    The user's identity_id and is_admin are resolved here once (not every
+    user object carries them) so views read plain attributes off g.
+    """
+    user = get_current_user()
+    if not user:
+        return _error_response(_ERR_AUTH_REQUIRED, 401)
+    g.current_user = user
+    g.identity_id = getattr(user, "identity_id", None)
+    g.is_admin = getattr(user, "is_admin", False)
 
 
 # ===========================
@@ -31,9 +205,7 @@ def get_service():
 
 
 @bp.route("/groups", methods=["GET"])
-@login_required
-@license_required("enterprise")
-def list_groups():
+async def list_groups():
     """
     List all groups with ownership and member info.
 
@@ -42,58 +214,68 @@ def list_groups():
         - include_pending: Include pending request counts (default: false)
         - limit: Results per page (default: 50)
         - offset: Pagination offset
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces offset)
+        - include_total: Include the total count (default: true without cursor)
 
     Returns:
         200: List of groups
+        400: Invalid cursor
     """
     try:
-        service = get_service()
+        service = get_service(read_only=True)
 
         include_members = request.args.get("include_members", "false").lower() == "true"
         include_pending = request.args.get("include_pending", "false").lower() == "true"
-        limit = request.args.get("limit", 50, type=int)
-        offset = request.args.get("offset", 0, type=int)
-
-        result = service.list_groups(
-            include_members=include_members,
-            include_pending=include_pending,
-            limit=limit,
-            offset=offset,
+        page = _page_args()
+
+        etag, result = await _cached_group_payload(
+            ("groups", include_members, include_pending, *page.values()),
+            lambda: service.list_groups(
+                include_members=include_members,
+                include_pending=include_pending,
+                **page,
+            ),
         )
+        if cached := not_modified(etag):
+            return cached
 
-        return jsonify(result), 200
+        return with_etag(ApiResponse.orjson(result), etag)
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to list groups", 500)
 
 
 @bp.route("/groups/<int:group_id>", methods=["GET"])
-@login_required
-@license_required("enterprise")
-def get_group(group_id):
+async def get_group(group_id):
     """
     Get group details with ownership and member info.
 
     Returns:
         200: Group details
+        304: Not modified (If-None-Match matched the group's ETag)
         404: Group not found
     """
     try:
         service = get_service()
 
-        group = service.get_group(group_id)
+        etag, group = await _cached_group_payload(
+            ("group", group_id),
+            lambda: run_in_threadpool(service.get_group, group_id),
+        )
         if not group:
-            return jsonify({"error": "Group not found"}), 404
+            return _error_response(_ERR_GROUP_NOT_FOUND, 404)
+        if cached := not_modified(etag):
+            return cached
 
-        return jsonify(group), 200
+        return with_etag(ApiResponse.orjson(group), etag)
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to get group", 500)
 
 
 @bp.route("/groups/<int:group_id>", methods=["PATCH"])
-@login_required
-@license_required("enterprise")
 def update_group(group_id):
     """
     Update group ownership and settings.
@@ -111,6 +293,7 @@ def update_group(group_id):
 
     Returns:
         200: Updated group
+        400: Invalid request body
         403: Not authorized
         404: Group not found
     """
@@ -118,29 +301,31 @@ def update_group(group_id):
         service = get_service()
 
         # Check if user is owner or admin
-        current_user_id = getattr(g.current_user, "identity_id", None)
-        if current_user_id and not service.is_group_owner(current_user_id, group_id):
-            # Check if admin
-            if not getattr(g.current_user, "is_admin", False):
-                return jsonify({"error": "Not authorized to update this group"}), 403
+        current_user_id = g.identity_id
+        if not _can_manage_group(service, current_user_id, group_id):
+            return _error_response(_ERR_NOT_GROUP_MANAGER, 403)
 
-        data = request.get_json() or {}
+        try:
+            body = _parse_body(UpdateGroupRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         group = service.update_group(
             group_id=group_id,
-            owner_identity_id=data.get("owner_identity_id"),
-            owner_group_id=data.get("owner_group_id"),
-            approval_mode=data.get("approval_mode"),
-            approval_threshold=data.get("approval_threshold"),
-            provider=data.get("provider"),
-            provider_group_id=data.get("provider_group_id"),
-            sync_enabled=data.get("sync_enabled"),
+            owner_identity_id=body.owner_identity_id,
+            owner_group_id=body.owner_group_id,
+            approval_mode=body.approval_mode,
+            approval_threshold=body.approval_threshold,
+            provider=body.provider,
+            provider_group_id=body.provider_group_id,
+            sync_enabled=body.sync_enabled,
             updated_by=current_user_id,
         )
 
         if not group:
-            return jsonify({"error": "Group not found"}), 404
+            return _error_response(_ERR_GROUP_NOT_FOUND, 404)
 
+        _invalidate_group_caches()
         return jsonify(group), 200
 
     except Exception as e:
@@ -153,8 +338,6 @@ def update_group(group_id):
 
 
 @bp.route("/groups/<int:group_id>/requests", methods=["POST"])
-@login_required
-@license_required("enterprise")
 def create_access_request(group_id):
     """
     Create an access request for a group.
@@ -174,28 +357,23 @@ def create_access_request(group_id):
         service = get_service()
 
         # Get requester identity ID
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
-            return jsonify({"error": "Identity not found for current user"}), 400
-
-        data = request.get_json() or {}
+            return _error_response(_ERR_NO_IDENTITY, 400)
 
-        # Parse expires_at if provided
-        expires_at = None
-        if data.get("expires_at"):
-            from datetime import datetime
-
-            expires_at = datetime.fromisoformat(
-                data["expires_at"].replace("Z", "+00:00")
-            )
+        try:
+            body = _parse_body(CreateAccessRequestRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         result = service.create_access_request(
             group_id=group_id,
             requester_id=current_user_id,
-            reason=data.get("reason"),
-            expires_at=expires_at,
+            reason=body.reason,
+            expires_at=body.expires_at,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 201
 
     except ValueError as e:
@@ -205,9 +383,7 @@ def create_access_request(group_id):
 
 
 @bp.route("/groups/<int:group_id>/requests", methods=["GET"])
-@login_required
-@license_required("enterprise")
-def list_group_requests(group_id):
+async def list_group_requests(group_id):
     """
     List access requests for a group (owners only).
 
@@ -215,76 +391,77 @@ def list_group_requests(group_id):
         - status: Filter by status (pending, approved, denied)
         - limit: Results per page (default: 50)
         - offset: Pagination offset
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces offset)
+        - include_total: Include the total count (default: true without cursor)
 
     Returns:
         200: List of requests
+        400: Invalid cursor
         403: Not an owner
     """
     try:
-        service = get_service()
-
-        # Check if user is owner
-        current_user_id = getattr(g.current_user, "identity_id", None)
-        if current_user_id and not service.is_group_owner(current_user_id, group_id):
-            if not getattr(g.current_user, "is_admin", False):
-                return jsonify({"error": "Not authorized to view requests"}), 403
+        # Authorize against the primary; list from the replica
+        current_user_id = g.identity_id
+        if not await run_in_threadpool(
+            _can_manage_group, get_service(), current_user_id, group_id
+        ):
+            return _error_response(_ERR_CANNOT_VIEW_REQUESTS, 403)
 
         status = request.args.get("status")
-        limit = request.args.get("limit", 50, type=int)
-        offset = request.args.get("offset", 0, type=int)
+        page = _page_args()
 
-        result = service.list_requests(
+        result = await get_service(read_only=True).list_requests(
             group_id=group_id,
             status=status,
-            limit=limit,
-            offset=offset,
+            **page,
         )
 
-        return jsonify(result), 200
+        return ApiResponse.orjson(result)
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to list requests", 500)
 
 
 @bp.route("/requests/pending", methods=["GET"])
-@login_required
-@license_required("enterprise")
-def list_pending_requests():
+async def list_pending_requests():
     """
     List all pending requests for groups owned by current user.
 
     Query params:
         - limit: Results per page (default: 50)
         - offset: Pagination offset
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces offset)
+        - include_total: Include the total count (default: true without cursor)
 
     Returns:
         200: List of pending requests
+        400: Invalid cursor
     """
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
             return jsonify({"requests": [], "total": 0}), 200
 
-        limit = request.args.get("limit", 50, type=int)
-        offset = request.args.get("offset", 0, type=int)
+        page = _page_args()
 
-        result = service.get_pending_requests_for_owner(
+        result = await service.get_pending_requests_for_owner(
             owner_identity_id=current_user_id,
-            limit=limit,
-            offset=offset,
+            **page,
         )
 
-        return jsonify(result), 200
+        return ApiResponse.orjson(result)
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to list pending requests", 500)
 
 
 @bp.route("/requests/<int:request_id>/approve", methods=["POST"])
-@login_required
-@license_required("enterprise")
 def approve_request(request_id):
     """
     Approve an access request.
@@ -303,18 +480,22 @@ def approve_request(request_id):
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
-            return jsonify({"error": "Identity not found for current user"}), 400
+            return _error_response(_ERR_NO_IDENTITY, 400)
 
-        data = request.get_json() or {}
+        try:
+            body = _parse_body(ApproveOrDenyRequestRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         result = service.approve_request(
             request_id=request_id,
             approver_id=current_user_id,
-            comment=data.get("comment"),
+            comment=body.comment,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 200
 
     except ValueError as e:
@@ -329,8 +510,6 @@ def approve_request(request_id):
 
 
 @bp.route("/requests/<int:request_id>/deny", methods=["POST"])
-@login_required
-@license_required("enterprise")
 def deny_request(request_id):
     """
     Deny an access request.
@@ -349,18 +528,22 @@ def deny_request(request_id):
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
-            return jsonify({"error": "Identity not found for current user"}), 400
+            return _error_response(_ERR_NO_IDENTITY, 400)
 
-        data = request.get_json() or {}
+        try:
+            body = _parse_body(ApproveOrDenyRequestRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         result = service.deny_request(
             request_id=request_id,
             denier_id=current_user_id,
-            comment=data.get("comment"),
+            comment=body.comment,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 200
 
     except ValueError as e:
@@ -375,8 +558,6 @@ def deny_request(request_id):
 
 
 @bp.route("/requests/<int:request_id>", methods=["DELETE"])
-@login_required
-@license_required("enterprise")
 def cancel_request(request_id):
     """
     Cancel own access request.
@@ -389,15 +570,16 @@ def cancel_request(request_id):
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
-            return jsonify({"error": "Identity not found for current user"}), 400
+            return _error_response(_ERR_NO_IDENTITY, 400)
 
         result = service.cancel_request(
             request_id=request_id,
             canceller_id=current_user_id,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 200
 
     except ValueError as e:
@@ -410,8 +592,6 @@ def cancel_request(request_id):
 
 
 @bp.route("/requests/bulk-approve", methods=["POST"])
-@login_required
-@license_required("enterprise")
 def bulk_approve_requests():
     """
     Bulk approve multiple requests.
@@ -424,25 +604,28 @@ def bulk_approve_requests():
 
     Returns:
         200: Results of bulk operation
+        400: Invalid request body
     """
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
         if not current_user_id:
-            return jsonify({"error": "Identity not found for current user"}), 400
+            return _error_response(_ERR_NO_IDENTITY, 400)
 
-        data = request.get_json()
-        if not data or "request_ids" not in data:
-            return jsonify({"error": "request_ids is required"}), 400
+        try:
+            body = _parse_body(BulkApproveRequestsRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         result = service.bulk_approve_requests(
-            request_ids=data["request_ids"],
+            request_ids=body.request_ids,
             approver_id=current_user_id,
-            comment=data.get("comment"),
+            comment=body.comment,
         )
 
-        return jsonify(result), 200
+        _invalidate_group_caches()
+        return ApiResponse.orjson(result)
 
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to bulk approve", 500)
@@ -454,41 +637,40 @@ def bulk_approve_requests():
 
 
 @bp.route("/groups/<int:group_id>/members", methods=["GET"])
-@login_required
-@license_required("enterprise")
-def list_group_members(group_id):
+async def list_group_members(group_id):
     """
     List members of a group.
 
     Query params:
         - limit: Results per page (default: 100)
         - offset: Pagination offset
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces offset)
+        - include_total: Include the total count (default: true without cursor)
 
     Returns:
         200: List of members
+        400: Invalid cursor
         404: Group not found
     """
     try:
-        service = get_service()
+        service = get_service(read_only=True)
 
-        limit = request.args.get("limit", 100, type=int)
-        offset = request.args.get("offset", 0, type=int)
+        page = _page_args(100)
 
-        result = service.get_group_members(
+        result = await service.get_group_members(
             group_id=group_id,
-            limit=limit,
-            offset=offset,
+            **page,
         )
 
-        return jsonify(result), 200
+        return ApiResponse.orjson(result)
 
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
     except Exception as e:
         return log_error_and_respond(logger, e, "Failed to list members", 500)
 
 
 @bp.route("/groups/<int:group_id>/members", methods=["POST"])
-@login_required
-@license_required("enterprise")
 def add_group_member(group_id):
     """
     Directly add a member to a group (admin/owner only).
@@ -508,32 +690,24 @@ def add_group_member(group_id):
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
-        if current_user_id and not service.is_group_owner(current_user_id, group_id):
-            if not getattr(g.current_user, "is_admin", False):
-                return jsonify({"error": "Not authorized to add members"}), 403
+        current_user_id = g.identity_id
+        if not _can_manage_group(service, current_user_id, group_id):
+            return _error_response(_ERR_CANNOT_ADD_MEMBERS, 403)
 
-        data = request.get_json()
-        if not data or "identity_id" not in data:
-            return jsonify({"error": "identity_id is required"}), 400
-
-        # Parse expires_at if provided
-        expires_at = None
-        if data.get("expires_at"):
-            from datetime import datetime
-
-            expires_at = datetime.fromisoformat(
-                data["expires_at"].replace("Z", "+00:00")
-            )
+        try:
+            body = _parse_body(AddGroupMemberRequest)
+        except ValidationError as e:
+            return ValidationErrorResponse.from_pydantic_error(e)
 
         result = service.add_member(
             group_id=group_id,
-            identity_id=data["identity_id"],
+            identity_id=body.identity_id,
             added_by=current_user_id,
-            expires_at=expires_at,
-            provider_member_id=data.get("provider_member_id"),
+            expires_at=body.expires_at,
+            provider_member_id=body.provider_member_id,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 201
 
     except ValueError as e:
@@ -543,8 +717,6 @@ def add_group_member(group_id):
 
 
 @bp.route("/groups/<int:group_id>/members/<int:identity_id>", methods=["DELETE"])
-@login_required
-@license_required("enterprise")
 def remove_group_member(group_id, identity_id):
     """
     Remove a member from a group.
@@ -557,15 +729,17 @@ def remove_group_member(group_id, identity_id):
     try:
         service = get_service()
 
-        current_user_id = getattr(g.current_user, "identity_id", None)
+        current_user_id = g.identity_id
 
-        # Allow self-removal or owner/admin removal
+        # Allow self-removal or owner/admin removal; the ownership lookup
+        # only runs when neither of the cheaper checks passes
         is_self = current_user_id == identity_id
-        is_owner = current_user_id and service.is_group_owner(current_user_id, group_id)
-        is_admin = getattr(g.current_user, "is_admin", False)
-
-        if not (is_self or is_owner or is_admin):
-            return jsonify({"error": "Not authorized to remove members"}), 403
+        if not (
+            is_self
+            or g.is_admin
+            or (current_user_id and _is_group_owner(service, current_user_id, group_id))
+        ):
+            return _error_response(_ERR_CANNOT_REMOVE_MEMBERS, 403)
 
         result = service.remove_member(
             group_id=group_id,
@@ -573,6 +747,7 @@ def remove_group_member(group_id, identity_id):
             removed_by=current_user_id,
         )
 
+        _invalidate_group_caches()
         return jsonify(result), 200
 
     except ValueError as e:
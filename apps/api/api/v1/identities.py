@@ -3,51 +3,199 @@
 # flake8: noqa: E501
 
 
-import asyncio
-from dataclasses import asdict
 from datetime import datetime, timezone
 
 from flask import Blueprint, current_app, g, jsonify, request
 from penguin_libs.pydantic.flask_integration import validated_request
-from werkzeug.security import generate_password_hash
+from sqlalchemy.exc import IntegrityError
 
 from apps.api.auth import login_required, permission_required
 from apps.api.models.dataclasses import (
     IdentityDTO,
     PaginatedResponse,
-    from_pydal_row,
-    from_pydal_rows,
 )
 from apps.api.models.pydantic.identity import (
     CreateIdentityGroupRequest,
     CreateIdentityRequest,
+    GroupMembersRequest,
     IdentityGroupDTO,
     UpdateIdentityGroupRequest,
     UpdateIdentityRequest,
 )
+from apps.api.services.group_membership import invalidate_owner_cache
+from apps.api.utils.api_responses import ApiResponse
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.pydal_helpers import (
+    execute_sql,
+    is_postgres,
+    select_with_total,
+    update_returning,
+)
 
 bp = Blueprint("identities", __name__)
 
+# Add many memberships in one round-trip. Unknown identities and existing
+# members are filtered inside the INSERT; the result row reports whether the
+# group exists, which requested identities exist, and which were added.
+_SQL_ADD_GROUP_MEMBERS = (
+    "WITH grp AS (SELECT id FROM identity_groups WHERE id = %s), "
+    "known AS (SELECT id FROM identities WHERE id = ANY(%s)), "
+    "added AS ("
+    "INSERT INTO identity_group_memberships (group_id, identity_id) "
+    "SELECT grp.id, known.id FROM grp CROSS JOIN known "
+    "WHERE NOT EXISTS (SELECT 1 FROM identity_group_memberships m "
+    "WHERE m.group_id = grp.id AND m.identity_id = known.id) "
+    "RETURNING identity_id) "
+    "SELECT EXISTS (SELECT 1 FROM grp), ARRAY(SELECT id FROM known), "
+    "ARRAY(SELECT identity_id FROM added)"
+)
+
+
+def _add_group_members(db, group_id: int, identity_ids: list) -> tuple:
+    """
+    Add identities to a group, skipping unknown identities and existing members.
+
+    Blocking; call it inside run_in_threadpool.
+
+    Returns:
+        Tuple of (known identity ids, added identity ids), or None if the
+        group does not exist
+    """
+    identity_ids = list(dict.fromkeys(identity_ids))
+
+    if is_postgres(db):
+        group_exists, known, added = execute_sql(
+            db, _SQL_ADD_GROUP_MEMBERS, (group_id, identity_ids)
+        )[0]
+        if added:
+            invalidate_owner_cache()
+        return (known, added) if group_exists else None
+
+    if not db.identity_groups[group_id]:
+        return None
+
+    members = db.identity_group_memberships
+    known = [
+        row.id
+        for row in db(db.identities.id.belongs(identity_ids)).select(db.identities.id)
+    ]
+    existing = {
+        row.identity_id
+        for row in db(
+            (members.group_id == group_id) & (members.identity_id.belongs(known))
+        ).select(members.identity_id)
+    }
+    added = [identity_id for identity_id in known if identity_id not in existing]
+    if added:
+        members.bulk_insert([{"group_id": group_id, "identity_id": i} for i in added])
+        db.commit()
+        invalidate_owner_cache()
+    return known, added
+
+
+# Remove many memberships in one statement (and so one commit)
+_SQL_REMOVE_GROUP_MEMBERS = (
+    "DELETE FROM identity_group_memberships "
+    "WHERE group_id = %s AND identity_id = ANY(%s) RETURNING identity_id"
+)
+
+
+def _remove_group_members(db, group_id: int, identity_ids: list) -> list:
+    """
+    Remove identities from a group with a single DELETE.
+
+    Blocking; call it inside run_in_threadpool.
+
+    Returns:
+        IDs of the identities that were members and have been removed
+    """
+    identity_ids = list(dict.fromkeys(identity_ids))
+
+    if is_postgres(db):
+        removed = [
+            row[0]
+            for row in execute_sql(
+                db, _SQL_REMOVE_GROUP_MEMBERS, (group_id, identity_ids)
+            )
+        ]
+        if removed:
+            invalidate_owner_cache()
+        return list(dict.fromkeys(removed))
+
+    members = db.identity_group_memberships
+    query = (members.group_id == group_id) & (members.identity_id.belongs(identity_ids))
+    removed = {row.identity_id for row in db(query).select(members.identity_id)}
+    if removed:
+        db(query).delete()
+        db.commit()
+        invalidate_owner_cache()
+    return [identity_id for identity_id in identity_ids if identity_id in removed]
+
+
+# asyncpg statement for PostgreSQL (current_app.db_async_read); the columns
+# are the ones _identity_row_to_dict reads
+_SQL_GET_IDENTITY = (
+    "SELECT id, username, email, identity_type, tenant_id, auth_provider, "
+    "auth_provider_id, full_name, is_active, last_login_at, created_at, "
+    "updated_at FROM identities WHERE id = $1"
+)
+
+
+def _is_unique_violation(error: IntegrityError, index: str, column: str) -> bool:
+    """
+    Check whether an IntegrityError was raised by a specific unique index.
+
+    PostgreSQL reports the index name (SQLSTATE 23505); SQLite only names the
+    column, e.g. "UNIQUE constraint failed: identities.username".
+    """
+    diag = getattr(error.orig, "diag", None)
+    if diag is not None:
+        return (
+            getattr(error.orig, "pgcode", None) == "23505"
+            and diag.constraint_name == index
+        )
+    return f"UNIQUE constraint failed: {column}" in str(error.orig)
+
+
+def _identity_row_to_dict(row) -> dict:
+    """Map an identity row or record (DB column names) to the IdentityDTO JSON shape."""
+    return {
+        "id": row["id"],
+        "username": row["username"],
+        "email": row.get("email"),
+        "type": row.get("identity_type", "human"),
+        "created_at": row["created_at"],
+        "updated_at": row["updated_at"],
+        "tenant_id": row.get("tenant_id"),
+        "external_id": row.get("auth_provider_id"),
+        "provider": row.get("auth_provider"),
+        "name": row.get("full_name"),
+        "display_name": row.get("full_name"),
+        "avatar_url": None,
+        "is_active": row.get("is_active", True),
+        "is_service_account": False,
+        "metadata": None,
+        "last_seen_at": row.get("last_login_at"),
+    }
+
 
 def _identity_row_to_dto(row) -> IdentityDTO:
     """Map a PyDAL identity row (DB column names) to IdentityDTO (API field names)."""
-    d = row.as_dict()
-    return IdentityDTO(
-        id=d["id"],
-        username=d["username"],
-        email=d.get("email"),
-        type=d.get("identity_type", "human"),
-        tenant_id=d.get("tenant_id"),
-        provider=d.get("auth_provider"),
-        external_id=d.get("auth_provider_id"),
-        name=d.get("full_name"),
-        display_name=d.get("full_name"),
-        is_active=d.get("is_active", True),
-        last_seen_at=d.get("last_login_at"),
-        created_at=d["created_at"],
-        updated_at=d["updated_at"],
-    )
+    return IdentityDTO(**_identity_row_to_dict(row))
+
+
+# IdentityGroupDTO field names and defaults, resolved once at import. Group
+# rows are projected straight onto them; building and validating a DTO per
+# row only to encode it again would double the work on large pages.
+_IDENTITY_GROUP_FIELDS = tuple(
+    (name, None if field.is_required() else field.default)
+    for name, field in IdentityGroupDTO.model_fields.items()
+)
+
+
+def _group_row_to_dict(row) -> dict:
+    """Project a PyDAL identity group row onto the IdentityGroupDTO fields."""
+    return {name: row.get(name, default) for name, default in _IDENTITY_GROUP_FIELDS}
 
 
 @bp.route("", methods=["GET"])
@@ -73,49 +221,51 @@ async def list_identities():
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
 
-    # Build query
-    query = db.identities.id > 0
+    # Build query; bind the table proxy once (each db.<table> builds a new one)
+    identities = db.identities
+    query = identities.id > 0
 
     # Apply filters
     # Search filter — DB columns: username, email, full_name
     search = request.args.get("search") or request.args.get("name")
     if search:
-        search_pattern = f"%{search}%"
+        # lower(col) LIKE matches the identities_*_trgm_idx GIN expressions
+        search_pattern = f"%{search.lower()}%"
         query &= (
-            (db.identities.username.ilike(search_pattern))
-            | (db.identities.email.ilike(search_pattern))
-            | (db.identities.full_name.ilike(search_pattern))
+            (identities.username.lower().like(search_pattern))
+            | (identities.email.lower().like(search_pattern))
+            | (identities.full_name.lower().like(search_pattern))
         )
 
     identity_type = request.args.get("identity_type")
     if identity_type:
-        query &= db.identities.identity_type == identity_type
+        query &= identities.identity_type == identity_type
 
     is_active = request.args.get("is_active")
     if is_active is not None:
-        query &= db.identities.is_active == (is_active.lower() == "true")
+        query &= identities.is_active == (is_active.lower() == "true")
 
     # Calculate pagination
     offset = (page - 1) * per_page
 
-    # Execute database queries in a single thread pool task to avoid cursor issues
+    # One query returns the page and the filtered total (COUNT(*) OVER ())
     def get_identities():
-        total = db(query).count()
         # Select actual DB columns (identity_type, full_name, auth_provider, auth_provider_id)
-        rows = db(query).select(
-            db.identities.id,
-            db.identities.identity_type,
-            db.identities.username,
-            db.identities.email,
-            db.identities.full_name,
-            db.identities.auth_provider,
-            db.identities.auth_provider_id,
-            db.identities.tenant_id,
-            db.identities.is_active,
-            db.identities.last_login_at,
-            db.identities.created_at,
-            db.identities.updated_at,
-            orderby=db.identities.username,
+        rows, total = select_with_total(
+            db(query),
+            identities.id,
+            identities.identity_type,
+            identities.username,
+            identities.email,
+            identities.full_name,
+            identities.auth_provider,
+            identities.auth_provider_id,
+            identities.tenant_id,
+            identities.is_active,
+            identities.last_login_at,
+            identities.created_at,
+            identities.updated_at,
+            orderby=identities.username,
             limitby=(offset, offset + per_page),
         )
         return total, rows
@@ -125,18 +275,18 @@ async def list_identities():
     # Calculate total pages
     pages = (total + per_page - 1) // per_page if total > 0 else 0
 
-    items = [_identity_row_to_dto(row) for row in rows]
+    items = [_identity_row_to_dict(row) for row in rows]
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return ApiResponse.stream_paginated(response)
 
 
 @bp.route("", methods=["POST"])
@@ -170,11 +320,6 @@ async def create_identity(body: CreateIdentityRequest):
 
     # Create identity
     def create():
-        # Check if username exists
-        existing = db(db.identities.username == body.username).select().first()
-        if existing:
-            return None, "Username already exists", 400
-
         # Prepare insert data — use actual DB column names
         insert_data = {
             "username": body.username,
@@ -186,11 +331,18 @@ async def create_identity(body: CreateIdentityRequest):
             "is_active": body.is_active,
         }
 
-        # Create identity
+        # Create identity; the unique username index rejects duplicates
         now = datetime.now(timezone.utc)
-        identity_id = db.identities.insert(
-            created_at=now, updated_at=now, **insert_data
-        )
+        try:
+            identity_id = db.identities.insert(
+                created_at=now, updated_at=now, **insert_data
+            )
+        except IntegrityError as e:
+            if not _is_unique_violation(
+                e, "ix_identities_username", "identities.username"
+            ):
+                raise
+            return None, "Username already exists", 400
         db.commit()
 
         return db.identities[identity_id], None, None
@@ -201,7 +353,7 @@ async def create_identity(body: CreateIdentityRequest):
         return jsonify({"error": error}), status
 
     identity_dto = _identity_row_to_dto(identity)
-    return jsonify(asdict(identity_dto)), 201
+    return ApiResponse.orjson(identity_dto, 201)
 
 
 @bp.route("/<int:id>", methods=["GET"])
@@ -218,7 +370,14 @@ async def get_identity(id: int):
         200: Identity details
         404: Identity not found
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_SQL_GET_IDENTITY, id)
+        if record is None:
+            return jsonify({"error": "Identity not found"}), 404
+        return ApiResponse.orjson(_identity_row_to_dict(record), 200)
+
+    db = current_app.db_read
 
     identity = await run_in_threadpool(lambda: db.identities[id])
 
@@ -226,7 +385,7 @@ async def get_identity(id: int):
         return jsonify({"error": "Identity not found"}), 404
 
     identity_dto = _identity_row_to_dto(identity)
-    return jsonify(asdict(identity_dto)), 200
+    return ApiResponse.orjson(identity_dto, 200)
 
 
 @bp.route("/<int:id>", methods=["PATCH", "PUT"])
@@ -258,12 +417,7 @@ async def update_identity(id: int, body: UpdateIdentityRequest):
     """
     db = current_app.db
 
-    # Check if identity exists
-    existing = await run_in_threadpool(lambda: db.identities[id])
-    if not existing:
-        return jsonify({"error": "Identity not found"}), 404
-
-    # Update identity
+    # Update identity; the row comes back with the write (RETURNING)
     def update():
         update_fields = {}
 
@@ -277,14 +431,14 @@ async def update_identity(id: int, body: UpdateIdentityRequest):
         if body.is_active is not None:
             update_fields["is_active"] = body.is_active
 
-        db(db.identities.id == id).update(**update_fields)
-        db.commit()
-        return db.identities[id]
+        return update_returning(db, "identities", id, update_fields)
 
     identity = await run_in_threadpool(update)
+    if not identity:
+        return jsonify({"error": "Identity not found"}), 404
 
     identity_dto = _identity_row_to_dto(identity)
-    return jsonify(asdict(identity_dto)), 200
+    return ApiResponse.orjson(identity_dto, 200)
 
 
 @bp.route("/<int:id>", methods=["DELETE"])
@@ -304,19 +458,18 @@ async def delete_identity(id: int):
     """
     db = current_app.db
 
-    # Check if identity exists
+    # Delete in one statement; the affected-row count is the existence check
     def check_and_delete():
-        identity = db.identities[id]
-        if not identity:
-            return None, "Identity not found", 404
-
         # Prevent deleting own account
-        if identity.id == g.current_user.id:
+        if id == g.current_user.id:
+            if not db.identities[id]:
+                return None, "Identity not found", 404
             return None, "Cannot delete your own account", 400
 
-        # Delete identity
-        db(db.identities.id == id).delete()
+        if not db(db.identities.id == id).delete():
+            return None, "Identity not found", 404
         db.commit()
+        invalidate_owner_cache()
         return True, None, None
 
     result, error, status = await run_in_threadpool(check_and_delete)
@@ -356,36 +509,30 @@ async def list_groups():
     # Calculate pagination
     offset = (page - 1) * per_page
 
-    # Use asyncio TaskGroup for concurrent queries (Python 3.12)
-    async with asyncio.TaskGroup() as tg:
-        count_task = tg.create_task(run_in_threadpool(lambda: db(query).count()))
-        rows_task = tg.create_task(
-            run_in_threadpool(
-                lambda: db(query).select(
-                    orderby=db.identity_groups.name, limitby=(offset, offset + per_page)
-                )
-            )
-        )
-
-    total = count_task.result()
-    rows = rows_task.result()
+    # One query returns the page and the filtered total (COUNT(*) OVER ())
+    rows, total = await run_in_threadpool(
+        select_with_total,
+        db(query),
+        *db.identity_groups.table.columns,
+        orderby=db.identity_groups.name,
+        limitby=(offset, offset + per_page),
+    )
 
     # Calculate total pages
     pages = (total + per_page - 1) // per_page if total > 0 else 0
 
-    # Convert PyDAL rows to DTOs
-    items = from_pydal_rows(rows, IdentityGroupDTO)
+    items = [_group_row_to_dict(row) for row in rows]
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return ApiResponse.stream_paginated(response)
 
 
 @bp.route("/groups", methods=["POST"])
@@ -412,17 +559,19 @@ async def create_group(body: CreateIdentityGroupRequest):
 
     # Create group
     def create():
-        # Check if group name exists
-        existing = db(db.identity_groups.name == body.name).select().first()
-        if existing:
+        # Create group; the unique name index rejects duplicates
+        try:
+            group_id = db.identity_groups.insert(
+                name=body.name,
+                description=body.description,
+                is_active=body.is_active,
+            )
+        except IntegrityError as e:
+            if not _is_unique_violation(
+                e, "ix_identity_groups_name", "identity_groups.name"
+            ):
+                raise
             return None, "Group name already exists", 400
-
-        # Create group
-        group_id = db.identity_groups.insert(
-            name=body.name,
-            description=body.description,
-            is_active=body.is_active,
-        )
         db.commit()
 
         return db.identity_groups[group_id], None, None
@@ -432,8 +581,7 @@ async def create_group(body: CreateIdentityGroupRequest):
     if error:
         return jsonify({"error": error}), status
 
-    group_dto = from_pydal_row(group, IdentityGroupDTO)
-    return jsonify(asdict(group_dto)), 201
+    return ApiResponse.orjson(_group_row_to_dict(group), 201)
 
 
 @bp.route("/groups/<int:id>", methods=["GET"])
@@ -448,8 +596,7 @@ async def get_group(id: int):
     if not group:
         return jsonify({"error": "Group not found"}), 404
 
-    group_dto = from_pydal_row(group, IdentityGroupDTO)
-    return jsonify(asdict(group_dto)), 200
+    return ApiResponse.orjson(_group_row_to_dict(group), 200)
 
 
 @bp.route("/groups/<int:id>", methods=["PATCH", "PUT"])
@@ -478,12 +625,7 @@ async def update_group(id: int, body: UpdateIdentityGroupRequest):
     """
     db = current_app.db
 
-    # Check if group exists
-    existing = await run_in_threadpool(lambda: db.identity_groups[id])
-    if not existing:
-        return jsonify({"error": "Group not found"}), 404
-
-    # Update group
+    # Update group; the row comes back with the write (RETURNING)
     def update():
         update_fields = {}
 
@@ -498,14 +640,13 @@ async def update_group(id: int, body: UpdateIdentityGroupRequest):
         if body.is_active is not None:
             update_fields["is_active"] = body.is_active
 
-        db(db.identity_groups.id == id).update(**update_fields)
-        db.commit()
-        return db.identity_groups[id]
+        return update_returning(db, "identity_groups", id, update_fields)
 
     group = await run_in_threadpool(update)
+    if not group:
+        return jsonify({"error": "Group not found"}), 404
 
-    group_dto = from_pydal_row(group, IdentityGroupDTO)
-    return jsonify(asdict(group_dto)), 200
+    return ApiResponse.orjson(_group_row_to_dict(group), 200)
 
 
 @bp.route("/groups/<int:id>", methods=["DELETE"])
@@ -515,15 +656,16 @@ async def delete_group(id: int):
     """Delete identity group."""
     db = current_app.db
 
-    # Check if group exists
-    existing = await run_in_threadpool(lambda: db.identity_groups[id])
-    if not existing:
-        return jsonify({"error": "Group not found"}), 404
+    # Delete in one statement; no affected row means the group is unknown
+    def delete():
+        deleted = db(db.identity_groups.id == id).delete()
+        db.commit()
+        # Memberships and ownership go with the group
+        invalidate_owner_cache()
+        return deleted
 
-    # Delete group
-    await run_in_threadpool(
-        lambda: (db(db.identity_groups.id == id).delete(), db.commit())
-    )
+    if not await run_in_threadpool(delete):
+        return jsonify({"error": "Group not found"}), 404
 
     return "", 204
 
@@ -545,46 +687,101 @@ async def add_group_member(group_id: int, identity_id: int):
     """
     db = current_app.db
 
-    # Check and add membership
-    def add_member():
-        # Verify group exists
-        group = db.identity_groups[group_id]
-        if not group:
-            return None, "Group not found", 404
+    result = await run_in_threadpool(_add_group_members, db, group_id, [identity_id])
 
-        # Verify identity exists
-        identity = db.identities[identity_id]
-        if not identity:
-            return None, "Identity not found", 404
-
-        # Check if already a member
-        existing = (
-            db(
-                (db.identity_group_members.group_id == group_id)
-                & (db.identity_group_members.identity_id == identity_id)
-            )
-            .select()
-            .first()
+    if result is None:
+        return jsonify({"error": "Group not found"}), 404
+    known, added = result
+    if not known:
+        return jsonify({"error": "Identity not found"}), 404
+    if not added:
+        return (
+            jsonify({"error": "Identity is already a member of this group"}),
+            400,
         )
 
-        if existing:
-            return None, "Identity is already a member of this group", 400
+    return jsonify({"message": "Member added successfully"}), 200
 
-        # Add membership
-        db.identity_group_members.insert(
-            group_id=group_id,
-            identity_id=identity_id,
-        )
-        db.commit()
 
-        return True, None, None
+@bp.route("/groups/<int:group_id>/members", methods=["POST"])
+@login_required
+@permission_required("manage_users")
+@validated_request(body_model=GroupMembersRequest)
+async def add_group_members(group_id: int, body: GroupMembersRequest):
+    """
+    Add several identities to a group in one request.
 
-    result, error, status = await run_in_threadpool(add_member)
+    Path Parameters:
+        - group_id: Group ID
 
-    if error:
-        return jsonify({"error": error}), status
+    Request Body:
+        {
+            "identity_ids": [1, 2, 3]
+        }
 
-    return jsonify({"message": "Member added successfully"}), 200
+    Returns:
+        200: Added, already-member and unknown identity IDs
+        404: Group not found
+    """
+    db = current_app.db
+
+    result = await run_in_threadpool(
+        _add_group_members, db, group_id, body.identity_ids
+    )
+
+    if result is None:
+        return jsonify({"error": "Group not found"}), 404
+    known, added = result
+
+    added_ids = set(added)
+    known_ids = set(known)
+    return ApiResponse.orjson(
+        {
+            "added": added,
+            "already_members": [i for i in known if i not in added_ids],
+            "not_found": [
+                i for i in dict.fromkeys(body.identity_ids) if i not in known_ids
+            ],
+        },
+        200,
+    )
+
+
+@bp.route("/groups/<int:group_id>/members/remove", methods=["POST"])
+@login_required
+@permission_required("manage_users")
+@validated_request(body_model=GroupMembersRequest)
+async def remove_group_members(group_id: int, body: GroupMembersRequest):
+    """
+    Remove several identities from a group in one request.
+
+    Path Parameters:
+        - group_id: Group ID
+
+    Request Body:
+        {
+            "identity_ids": [1, 2, 3]
+        }
+
+    Returns:
+        200: Removed and not-a-member identity IDs
+    """
+    db = current_app.db
+
+    removed = await run_in_threadpool(
+        _remove_group_members, db, group_id, body.identity_ids
+    )
+
+    removed_ids = set(removed)
+    return ApiResponse.orjson(
+        {
+            "removed": removed,
+            "not_members": [
+                i for i in dict.fromkeys(body.identity_ids) if i not in removed_ids
+            ],
+        },
+        200,
+    )
 
 
 @bp.route("/groups/<int:group_id>/members/<int:identity_id>", methods=["DELETE"])
@@ -600,32 +797,17 @@ async def remove_group_member(group_id: int, identity_id: int):
     """
     db = current_app.db
 
-    # Check and remove membership
+    # Delete in one statement; no affected row means it was not a membership
     def remove_member():
-        membership = (
-            db(
-                (db.identity_group_members.group_id == group_id)
-                & (db.identity_group_members.identity_id == identity_id)
-            )
-            .select()
-            .first()
-        )
-
-        if not membership:
-            return None, "Identity is not a member of this group", 404
-
-        # Delete membership
-        db(
-            (db.identity_group_members.group_id == group_id)
-            & (db.identity_group_members.identity_id == identity_id)
+        members = db.identity_group_memberships
+        removed = db(
+            (members.group_id == group_id) & (members.identity_id == identity_id)
         ).delete()
         db.commit()
+        invalidate_owner_cache()
+        return removed
 
-        return True, None, None
-
-    result, error, status = await run_in_threadpool(remove_member)
-
-    if error:
-        return jsonify({"error": error}), status
+    if not await run_in_threadpool(remove_member):
+        return jsonify({"error": "Identity is not a member of this group"}), 404
 
     return "", 204
@@ -3,7 +3,7 @@
 # flake8: noqa: E501
 
 
-from dataclasses import asdict
+from collections import defaultdict
 from datetime import datetime, timezone
 
 from flask import Blueprint, current_app, jsonify, request
@@ -19,10 +19,145 @@ from apps.api.models.pydantic import (
     UpdateIPAMAddressRequest,
     UpdateIPAMPrefixRequest,
 )
+from apps.api.utils.api_responses import ApiResponse
+from apps.api.utils.async_list import fetch_list_page
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.count_cache import cached_count, invalidate_counts
+from apps.api.utils.pydal_helpers import (
+    decode_cursor,
+    execute_sql,
+    insert_returning,
+    is_postgres,
+    keyset_after,
+    select_with_total,
+    trim_page,
+    update_returning,
+)
+from apps.api.utils.tenant_cache import get_org_tenant_id
 
 bp = Blueprint("ipam", __name__)
 
+# Columns returned by the list endpoints; detail endpoints still return the
+# full row. Listing only these keeps tags, audit ids and other wide columns
+# off the wire on large pages.
+PREFIX_LIST_FIELDS = (
+    "id",
+    "prefix",
+    "description",
+    "status",
+    "organization_id",
+    "parent_id",
+    "vlan_id",
+    "is_pool",
+    "created_at",
+)
+ADDRESS_LIST_FIELDS = (
+    "id",
+    "address",
+    "prefix_id",
+    "dns_name",
+    "description",
+    "status",
+    "created_at",
+)
+VLAN_LIST_FIELDS = (
+    "id",
+    "vid",
+    "name",
+    "description",
+    "organization_id",
+    "status",
+    "created_at",
+)
+
+
+def _list_columns(table, fields: tuple) -> list:
+    """Resolve list field names to the table's column objects."""
+    return [getattr(table, name) for name in fields]
+
+
+# Default and maximum levels below the root returned by the prefix tree
+PREFIX_TREE_DEFAULT_DEPTH = 3
+PREFIX_TREE_MAX_DEPTH = 32
+
+# Prefix subtree down to a depth limit in one round-trip. The depth bound also
+# ends the walk if parent_id ever forms a cycle; DISTINCT ON keeps one row per
+# prefix. has_children tells clients which returned leaves can be expanded.
+_SQL_PREFIX_SUBTREE = (
+    "WITH RECURSIVE prefix_tree(id, depth) AS ("
+    "SELECT id, 0 FROM ipam_prefixes WHERE id = %s "
+    "UNION ALL SELECT p.id, t.depth + 1 FROM ipam_prefixes p "
+    "JOIN prefix_tree t ON p.parent_id = t.id WHERE t.depth < %s"
+    ") SELECT DISTINCT ON (p.id) p.*, EXISTS ("
+    "SELECT 1 FROM ipam_prefixes c WHERE c.parent_id = p.id"
+    ") AS has_children FROM ipam_prefixes p JOIN prefix_tree t ON p.id = t.id "
+    "ORDER BY p.id"
+)
+
+
+# Address insert that copies tenant_id from its prefix in the same statement;
+# no row back means the prefix does not exist
+_SQL_INSERT_ADDRESS = (
+    "INSERT INTO ipam_addresses (address, description, status, prefix_id, "
+    "dns_name, created_at, updated_at, tenant_id) "
+    "SELECT %s, %s, %s, p.id, %s, %s, %s, p.tenant_id FROM ipam_prefixes p "
+    "WHERE p.id = %s RETURNING *"
+)
+
+# asyncpg statements for PostgreSQL (current_app.db_async / db_async_read)
+_ASYNC_SQL_GET_PREFIX = "SELECT * FROM ipam_prefixes WHERE id = $1"
+_ASYNC_SQL_GET_ADDRESS = "SELECT * FROM ipam_addresses WHERE id = $1"
+_ASYNC_SQL_GET_VLAN = "SELECT * FROM ipam_vlans WHERE id = $1"
+_ASYNC_SQL_INSERT_ADDRESS = (
+    "INSERT INTO ipam_addresses (address, description, status, prefix_id, "
+    "dns_name, created_at, updated_at, tenant_id) "
+    "SELECT $1, $2, $3, p.id, $4, now(), now(), p.tenant_id FROM ipam_prefixes p "
+    "WHERE p.id = $5 RETURNING *"
+)
+_ASYNC_SQL_INSERT_VLAN = (
+    "INSERT INTO ipam_vlans (vid, name, description, status, organization_id, "
+    "tenant_id, created_at, updated_at) "
+    "VALUES ($1, $2, $3, $4, $5, $6, now(), now()) RETURNING *"
+)
+_ASYNC_SQL_DELETE_ADDRESS = "DELETE FROM ipam_addresses WHERE id = $1 RETURNING id"
+_ASYNC_SQL_DELETE_VLAN = "DELETE FROM ipam_vlans WHERE id = $1 RETURNING id"
+
+
+def _get_prefix_subtree(db, prefix_id: int, depth: int) -> list:
+    """
+    Return the prefix and its descendants down to depth levels as a flat list.
+
+    Every row carries has_children, True when the prefix has children whether
+    or not they fall within the depth limit.
+    """
+    if is_postgres(db):
+        return execute_sql(db, _SQL_PREFIX_SUBTREE, (prefix_id, depth), as_dict=True)
+
+    prefixes = db.ipam_prefixes
+    root = prefixes[prefix_id]
+    if not root:
+        return []
+
+    # One query per tree level; seen guards against parent_id cycles
+    rows = [dict(root)]
+    seen = {prefix_id}
+    frontier = rows
+    for level in range(depth + 1):
+        children = db(
+            prefixes.parent_id.belongs([row["id"] for row in frontier])
+        ).select(orderby=prefixes.id)
+        parents = {child.parent_id for child in children}
+        for row in frontier:
+            row["has_children"] = row["id"] in parents
+        if level == depth:
+            break
+        frontier = [dict(child) for child in children if child.id not in seen]
+        if not frontier:
+            break
+        seen.update(row["id"] for row in frontier)
+        rows.extend(frontier)
+    return rows
+
 
 # =============================================================================
 # IPAM Prefixes Endpoints
@@ -56,36 +191,49 @@ async def list_prefixes():
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
 
+    # Snapshot filters so the threadpool closure never touches request
+    args = request.args
+    filters = {
+        key: args.get(key)
+        for key in ("organization_id", "status", "parent_id", "search")
+    }
+    filters_int = {
+        "organization_id": args.get("organization_id", type=int),
+        "parent_id": args.get("parent_id", type=int),
+    }
+
     # Build query
     def get_prefixes():
-        query = db.ipam_prefixes.id > 0
+        # Bind the table proxy once; each db.<table> access builds a new one
+        prefixes = db.ipam_prefixes
+        query = prefixes.id > 0
 
         # Apply filters
-        if request.args.get("organization_id"):
-            org_id = request.args.get("organization_id", type=int)
-            query &= db.ipam_prefixes.organization_id == org_id
-
-        if request.args.get("status"):
-            query &= db.ipam_prefixes.status == request.args.get("status")
-
-        if request.args.get("parent_id"):
-            parent_id = request.args.get("parent_id", type=int)
-            query &= db.ipam_prefixes.parent_id == parent_id
-
-        if request.args.get("search"):
-            search = request.args.get("search")
-            search_pattern = f"%{search}%"
-            query &= (db.ipam_prefixes.prefix.ilike(search_pattern)) | (
-                db.ipam_prefixes.description.ilike(search_pattern)
+        if filters["organization_id"]:
+            query &= prefixes.organization_id == filters_int["organization_id"]
+
+        if filters["status"]:
+            query &= prefixes.status == filters["status"]
+
+        if filters["parent_id"]:
+            query &= prefixes.parent_id == filters_int["parent_id"]
+
+        if filters["search"]:
+            # lower(col) LIKE matches the ipam_prefixes_*_trgm_idx GIN expressions
+            search_pattern = f"%{filters['search'].lower()}%"
+            query &= (prefixes.prefix.lower().like(search_pattern)) | (
+                prefixes.description.lower().like(search_pattern)
             )
 
         # Calculate pagination
         offset = (page - 1) * per_page
 
-        # Get count and rows
-        total = db(query).count()
-        rows = db(query).select(
-            orderby=~db.ipam_prefixes.created_at, limitby=(offset, offset + per_page)
+        # Page and filtered total in one query (COUNT(*) OVER ())
+        rows, total = select_with_total(
+            db(query),
+            *_list_columns(prefixes, PREFIX_LIST_FIELDS),
+            orderby=~prefixes.created_at,
+            limitby=(offset, offset + per_page),
         )
 
         return total, rows
@@ -95,8 +243,8 @@ async def list_prefixes():
     # Calculate total pages
     pages = (total + per_page - 1) // per_page if total > 0 else 0
 
-    # Convert to dicts
-    items = [dict(row) for row in rows]
+    # Rows straight to plain dicts
+    items = rows.as_list()
 
     # Create paginated response
     response = PaginatedResponse(
@@ -107,7 +255,7 @@ async def list_prefixes():
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return ApiResponse.stream_paginated(response)
 
 
 @bp.route("/prefixes", methods=["POST"])
@@ -144,14 +292,11 @@ async def create_prefix():
     except ValidationError as e:
         return ValidationErrorResponse.from_pydantic_error(e)
 
-    # Get organization to derive tenant_id
-    def get_org():
-        return db.organizations[data.organization_id]
-
-    org = await run_in_threadpool(get_org)
-    if not org:
+    # Get organization's tenant_id (cached)
+    found, tenant_id = await get_org_tenant_id(db, data.organization_id)
+    if not found:
         return jsonify({"error": "Organization not found"}), 404
-    if not org.tenant_id:
+    if not tenant_id:
         return jsonify({"error": "Organization must have a tenant"}), 400
 
     def create():
@@ -162,7 +307,7 @@ async def create_prefix():
             description=data.description,
             status=data.status,
             organization_id=data.organization_id,
-            tenant_id=org.tenant_id,
+            tenant_id=tenant_id,
             parent_id=data.parent_id,
             vlan_id=data.vlan_id,
             is_pool=data.is_pool,
@@ -175,7 +320,7 @@ async def create_prefix():
 
     prefix = await run_in_threadpool(create)
 
-    return jsonify(dict(prefix)), 201
+    return ApiResponse.orjson(prefix.as_dict(), 201)
 
 
 @bp.route("/prefixes/<int:id>", methods=["GET"])
@@ -194,58 +339,71 @@ async def get_prefix(id: int):
     Example:
         GET /api/v1/ipam/prefixes/1
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_ASYNC_SQL_GET_PREFIX, id)
+        if record is None:
+            return jsonify({"error": "Prefix not found"}), 404
+        return ApiResponse.orjson(dict(record), 200)
+
+    db = current_app.db_read
 
     prefix = await run_in_threadpool(lambda: db.ipam_prefixes[id])
 
     if not prefix:
         return jsonify({"error": "Prefix not found"}), 404
 
-    return jsonify(dict(prefix)), 200
+    return ApiResponse.orjson(prefix.as_dict(), 200)
 
 
 @bp.route("/prefixes/<int:id>/tree", methods=["GET"])
 @login_required
 async def get_prefix_tree(id: int):
     """
-    Get an IPAM prefix with all children (hierarchical tree).
+    Get an IPAM prefix with its children (hierarchical tree).
 
     Path Parameters:
         - id: Prefix ID
 
+    Query Parameters:
+        - depth: Levels below the prefix to include (default: 3, max: 32).
+          Nodes carry has_children so deeper levels can be fetched with
+          another tree request on that node.
+
     Returns:
         200: Prefix with children tree
         404: Prefix not found
 
     Example:
-        GET /api/v1/ipam/prefixes/1/tree
+        GET /api/v1/ipam/prefixes/1/tree?depth=2
     """
     db = current_app.db
 
+    depth = request.args.get("depth", PREFIX_TREE_DEFAULT_DEPTH, type=int)
+    depth = max(0, min(depth, PREFIX_TREE_MAX_DEPTH))
+
     def get_tree():
-        prefix = db.ipam_prefixes[id]
-        if not prefix:
+        rows = _get_prefix_subtree(db, id, depth)
+        if not rows:
             return None
 
-        def build_tree(parent_id):
-            children = db(db.ipam_prefixes.parent_id == parent_id).select()
-            result = []
-            for child in children:
-                child_dict = dict(child)
-                child_dict["children"] = build_tree(child.id)
-                result.append(child_dict)
-            return result
-
-        prefix_dict = dict(prefix)
-        prefix_dict["children"] = build_tree(id)
-        return prefix_dict
+        # Attach every row to its parent's children list in one pass
+        children = defaultdict(list)
+        root = None
+        for row in rows:
+            row["children"] = children[row["id"]]
+            if row["id"] == id:
+                root = row
+            else:
+                children[row["parent_id"]].append(row)
+        return root
 
     tree = await run_in_threadpool(get_tree)
 
     if not tree:
         return jsonify({"error": "Prefix not found"}), 404
 
-    return jsonify(tree), 200
+    return ApiResponse.orjson(tree, 200)
 
 
 @bp.route("/prefixes/<int:id>", methods=["PUT"])
@@ -285,22 +443,14 @@ async def update_prefix(id: int):
     # If organization is being changed, validate and get tenant
     org_tenant_id = None
     if data.organization_id is not None:
-
-        def get_org():
-            return db.organizations[data.organization_id]
-
-        org = await run_in_threadpool(get_org)
-        if not org:
+        found, org_tenant_id = await get_org_tenant_id(db, data.organization_id)
+        if not found:
             return jsonify({"error": "Organization not found"}), 404
-        if not org.tenant_id:
+        if not org_tenant_id:
             return jsonify({"error": "Organization must have a tenant"}), 400
-        org_tenant_id = org.tenant_id
 
+    # The row comes back with the write (RETURNING)
     def update():
-        prefix = db.ipam_prefixes[id]
-        if not prefix:
-            return None
-
         # Update fields
         update_dict = {}
         if data.prefix is not None:
@@ -319,18 +469,14 @@ async def update_prefix(id: int):
             update_dict["organization_id"] = data.organization_id
             update_dict["tenant_id"] = org_tenant_id
 
-        if update_dict:
-            db(db.ipam_prefixes.id == id).update(**update_dict)
-            db.commit()
-
-        return db.ipam_prefixes[id]
+        return update_returning(db, "ipam_prefixes", id, update_dict)
 
     prefix = await run_in_threadpool(update)
 
     if not prefix:
         return jsonify({"error": "Prefix not found"}), 404
 
-    return jsonify(dict(prefix)), 200
+    return ApiResponse.orjson(prefix, 200)
 
 
 @bp.route("/prefixes/<int:id>", methods=["DELETE"])
@@ -355,14 +501,11 @@ async def delete_prefix(id: int):
     """
     db = current_app.db
 
+    # Delete in one statement; no affected row means the prefix is unknown
     def delete():
-        prefix = db.ipam_prefixes[id]
-        if not prefix:
-            return False
-
-        del db.ipam_prefixes[id]
+        deleted = db(db.ipam_prefixes.id == id).delete()
         db.commit()
-        return True
+        return bool(deleted)
 
     success = await run_in_threadpool(delete)
 
@@ -388,6 +531,8 @@ async def list_addresses():
         - status: Filter by status (active/reserved/deprecated/dhcp)
         - page: Page number (default: 1)
         - per_page: Items per page (default: 50)
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces page)
+        - include_total: Include the total count (default: true without cursor)
         - search: Search in address and description
 
     Returns:
@@ -403,43 +548,97 @@ async def list_addresses():
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
 
+    # A cursor seeks past the previous page instead of skipping offset rows
+    cursor = request.args.get("cursor") or None
+    include_total = request.args.get("include_total", "false" if cursor else "true")
+    include_total = include_total.lower() == "true"
+    try:
+        after = decode_cursor(cursor, datetime.fromisoformat) if cursor else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Snapshot filters; they also key the cached total
+    prefix_id = request.args.get("prefix_id", type=int)
+    status = request.args.get("status")
+    search = request.args.get("search")
+
     # Build query
     def get_addresses():
         query = db.ipam_addresses.id > 0
 
         # Apply filters
-        if request.args.get("prefix_id"):
-            prefix_id = request.args.get("prefix_id", type=int)
+        if prefix_id:
             query &= db.ipam_addresses.prefix_id == prefix_id
 
-        if request.args.get("status"):
-            query &= db.ipam_addresses.status == request.args.get("status")
+        if status:
+            query &= db.ipam_addresses.status == status
 
-        if request.args.get("search"):
-            search = request.args.get("search")
-            search_pattern = f"%{search}%"
-            query &= (db.ipam_addresses.address.ilike(search_pattern)) | (
-                db.ipam_addresses.description.ilike(search_pattern)
+        if search:
+            # lower(col) LIKE matches the ipam_addresses_*_trgm_idx GIN expressions
+            search_pattern = f"%{search.lower()}%"
+            query &= (db.ipam_addresses.address.lower().like(search_pattern)) | (
+                db.ipam_addresses.description.lower().like(search_pattern)
             )
 
         # Calculate pagination
         offset = (page - 1) * per_page
+        page_query = query
+        if after:
+            page_query &= keyset_after(
+                db.ipam_addresses.created_at,
+                db.ipam_addresses.id,
+                after,
+                descending=True,
+            )
+            offset = 0
+
+        # Total is reused across pages of the same listing
+        total = None
+        if include_total:
+            total = cached_count(
+                ("ipam_addresses", prefix_id, status, search), db(query).count
+            )
 
-        # Get count and rows
-        total = db(query).count()
-        rows = db(query).select(
-            orderby=~db.ipam_addresses.created_at, limitby=(offset, offset + per_page)
+        # One look-ahead row tells whether another page follows
+        rows = db(page_query).select(
+            *_list_columns(db.ipam_addresses, ADDRESS_LIST_FIELDS),
+            orderby=[~db.ipam_addresses.created_at, ~db.ipam_addresses.id],
+            limitby=(offset, offset + per_page + 1),
         )
 
         return total, rows
 
-    total, rows = await run_in_threadpool(get_addresses)
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        # Fixed statement text per filter combination; asyncpg prepares each once
+        filters = []
+        if prefix_id:
+            filters.append(("prefix_id = {0}", prefix_id))
+        if status:
+            filters.append(("status = {0}", status))
+        if search:
+            filters.append(
+                (
+                    "(lower(address) LIKE {0} OR lower(description) LIKE {0})",
+                    f"%{search.lower()}%",
+                )
+            )
+        total, items, next_cursor = await fetch_list_page(
+            pool,
+            "ipam_addresses",
+            ", ".join(ADDRESS_LIST_FIELDS),
+            filters,
+            ("ipam_addresses", prefix_id, status, search) if include_total else None,
+            after,
+            (page - 1) * per_page,
+            per_page,
+        )
+    else:
+        total, rows = await run_in_threadpool(get_addresses)
+        items, next_cursor = trim_page(rows.as_list(), per_page)
 
     # Calculate total pages
-    pages = (total + per_page - 1) // per_page if total > 0 else 0
-
-    # Convert to dicts
-    items = [dict(row) for row in rows]
+    pages = (total + per_page - 1) // per_page if total is not None else None
 
     # Create paginated response
     response = PaginatedResponse(
@@ -448,9 +647,10 @@ async def list_addresses():
         page=page,
         per_page=per_page,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
-    return jsonify(asdict(response)), 200
+    return ApiResponse.orjson(response, 200)
 
 
 @bp.route("/addresses", methods=["POST"])
@@ -474,6 +674,7 @@ async def create_address():
         201: Address created
         400: Invalid request
         403: Insufficient permissions
+        404: Prefix not found
 
     Example:
         POST /api/v1/ipam/addresses
@@ -485,34 +686,68 @@ async def create_address():
     except ValidationError as e:
         return ValidationErrorResponse.from_pydantic_error(e)
 
-    # Get prefix to derive tenant_id and organization_id
-    def get_prefix():
-        return db.ipam_prefixes[data.prefix_id]
-
-    prefix = await run_in_threadpool(get_prefix)
-    if not prefix:
-        return jsonify({"error": "Prefix not found"}), 404
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        # Prefix lookup, insert and read-back in one statement
+        record = await pool.fetchrow(
+            _ASYNC_SQL_INSERT_ADDRESS,
+            data.address,
+            data.description,
+            data.status,
+            data.dns_name,
+            data.prefix_id,
+        )
+        if record is None:
+            return jsonify({"error": "Prefix not found"}), 404
+        invalidate_counts("ipam_addresses")
+        return ApiResponse.orjson(dict(record), 201)
 
     def create():
-        # Create address
         now = datetime.now(timezone.utc)
-        address_id = db.ipam_addresses.insert(
-            address=data.address,
-            description=data.description,
-            status=data.status,
-            prefix_id=data.prefix_id,
-            tenant_id=prefix.tenant_id,
-            dns_name=data.dns_name,
-            created_at=now,
-            updated_at=now,
-        )
-        db.commit()
+        if is_postgres(db):
+            # Prefix lookup, insert and read-back in one statement
+            rows = execute_sql(
+                db,
+                _SQL_INSERT_ADDRESS,
+                (
+                    data.address,
+                    data.description,
+                    data.status,
+                    data.dns_name,
+                    now,
+                    now,
+                    data.prefix_id,
+                ),
+                as_dict=True,
+            )
+            return rows[0] if rows else None
 
-        return db.ipam_addresses[address_id]
+        # Get prefix to derive tenant_id
+        prefix = db.ipam_prefixes[data.prefix_id]
+        if not prefix:
+            return None
+        return insert_returning(
+            db,
+            "ipam_addresses",
+            dict(
+                address=data.address,
+                description=data.description,
+                status=data.status,
+                prefix_id=data.prefix_id,
+                tenant_id=prefix.tenant_id,
+                dns_name=data.dns_name,
+                created_at=now,
+                updated_at=now,
+            ),
+        )
 
     address = await run_in_threadpool(create)
+    if address is None:
+        return jsonify({"error": "Prefix not found"}), 404
 
-    return jsonify(dict(address)), 201
+    invalidate_counts("ipam_addresses")
+
+    return ApiResponse.orjson(address, 201)
 
 
 @bp.route("/addresses/<int:id>", methods=["GET"])
@@ -531,14 +766,21 @@ async def get_address(id: int):
     Example:
         GET /api/v1/ipam/addresses/1
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_ASYNC_SQL_GET_ADDRESS, id)
+        if record is None:
+            return jsonify({"error": "Address not found"}), 404
+        return ApiResponse.orjson(dict(record), 200)
+
+    db = current_app.db_read
 
     address = await run_in_threadpool(lambda: db.ipam_addresses[id])
 
     if not address:
         return jsonify({"error": "Address not found"}), 404
 
-    return jsonify(dict(address)), 200
+    return ApiResponse.orjson(address.as_dict(), 200)
 
 
 @bp.route("/addresses/<int:id>", methods=["PUT"])
@@ -585,11 +827,8 @@ async def update_address(id: int):
         if not prefix:
             return jsonify({"error": "Prefix not found"}), 404
 
+    # The row comes back with the write (RETURNING)
     def update():
-        address = db.ipam_addresses[id]
-        if not address:
-            return None
-
         # Update fields
         update_dict = {}
         if data.address is not None:
@@ -603,18 +842,16 @@ async def update_address(id: int):
         if data.dns_name is not None:
             update_dict["dns_name"] = data.dns_name
 
-        if update_dict:
-            db(db.ipam_addresses.id == id).update(**update_dict)
-            db.commit()
-
-        return db.ipam_addresses[id]
+        return update_returning(db, "ipam_addresses", id, update_dict)
 
     address = await run_in_threadpool(update)
 
     if not address:
         return jsonify({"error": "Address not found"}), 404
 
-    return jsonify(dict(address)), 200
+    invalidate_counts("ipam_addresses")
+
+    return ApiResponse.orjson(address, 200)
 
 
 @bp.route("/addresses/<int:id>", methods=["DELETE"])
@@ -637,22 +874,28 @@ async def delete_address(id: int):
     Example:
         DELETE /api/v1/ipam/addresses/1
     """
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        if await pool.fetchval(_ASYNC_SQL_DELETE_ADDRESS, id) is None:
+            return jsonify({"error": "Address not found"}), 404
+        invalidate_counts("ipam_addresses")
+        return "", 204
+
     db = current_app.db
 
+    # Delete in one statement; no affected row means the address is unknown
     def delete():
-        address = db.ipam_addresses[id]
-        if not address:
-            return False
-
-        del db.ipam_addresses[id]
+        deleted = db(db.ipam_addresses.id == id).delete()
         db.commit()
-        return True
+        return bool(deleted)
 
     success = await run_in_threadpool(delete)
 
     if not success:
         return jsonify({"error": "Address not found"}), 404
 
+    invalidate_counts("ipam_addresses")
+
     return "", 204
 
 
@@ -672,6 +915,8 @@ async def list_vlans():
         - status: Filter by status (active/reserved/deprecated)
         - page: Page number (default: 1)
         - per_page: Items per page (default: 50)
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces page)
+        - include_total: Include the total count (default: true without cursor)
         - search: Search in name and description
 
     Returns:
@@ -687,43 +932,94 @@ async def list_vlans():
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
 
+    # A cursor seeks past the previous page instead of skipping offset rows
+    cursor = request.args.get("cursor") or None
+    include_total = request.args.get("include_total", "false" if cursor else "true")
+    include_total = include_total.lower() == "true"
+    try:
+        after = decode_cursor(cursor, datetime.fromisoformat) if cursor else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Snapshot filters; they also key the cached total
+    org_id = request.args.get("organization_id", type=int)
+    status = request.args.get("status")
+    search = request.args.get("search")
+
     # Build query
     def get_vlans():
         query = db.ipam_vlans.id > 0
 
         # Apply filters
-        if request.args.get("organization_id"):
-            org_id = request.args.get("organization_id", type=int)
+        if org_id:
             query &= db.ipam_vlans.organization_id == org_id
 
-        if request.args.get("status"):
-            query &= db.ipam_vlans.status == request.args.get("status")
+        if status:
+            query &= db.ipam_vlans.status == status
 
-        if request.args.get("search"):
-            search = request.args.get("search")
-            search_pattern = f"%{search}%"
-            query &= (db.ipam_vlans.name.ilike(search_pattern)) | (
-                db.ipam_vlans.description.ilike(search_pattern)
+        if search:
+            # lower(col) LIKE matches the ipam_vlans_*_trgm_idx GIN expressions
+            search_pattern = f"%{search.lower()}%"
+            query &= (db.ipam_vlans.name.lower().like(search_pattern)) | (
+                db.ipam_vlans.description.lower().like(search_pattern)
             )
 
         # Calculate pagination
         offset = (page - 1) * per_page
+        page_query = query
+        if after:
+            page_query &= keyset_after(
+                db.ipam_vlans.created_at, db.ipam_vlans.id, after, descending=True
+            )
+            offset = 0
 
-        # Get count and rows
-        total = db(query).count()
-        rows = db(query).select(
-            orderby=~db.ipam_vlans.created_at, limitby=(offset, offset + per_page)
+        # Total is reused across pages of the same listing
+        total = None
+        if include_total:
+            total = cached_count(
+                ("ipam_vlans", org_id, status, search), db(query).count
+            )
+
+        # One look-ahead row tells whether another page follows
+        rows = db(page_query).select(
+            *_list_columns(db.ipam_vlans, VLAN_LIST_FIELDS),
+            orderby=[~db.ipam_vlans.created_at, ~db.ipam_vlans.id],
+            limitby=(offset, offset + per_page + 1),
         )
 
         return total, rows
 
-    total, rows = await run_in_threadpool(get_vlans)
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        # Fixed statement text per filter combination; asyncpg prepares each once
+        filters = []
+        if org_id:
+            filters.append(("organization_id = {0}", org_id))
+        if status:
+            filters.append(("status = {0}", status))
+        if search:
+            filters.append(
+                (
+                    "(lower(name) LIKE {0} OR lower(description) LIKE {0})",
+                    f"%{search.lower()}%",
+                )
+            )
+        total, items, next_cursor = await fetch_list_page(
+            pool,
+            "ipam_vlans",
+            ", ".join(VLAN_LIST_FIELDS),
+            filters,
+            ("ipam_vlans", org_id, status, search) if include_total else None,
+            after,
+            (page - 1) * per_page,
+            per_page,
+        )
+    else:
+        total, rows = await run_in_threadpool(get_vlans)
+        items, next_cursor = trim_page(rows.as_list(), per_page)
 
     # Calculate total pages
-    pages = (total + per_page - 1) // per_page if total > 0 else 0
-
-    # Convert to dicts
-    items = [dict(row) for row in rows]
+    pages = (total + per_page - 1) // per_page if total is not None else None
 
     # Create paginated response
     response = PaginatedResponse(
@@ -732,9 +1028,10 @@ async def list_vlans():
         page=page,
         per_page=per_page,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
-    return jsonify(asdict(response)), 200
+    return ApiResponse.orjson(response, 200)
 
 
 @bp.route("/vlans", methods=["POST"])
@@ -769,36 +1066,49 @@ async def create_vlan():
     except ValidationError as e:
         return ValidationErrorResponse.from_pydantic_error(e)
 
-    # Get organization to derive tenant_id
-    def get_org():
-        return db.organizations[data.organization_id]
-
-    org = await run_in_threadpool(get_org)
-    if not org:
+    # Get organization's tenant_id (cached)
+    found, tenant_id = await get_org_tenant_id(db, data.organization_id)
+    if not found:
         return jsonify({"error": "Organization not found"}), 404
-    if not org.tenant_id:
+    if not tenant_id:
         return jsonify({"error": "Organization must have a tenant"}), 400
 
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        record = await pool.fetchrow(
+            _ASYNC_SQL_INSERT_VLAN,
+            data.vid,
+            data.name,
+            data.description,
+            data.status,
+            data.organization_id,
+            tenant_id,
+        )
+        invalidate_counts("ipam_vlans")
+        return ApiResponse.orjson(dict(record), 201)
+
     def create():
-        # Create VLAN
+        # Create VLAN; the row comes back with the write (RETURNING)
         now = datetime.now(timezone.utc)
-        vlan_id = db.ipam_vlans.insert(
-            vid=data.vid,
-            name=data.name,
-            description=data.description,
-            status=data.status,
-            organization_id=data.organization_id,
-            tenant_id=org.tenant_id,
-            created_at=now,
-            updated_at=now,
+        return insert_returning(
+            db,
+            "ipam_vlans",
+            dict(
+                vid=data.vid,
+                name=data.name,
+                description=data.description,
+                status=data.status,
+                organization_id=data.organization_id,
+                tenant_id=tenant_id,
+                created_at=now,
+                updated_at=now,
+            ),
         )
-        db.commit()
-
-        return db.ipam_vlans[vlan_id]
 
     vlan = await run_in_threadpool(create)
+    invalidate_counts("ipam_vlans")
 
-    return jsonify(dict(vlan)), 201
+    return ApiResponse.orjson(vlan, 201)
 
 
 @bp.route("/vlans/<int:id>", methods=["GET"])
@@ -817,14 +1127,21 @@ async def get_vlan(id: int):
     Example:
         GET /api/v1/ipam/vlans/1
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_ASYNC_SQL_GET_VLAN, id)
+        if record is None:
+            return jsonify({"error": "VLAN not found"}), 404
+        return ApiResponse.orjson(dict(record), 200)
+
+    db = current_app.db_read
 
     vlan = await run_in_threadpool(lambda: db.ipam_vlans[id])
 
     if not vlan:
         return jsonify({"error": "VLAN not found"}), 404
 
-    return jsonify(dict(vlan)), 200
+    return ApiResponse.orjson(vlan.as_dict(), 200)
 
 
 @bp.route("/vlans/<int:id>", methods=["PUT"])
@@ -863,22 +1180,14 @@ async def update_vlan(id: int):
     # If organization is being changed, validate and get tenant
     org_tenant_id = None
     if "organization_id" in data:
-
-        def get_org():
-            return db.organizations[data["organization_id"]]
-
-        org = await run_in_threadpool(get_org)
-        if not org:
+        found, org_tenant_id = await get_org_tenant_id(db, data["organization_id"])
+        if not found:
             return jsonify({"error": "Organization not found"}), 404
-        if not org.tenant_id:
+        if not org_tenant_id:
             return jsonify({"error": "Organization must have a tenant"}), 400
-        org_tenant_id = org.tenant_id
 
+    # The row comes back with the write (RETURNING)
     def update():
-        vlan = db.ipam_vlans[id]
-        if not vlan:
-            return None
-
         # Update fields
         update_dict = {}
         if "vid" in data:
@@ -893,18 +1202,16 @@ async def update_vlan(id: int):
             update_dict["organization_id"] = data["organization_id"]
             update_dict["tenant_id"] = org_tenant_id
 
-        if update_dict:
-            db(db.ipam_vlans.id == id).update(**update_dict)
-            db.commit()
-
-        return db.ipam_vlans[id]
+        return update_returning(db, "ipam_vlans", id, update_dict)
 
     vlan = await run_in_threadpool(update)
 
     if not vlan:
         return jsonify({"error": "VLAN not found"}), 404
 
-    return jsonify(dict(vlan)), 200
+    invalidate_counts("ipam_vlans")
+
+    return ApiResponse.orjson(vlan, 200)
 
 
 @bp.route("/vlans/<int:id>", methods=["DELETE"])
@@ -927,20 +1234,26 @@ async def delete_vlan(id: int):
     Example:
         DELETE /api/v1/ipam/vlans/1
     """
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        if await pool.fetchval(_ASYNC_SQL_DELETE_VLAN, id) is None:
+            return jsonify({"error": "VLAN not found"}), 404
+        invalidate_counts("ipam_vlans")
+        return "", 204
+
     db = current_app.db
 
+    # Delete in one statement; no affected row means the VLAN is unknown
     def delete():
-        vlan = db.ipam_vlans[id]
-        if not vlan:
-            return False
-
-        del db.ipam_vlans[id]
+        deleted = db(db.ipam_vlans.id == id).delete()
         db.commit()
-        return True
+        return bool(deleted)
 
     success = await run_in_threadpool(delete)
 
     if not success:
         return jsonify({"error": "VLAN not found"}), 404
 
+    invalidate_counts("ipam_vlans")
+
     return "", 204
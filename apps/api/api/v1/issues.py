@@ -23,11 +23,32 @@ from apps.api.models.dataclasses import (
     from_pydal_row,
     from_pydal_rows,
 )
+from apps.api.utils.async_list import fetch_list_page
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.count_cache import cached_count, invalidate_counts
+from apps.api.utils.pydal_helpers import (
+    decode_cursor,
+    insert_returning,
+    keyset_after,
+    trim_page,
+    update_returning,
+)
+from apps.api.utils.tenant_cache import get_org_tenant_id
 from shared.webhooks import send_issue_created_webhooks
 
 bp = Blueprint("issues", __name__)
 
+# asyncpg statements for PostgreSQL (current_app.db_async / db_async_read)
+_ASYNC_SQL_GET_ISSUE = "SELECT * FROM issues WHERE id = $1"
+_ASYNC_SQL_INSERT_ISSUE = (
+    "INSERT INTO issues (title, description, status, priority, issue_type, "
+    "created_by_id, assigned_to_id, resource_type, resource_id, is_incident, "
+    "created_at, updated_at) "
+    "VALUES ($1, $2, $3, $4, $5, $6, $7, 'organization', $8, $9, now(), now()) "
+    "RETURNING *"
+)
+_ASYNC_SQL_DELETE_ISSUE = "DELETE FROM issues WHERE id = $1 RETURNING id"
+
 
 # ============================================================================
 # Request Models
@@ -112,6 +133,8 @@ async def list_issues():
         - reporter_id: Filter by creator
         - page: Page number (default: 1)
         - per_page: Items per page (default: 50)
+        - cursor: Keyset cursor from a previous page's next_cursor (replaces page)
+        - include_total: Include the total count (default: true without cursor)
 
     Returns:
         200: List of issues with pagination
@@ -127,6 +150,21 @@ async def list_issues():
     page = request.args.get("page", 1, type=int)
     per_page = min(request.args.get("per_page", 50, type=int), 1000)
 
+    # A cursor seeks past the previous page instead of skipping offset rows
+    cursor = request.args.get("cursor") or None
+    include_total = request.args.get("include_total", "false" if cursor else "true")
+    include_total = include_total.lower() == "true"
+    try:
+        after = decode_cursor(cursor, datetime.fromisoformat) if cursor else None
+    except ValueError as e:
+        return jsonify({"error": str(e)}), 400
+
+    # Snapshot filters; they also key the cached total
+    status = request.args.get("status")
+    priority = request.args.get("priority")
+    assignee_id = request.args.get("assignee_id", type=int)
+    reporter_id = request.args.get("reporter_id", type=int)
+
     # Build query
     def get_issues():
         query = db.issues.id > 0
@@ -137,49 +175,88 @@ async def list_issues():
         #     org_id = request.args.get("organization_id", type=int)
         #     query &= db.issues.organization_id == org_id
 
-        if request.args.get("status"):
-            query &= db.issues.status == request.args.get("status")
+        if status:
+            query &= db.issues.status == status
 
-        if request.args.get("priority"):
-            query &= db.issues.priority == request.args.get("priority")
+        if priority:
+            query &= db.issues.priority == priority
 
-        if request.args.get("assignee_id"):
-            assignee_id = request.args.get("assignee_id", type=int)
+        if assignee_id:
             query &= db.issues.assigned_to_id == assignee_id
 
-        if request.args.get("reporter_id"):
-            reporter_id = request.args.get("reporter_id", type=int)
+        if reporter_id:
             query &= db.issues.created_by_id == reporter_id
 
         # Calculate pagination
         offset = (page - 1) * per_page
+        page_query = query
+        if after:
+            page_query &= keyset_after(
+                db.issues.created_at, db.issues.id, after, descending=True
+            )
+            offset = 0
 
-        # Get count and rows
-        total = db(query).count()
-        rows = db(query).select(
-            orderby=~db.issues.created_at, limitby=(offset, offset + per_page)
+        # Total is reused across pages of the same listing
+        total = None
+        if include_total:
+            total = cached_count(
+                ("issues", status, priority, assignee_id, reporter_id), db(query).count
+            )
+
+        # One look-ahead row tells whether another page follows
+        rows = db(page_query).select(
+            orderby=[~db.issues.created_at, ~db.issues.id],
+            limitby=(offset, offset + per_page + 1),
         )
 
         return total, rows
 
-    total, rows = await run_in_threadpool(get_issues)
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        # Fixed statement text per filter combination; asyncpg prepares each once
+        filters = []
+        if status:
+            filters.append(("status = {0}", status))
+        if priority:
+            filters.append(("priority = {0}", priority))
+        if assignee_id:
+            filters.append(("assigned_to_id = {0}", assignee_id))
+        if reporter_id:
+            filters.append(("created_by_id = {0}", reporter_id))
+        total, rows, next_cursor = await fetch_list_page(
+            pool,
+            "issues",
+            "*",
+            filters,
+            (
+                ("issues", status, priority, assignee_id, reporter_id)
+                if include_total
+                else None
+            ),
+            after,
+            (page - 1) * per_page,
+            per_page,
+        )
+        items = [IssueDTO(**row) for row in rows]
+    else:
+        total, rows = await run_in_threadpool(get_issues)
+        rows, next_cursor = trim_page(rows, per_page)
+        items = from_pydal_rows(rows, IssueDTO)
 
     # Calculate total pages
-    pages = (total + per_page - 1) // per_page if total > 0 else 0
-
-    # Convert to DTOs
-    items = from_pydal_rows(rows, IssueDTO)
+    pages = (total + per_page - 1) // per_page if total is not None else None
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
+        next_cursor=next_cursor,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
@@ -210,59 +287,72 @@ async def create_issue(body: CreateIssueRequest):
     """
     db = current_app.db
 
-    # Get organization to derive tenant_id
-    def get_org():
-        return db.organizations[body.organization_id]
-
-    org = await run_in_threadpool(get_org)
-    if not org:
+    # Get organization's tenant_id (cached)
+    found, tenant_id = await get_org_tenant_id(db, body.organization_id)
+    if not found:
         return jsonify({"error": "Organization not found"}), 404
-    if not org.tenant_id:
+    if not tenant_id:
         return jsonify({"error": "Organization must have a tenant"}), 400
 
     # Capture current_user before thread pool (Flask g doesn't propagate to threads)
     current_user_id = g.current_user.id
 
     def create():
-        # Create issue
+        # Create issue; the row comes back with the write (RETURNING)
         now = datetime.now(timezone.utc)
-        issue_id = db.issues.insert(
-            title=body.title,
-            description=body.description,
-            status=(body.status or "open").upper(),
-            priority=(body.priority or "medium").upper(),
-            issue_type=body.issue_type,
-            created_by_id=current_user_id,
-            assigned_to_id=body.assignee_id,
-            resource_type="organization",
-            resource_id=body.organization_id,
-            is_incident=body.is_incident,
-            created_at=now,
-            updated_at=now,
+        return insert_returning(
+            db,
+            "issues",
+            dict(
+                title=body.title,
+                description=body.description,
+                status=(body.status or "open").upper(),
+                priority=(body.priority or "medium").upper(),
+                issue_type=body.issue_type,
+                created_by_id=current_user_id,
+                assigned_to_id=body.assignee_id,
+                resource_type="organization",
+                resource_id=body.organization_id,
+                is_incident=body.is_incident,
+                created_at=now,
+                updated_at=now,
+            ),
         )
-        db.commit()
-
-        # Explicitly select the row to get all fields
-        return db(db.issues.id == issue_id).select().first()
 
-    issue = await run_in_threadpool(create)
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        record = await pool.fetchrow(
+            _ASYNC_SQL_INSERT_ISSUE,
+            body.title,
+            body.description,
+            (body.status or "open").upper(),
+            (body.priority or "medium").upper(),
+            body.issue_type,
+            current_user_id,
+            body.assignee_id,
+            body.organization_id,
+            body.is_incident,
+        )
+        issue = dict(record)
+    else:
+        issue = await run_in_threadpool(create)
+    invalidate_counts("issues")
 
     # Send issue created webhooks asynchronously (fire and forget)
-    if issue.resource_id and issue.resource_type == "organization":
+    if issue["resource_id"] and issue["resource_type"] == "organization":
         asyncio.create_task(
             send_issue_created_webhooks(
                 db=db,
-                issue_id=issue.id,
-                issue_title=issue.title,
-                issue_type=issue.issue_type,
-                is_incident=issue.is_incident if hasattr(issue, "is_incident") else 0,
-                organization_id=issue.resource_id,
+                issue_id=issue["id"],
+                issue_title=issue["title"],
+                issue_type=issue["issue_type"],
+                is_incident=issue.get("is_incident", 0),
+                organization_id=issue["resource_id"],
                 web_url_base=current_app.config.get("WEB_URL", "http://localhost:3000"),
             )
         )
 
-    issue_dto = from_pydal_row(issue, IssueDTO)
-    return jsonify(asdict(issue_dto)), 201
+    return jsonify(IssueDTO(**issue)), 201
 
 
 @bp.route("/<int:id>", methods=["GET"])
@@ -282,7 +372,14 @@ async def get_issue(id: int):
     Example:
         GET /api/v1/issues/1
     """
-    db = current_app.db
+    pool = getattr(current_app, "db_async_read", None)
+    if pool is not None:
+        record = await pool.fetchrow(_ASYNC_SQL_GET_ISSUE, id)
+        if record is None:
+            return jsonify({"error": "Issue not found"}), 404
+        return jsonify(IssueDTO(**dict(record))), 200
+
+    db = current_app.db_read
 
     issue = await run_in_threadpool(lambda: db.issues[id])
 
@@ -330,23 +427,14 @@ async def update_issue(id: int, body: UpdateIssueRequest):
     # If organization is being changed, validate and get tenant
     org_tenant_id = None
     if body.organization_id:
-
-        def get_org():
-            return db.organizations[body.organization_id]
-
-        org = await run_in_threadpool(get_org)
-        if not org:
+        found, org_tenant_id = await get_org_tenant_id(db, body.organization_id)
+        if not found:
             return jsonify({"error": "Organization not found"}), 404
-        if not org.tenant_id:
+        if not org_tenant_id:
             return jsonify({"error": "Organization must have a tenant"}), 400
-        org_tenant_id = org.tenant_id
 
+    # The row comes back with the write (RETURNING)
     def update():
-        # Check if issue exists
-        issue = db.issues[id]
-        if not issue:
-            return None, "Issue not found", 404
-
         # Build update fields
         update_fields = {}
 
@@ -369,19 +457,16 @@ async def update_issue(id: int, body: UpdateIssueRequest):
         if body.is_incident is not None:
             update_fields["is_incident"] = body.is_incident
 
-        # Update issue
-        db(db.issues.id == id).update(**update_fields)
-        db.commit()
+        return update_returning(db, "issues", id, update_fields)
 
-        return db.issues[id], None, None
+    issue = await run_in_threadpool(update)
 
-    result, error, status = await run_in_threadpool(update)
+    if not issue:
+        return jsonify({"error": "Issue not found"}), 404
 
-    if error:
-        return jsonify({"error": error}), status
+    invalidate_counts("issues")
 
-    issue_dto = from_pydal_row(result, IssueDTO)
-    return jsonify(asdict(issue_dto)), 200
+    return jsonify(IssueDTO(**issue)), 200
 
 
 @bp.route("/<int:id>", methods=["DELETE"])
@@ -404,24 +489,28 @@ async def delete_issue(id: int):
     Example:
         DELETE /api/v1/issues/1
     """
+    pool = getattr(current_app, "db_async", None)
+    if pool is not None:
+        if await pool.fetchval(_ASYNC_SQL_DELETE_ISSUE, id) is None:
+            return jsonify({"error": "Issue not found"}), 404
+        invalidate_counts("issues")
+        return "", 204
+
     db = current_app.db
 
+    # Delete issue (cascade deletes comments, labels, links); no affected
+    # row means the issue is unknown
     def delete():
-        issue = db.issues[id]
-        if not issue:
-            return None, "Issue not found", 404
-
-        # Delete issue (cascade deletes comments, labels, links)
-        db(db.issues.id == id).delete()
+        deleted = db(db.issues.id == id).delete()
         db.commit()
+        return bool(deleted)
 
-        return True, None, None
-
-    result, error, status = await run_in_threadpool(delete)
+    success = await run_in_threadpool(delete)
 
-    if error:
-        return jsonify({"error": error}), status
+    if not success:
+        return jsonify({"error": "Issue not found"}), 404
 
+    invalidate_counts("issues")
     return "", 204
 
 
@@ -16,6 +16,7 @@ from apps.api.models.dataclasses import (
     from_pydal_rows,
 )
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.tenant_cache import get_org_tenant_id
 
 bp = Blueprint("milestones", __name__)
 
@@ -91,14 +92,14 @@ async def list_milestones():
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
@@ -139,14 +140,11 @@ async def create_milestone():
     if not data.get("organization_id"):
         return jsonify({"error": "organization_id is required"}), 400
 
-    # Get organization to derive tenant_id
-    def get_org():
-        return db.organizations[data["organization_id"]]
-
-    org = await run_in_threadpool(get_org)
-    if not org:
+    # Get organization's tenant_id (cached)
+    found, tenant_id = await get_org_tenant_id(db, data["organization_id"])
+    if not found:
         return jsonify({"error": "Organization not found"}), 404
-    if not org.tenant_id:
+    if not tenant_id:
         return jsonify({"error": "Organization must have a tenant"}), 400
 
     def create():
@@ -157,7 +155,7 @@ async def create_milestone():
             description=data.get("description"),
             status=data.get("status", "open"),
             organization_id=data["organization_id"],
-            tenant_id=org.tenant_id,
+            tenant_id=tenant_id,
             project_id=data.get("project_id"),
             due_date=data.get("due_date"),
             created_at=now,
@@ -236,16 +234,11 @@ async def update_milestone(id: int):
     # If organization is being changed, validate and get tenant
     org_tenant_id = None
     if "organization_id" in data:
-
-        def get_org():
-            return db.organizations[data["organization_id"]]
-
-        org = await run_in_threadpool(get_org)
-        if not org:
+        found, org_tenant_id = await get_org_tenant_id(db, data["organization_id"])
+        if not found:
             return jsonify({"error": "Organization not found"}), 404
-        if not org.tenant_id:
+        if not org_tenant_id:
             return jsonify({"error": "Organization must have a tenant"}), 400
-        org_tenant_id = org.tenant_id
 
     def update():
         milestone = db.milestones[id]
@@ -14,6 +14,7 @@ from apps.api.schemas.organization import (
     OrganizationUpdateSchema,
 )
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.tenant_cache import invalidate_org_tenant
 from shared.api_utils import (
     handle_validation_error,
     make_error_response,
@@ -208,6 +209,8 @@ def update_organization(id: int):
             update_children_tenant(id, new_tenant_id)
 
         db.commit()
+        # Tenant changes cascade to descendants, so drop every cached mapping
+        invalidate_org_tenant(None if tenant_changed else id)
 
         # Fetch updated organization
         org = db.organizations[id]
@@ -246,6 +249,7 @@ def delete_organization(id: int):
     try:
         del db.organizations[id]
         db.commit()
+        invalidate_org_tenant(id)
     except Exception as e:
         db.rollback()
         return make_error_response(f"Database error: {str(e)}", 500)
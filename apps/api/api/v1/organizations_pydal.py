@@ -29,6 +29,7 @@ from apps.api.utils.pydal_helpers import (
     get_by_id,
     insert_record,
 )
+from apps.api.utils.tenant_cache import invalidate_org_tenant
 
 logger = logging.getLogger(__name__)
 
@@ -100,14 +101,14 @@ async def list_organizations():
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=pagination.page,
         per_page=pagination.per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
@@ -252,6 +253,7 @@ async def update_organization(id: int, body: UpdateOrganizationRequest):
             lambda: db(db.organizations.id == id).update(**update_fields)
         )
         await commit_db(db)
+        invalidate_org_tenant(id)
 
         # Fetch updated org using helper
         org_row = await get_by_id(db.organizations, id)
@@ -294,6 +296,7 @@ async def delete_organization(id: int):
     try:
         await run_in_threadpool(lambda: db.organizations.__delitem__(id))
         await commit_db(db)
+        invalidate_org_tenant(id)
         return ApiResponse.no_content()
 
     except Exception as e:
@@ -11,7 +11,7 @@ from werkzeug.security import generate_password_hash
 
 from apps.api.auth.decorators import get_current_user, login_required, role_required
 from apps.api.models.dataclasses import IdentityDTO, PaginatedResponse, from_pydal_rows
-from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.async_utils import run_cpu_bound, run_in_threadpool
 
 bp = Blueprint("users", __name__)
 
@@ -66,14 +66,14 @@ async def list_users():
 
     # Create paginated response
     response = PaginatedResponse(
-        items=[asdict(item) for item in items],
+        items=items,
         total=total,
         page=page,
         per_page=per_page,
         pages=pages,
     )
 
-    return jsonify(asdict(response)), 200
+    return jsonify(response), 200
 
 
 @bp.route("", methods=["POST"])
@@ -98,7 +98,7 @@ async def create_user():
     username = data["username"].strip()
     insert_data = {
         "username": username,
-        "password_hash": generate_password_hash(data["password"]),
+        "password_hash": await run_cpu_bound(generate_password_hash, data["password"]),
         "identity_type": data.get("identity_type", "human"),
         "auth_provider": "local",
         "email": data.get("email"),
@@ -193,7 +193,9 @@ async def update_user(user_id: int):
 
     # Handle password update
     if "password" in data and data["password"]:
-        update_data["password_hash"] = generate_password_hash(data["password"])
+        update_data["password_hash"] = await run_cpu_bound(
+            generate_password_hash, data["password"]
+        )
 
     if not update_data:
         return jsonify({"error": "No valid fields to update"}), 400
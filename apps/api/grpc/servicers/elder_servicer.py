@@ -1043,6 +1043,7 @@ class ElderServicer(elder_pb2_grpc.ElderServiceServicer):
                     data["tenant_id"] = org.tenant_id
 
             # Update entity
+            data["updated_at"] = datetime.now(timezone.utc)
             db(db.entities.id == request.id).update(**data)
             db.commit()
 
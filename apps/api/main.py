@@ -16,6 +16,8 @@ from prometheus_flask_exporter import PrometheusMetrics
 
 from apps.api.config import get_config
 from apps.api.logging_config import setup_logging
+from apps.api.utils.compression import init_compression
+from apps.api.utils.json_provider import OrjsonProvider
 from shared.database import (
     ensure_database_ready,
     init_db,
@@ -64,6 +66,7 @@ def create_app(config_name: str = None) -> Flask:
     """
     # Create Flask app
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
 
     # Load configuration
     if config_name is None:
@@ -161,6 +164,9 @@ def _init_extensions(app: Flask) -> None:
         expose_headers=app.config.get("CORS_EXPOSE_HEADERS", []),
     )
 
+    # Response compression (gzip for JSON bodies)
+    init_compression(app)
+
     # CSRF Protection - Exempt API routes (they use JWT, not cookies)
     csrf = CSRFProtect(app)
 
@@ -8,7 +8,7 @@ Using @dataclass(slots=True) provides 30-50% memory reduction and faster attribu
 
 from dataclasses import asdict, dataclass, field
 from datetime import date, datetime
-from typing import Optional
+from typing import Any, Iterable, Optional, TypeVar
 
 # ==================== Organization Units (OUs) ====================
 
@@ -164,7 +164,7 @@ class CreateDependencyRequest:
 # ==================== Identities ====================
 
 
-@dataclass(slots=True)
+@dataclass(slots=True, frozen=True)
 class IdentityDTO:
     """Immutable Identity data transfer object."""
 
@@ -1057,6 +1057,7 @@ class PaginatedResponse:
     page: int
     per_page: int
     pages: int
+    next_cursor: Optional[str] = None
 
 
 # ==================== Helper Functions ====================
@@ -1067,17 +1068,16 @@ def to_dict(obj) -> dict:
     return asdict(obj)
 
 
-def from_pydal_row(row, dto_class):
+T = TypeVar("T")
+
+
+def from_pydal_row(row: Any, dto_class: type[T]) -> Optional[T]:
     """Convert PyDAL Row to dataclass DTO."""
     if row is None:
         return None
-    row_dict = row.as_dict()
-    return dto_class(**row_dict)
+    return dto_class(**row.as_dict())
 
 
-def from_pydal_rows(rows, dto_class) -> list:
+def from_pydal_rows(rows: Iterable[Any], dto_class: type[T]) -> list[T]:
     """Convert PyDAL Rows to list of dataclass DTOs."""
-    result = []
-    for row in rows:
-        result.append(dto_class(**row.as_dict()))
-    return result
+    return [dto_class(**row.as_dict()) for row in rows]
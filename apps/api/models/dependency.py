@@ -3,7 +3,8 @@
 # flake8: noqa: E501
 
 
-from sqlalchemy import JSON, Column, ForeignKey, Integer, String
+from sqlalchemy import JSON, Column, ForeignKey, Index, Integer, String, text
+from sqlalchemy.dialects.postgresql import JSONB
 
 from apps.api.models.base import Base, IDMixin, TimestampMixin
 
@@ -14,6 +15,8 @@ class Dependency(Base, IDMixin, TimestampMixin):
 
     Schema matches Alembic migration 011_create_base_tables.
     Uses polymorphic source/target pattern (source_type/source_id).
+    metadata is JSONB on PostgreSQL (migration 014) so it can be read back
+    as raw JSON text without a Python parse.
     """
 
     __tablename__ = "dependencies"
@@ -30,7 +33,18 @@ class Dependency(Base, IDMixin, TimestampMixin):
     target_id = Column(Integer, nullable=False, index=True)
     dependency_type = Column(String(64), nullable=True, index=True)
     village_id = Column(String(32), unique=True, nullable=True, index=True)
-    dep_metadata = Column("metadata", JSON, nullable=True)
+    dep_metadata = Column(
+        "metadata",
+        JSON().with_variant(JSONB(), "postgresql"),
+        nullable=False,
+        server_default=text("'{}'"),
+    )
+
+    # Lookups always filter on both halves of an endpoint (migration 016)
+    __table_args__ = (
+        Index("ix_dependencies_source", "source_type", "source_id"),
+        Index("ix_dependencies_target", "target_type", "target_id"),
+    )
 
     def __repr__(self) -> str:
         """String representation of dependency."""
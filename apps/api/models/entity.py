@@ -9,6 +9,7 @@ from sqlalchemy import (
     Column,
     DateTime,
     ForeignKey,
+    Index,
     Integer,
     String,
 )
@@ -50,6 +51,11 @@ class Entity(Base, IDMixin, TimestampMixin):
     entity_metadata = Column("metadata", JSON, nullable=True)
     last_seen_at = Column(DateTime(timezone=True), nullable=True)
 
+    # Organization + type filters on entity listings and graphs (migration 017)
+    __table_args__ = (
+        Index("ix_entities_organization_type", "organization_id", "type"),
+    )
+
     organization: Mapped["Organization"] = relationship(
         "Organization",
         back_populates="entities",
@@ -27,6 +27,7 @@ from .identity import (
     AuthProvider,
     CreateIdentityGroupRequest,
     CreateIdentityRequest,
+    GroupMembersRequest,
     IdentityDTO,
     IdentityGroupDTO,
     IdentityType,
@@ -99,6 +100,7 @@ __all__ = [
     "IdentityGroupDTO",
     "CreateIdentityGroupRequest",
     "UpdateIdentityGroupRequest",
+    "GroupMembersRequest",
     "IdentityType",
     "AuthProvider",
     "PortalRole",
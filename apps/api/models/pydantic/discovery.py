@@ -0,0 +1,96 @@
+"""
+Pydantic 2 models for Discovery request bodies.
+
+Discovery endpoints parse raw request bytes straight into these models with
+``model_validate_json`` so JSON decoding and field validation happen in one
+pass inside pydantic-core:
+- CreateDiscoveryJobRequest: New discovery job
+- UpdateDiscoveryJobRequest: Partial discovery job update
+- CompleteDiscoveryJobRequest: Scanner result submission
+
+These extend BaseModel rather than RequestModel because existing clients
+(web UI, scanner) send keys the API does not consume; unknown keys are ignored.
+"""
+
+# flake8: noqa: E501
+
+
+from typing import Optional
+
+from pydantic import BaseModel, Field, model_validator
+
+
+class CreateDiscoveryJobRequest(BaseModel):
+    """
+    Request to create a new discovery job.
+
+    Attributes:
+        name: Job name (required)
+        provider: Provider type, e.g. 'aws', 'network' (required)
+        config: Provider configuration (required)
+        organization_id: Owning organization ID (required)
+        schedule_interval: Seconds between runs; 0 or None for one-time
+        description: Optional description
+    """
+
+    name: str = Field(..., description="Job name")
+    provider: str = Field(..., description="Provider type")
+    config: dict = Field(..., description="Provider configuration")
+    organization_id: int = Field(..., description="Owning organization ID")
+    schedule_interval: Optional[int] = Field(
+        default=None,
+        description="Seconds between runs",
+    )
+    description: Optional[str] = Field(
+        default=None,
+        description="Optional description",
+    )
+
+
+class UpdateDiscoveryJobRequest(BaseModel):
+    """
+    Request to update an existing discovery job.
+
+    All fields are optional to support partial updates.
+    """
+
+    name: Optional[str] = Field(default=None, description="Job name")
+    config: Optional[dict] = Field(default=None, description="Provider configuration")
+    schedule_interval: Optional[int] = Field(
+        default=None,
+        description="Seconds between runs",
+    )
+    description: Optional[str] = Field(default=None, description="Description")
+    enabled: Optional[bool] = Field(default=None, description="Enabled status")
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "UpdateDiscoveryJobRequest":
+        """Reject bodies that set none of the fields."""
+        if not self.model_fields_set:
+            raise ValueError("at least one field is required")
+        return self
+
+
+class CompleteDiscoveryJobRequest(BaseModel):
+    """
+    Scanner submission of a finished job's results.
+
+    Attributes:
+        success: Whether the scan succeeded (default: False)
+        results: Scan results payload
+        error_message: Failure reason when success is False
+    """
+
+    success: bool = Field(default=False, description="Scan succeeded")
+    results: Optional[dict] = Field(default_factory=dict, description="Scan results")
+    error_message: Optional[str] = Field(
+        default=None,
+        description="Failure reason",
+    )
+
+    @model_validator(mode="after")
+    def validate_not_empty(self) -> "CompleteDiscoveryJobRequest":
+        """Reject bodies that set none of the fields."""
+        if not self.model_fields_set:
+            raise ValueError("at least one field is required")
+        return self
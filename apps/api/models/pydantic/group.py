@@ -59,9 +59,7 @@ class UpdateGroupRequest(RequestModel):
 class CreateAccessRequestRequest(RequestModel):
     """Request model for creating group access requests."""
 
-    reason: str = Field(
-        ..., min_length=1, max_length=1000, description="Reason for access request"
-    )
+    reason: Optional[str] = Field(None, description="Reason for access request")
     expires_at: Optional[datetime] = Field(
         None, description="Optional expiration datetime for the access"
     )
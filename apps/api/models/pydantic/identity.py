@@ -9,7 +9,7 @@ Provides validation, serialization, and type safety for identity operations.
 from datetime import datetime
 from typing import Literal, Optional
 
-from pydantic import BaseModel, SecretStr, model_validator
+from pydantic import BaseModel, Field, SecretStr, model_validator
 
 # ==================== Type Definitions ====================
 
@@ -145,6 +145,12 @@ class CreateIdentityGroupRequest(RequestModel):
     is_active: bool = True
 
 
+class GroupMembersRequest(RequestModel):
+    """Request naming several identities to add to or remove from a group."""
+
+    identity_ids: list[int] = Field(min_length=1, max_length=1000)
+
+
 class UpdateIdentityGroupRequest(RequestModel):
     """Request to update an Identity Group.
 
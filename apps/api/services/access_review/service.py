@@ -561,7 +561,10 @@ class AccessReviewService:
         db = self.db
 
         # Import here to avoid circular dependency
-        from apps.api.services.group_membership.service import GroupMembershipService
+        from apps.api.services.group_membership.service import (
+            GroupMembershipService,
+            invalidate_owner_cache,
+        )
 
         group_service = GroupMembershipService(db)
 
@@ -600,6 +603,7 @@ class AccessReviewService:
                     )
 
         db.commit()
+        invalidate_owner_cache()
 
     def schedule_next_review(self, group_id: int) -> None:
         """Schedule the next review for a group.
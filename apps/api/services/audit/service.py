@@ -7,11 +7,31 @@ HIPAA, and GDPR compliance requirements.
 # flake8: noqa: E501
 
 
+import atexit
 import datetime
+import logging
+import queue
+import threading
 from typing import Optional
 
 from flask import current_app
 
+logger = logging.getLogger(__name__)
+
+# Deferred audit rows as (app, row, attempts) triples. One daemon thread drains
+# the queue and writes whatever has accumulated with a single INSERT per app, so
+# request handlers return without waiting on the audit write. Failed rows go
+# back on the queue until they have been tried DEFERRED_MAX_ATTEMPTS times. At
+# exit the writer is stopped and joined before the rest of the queue is flushed;
+# the queue lives in memory, so a hard kill still loses what is on it.
+_deferred_queue: "queue.Queue[Optional[tuple]]" = queue.Queue()
+_writer_lock = threading.Lock()
+_writer: Optional[threading.Thread] = None
+_writer_stop = threading.Event()
+DEFERRED_BATCH_SIZE = 500
+DEFERRED_MAX_ATTEMPTS = 5
+DEFERRED_RETRY_DELAY = 1.0
+
 
 class AuditService:
     """Enhanced audit logging service."""
@@ -83,6 +103,86 @@ class AuditService:
         """
         db = current_app.db
 
+        log_id = db.audit_logs.insert(
+            **AuditService._build_row(
+                action=action,
+                resource_type=resource_type,
+                resource_id=resource_id,
+                identity_id=identity_id,
+                portal_user_id=portal_user_id,
+                tenant_id=tenant_id,
+                details=details,
+                success=success,
+                ip_address=ip_address,
+                user_agent=user_agent,
+                correlation_id=correlation_id,
+                category=category,
+                old_values=old_values,
+                new_values=new_values,
+            )
+        )
+        db.commit()
+
+        return log_id
+
+    @staticmethod
+    def log_many(events: list[dict]) -> None:
+        """Log several audit events with a single INSERT.
+
+        Args:
+            events: One dict of log() keyword arguments per event
+        """
+        if not events:
+            return
+
+        db = current_app.db
+        db.audit_logs.bulk_insert(
+            [AuditService._build_row(**event) for event in events]
+        )
+        db.commit()
+
+    @staticmethod
+    def log_deferred(**event) -> None:
+        """Queue an audit event to be written off the request path.
+
+        The row is built immediately; a background writer inserts it
+        shortly after, batched with other deferred events.
+
+        Args:
+            **event: log() keyword arguments
+        """
+        _start_writer()
+        _deferred_queue.put(
+            (current_app._get_current_object(), AuditService._build_row(**event), 0)
+        )
+
+    @staticmethod
+    def flush_deferred() -> None:
+        """Write every queued deferred event now, in the calling thread.
+
+        Failed rows are retried immediately until they run out of attempts.
+        """
+        while batch := _drain(block=False):
+            _requeue(_write_batch(batch))
+
+    @staticmethod
+    def _build_row(
+        action: str,
+        resource_type: str,
+        resource_id: Optional[int] = None,
+        identity_id: Optional[int] = None,
+        portal_user_id: Optional[int] = None,
+        tenant_id: Optional[int] = None,
+        details: Optional[dict] = None,
+        success: bool = True,
+        ip_address: Optional[str] = None,
+        user_agent: Optional[str] = None,
+        correlation_id: Optional[str] = None,
+        category: Optional[str] = None,
+        old_values: Optional[dict] = None,
+        new_values: Optional[dict] = None,
+    ) -> dict:
+        """Build an audit_logs row from log() arguments."""
         # Build details dict
         event_details = details or {}
 
@@ -104,20 +204,16 @@ class AuditService:
         if tenant_id:
             event_details["tenant_id"] = tenant_id
 
-        # Insert audit log
-        log_id = db.audit_logs.insert(
-            identity_id=identity_id,
-            action_name=action,
-            resource_type=resource_type,
-            resource_id=resource_id,
-            details=event_details,
-            success=success,
-            ip_address=ip_address,
-            user_agent=user_agent,
-        )
-        db.commit()
-
-        return log_id
+        return {
+            "identity_id": identity_id,
+            "action_name": action,
+            "resource_type": resource_type,
+            "resource_id": resource_id,
+            "details": event_details,
+            "success": success,
+            "ip_address": ip_address,
+            "user_agent": user_agent,
+        }
 
     @staticmethod
     def log_auth_event(
@@ -514,3 +610,87 @@ class AuditService:
             "retention_days": retention_days,
             "cutoff_date": cutoff_date.isoformat(),
         }
+
+
+def _drain(block: bool) -> list:
+    """Take up to DEFERRED_BATCH_SIZE queued (app, row, attempts) triples.
+
+    The None wake-up sentinel put by _stop_writer() is skipped.
+    """
+    batch = []
+    try:
+        if block:
+            batch.append(_deferred_queue.get())
+        while len(batch) < DEFERRED_BATCH_SIZE:
+            batch.append(_deferred_queue.get_nowait())
+    except queue.Empty:
+        pass
+    return [item for item in batch if item is not None]
+
+
+def _write_batch(batch: list) -> list:
+    """Insert a batch of deferred rows, one bulk_insert per app.
+
+    Returns:
+        The (app, row, attempts) triples whose insert failed, attempts bumped
+    """
+    by_app = {}
+    for app, row, attempts in batch:
+        by_app.setdefault(app, []).append((row, attempts + 1))
+    failed = []
+    for app, entries in by_app.items():
+        try:
+            with app.app_context():
+                app.db.audit_logs.bulk_insert([row for row, _ in entries])
+                app.db.commit()
+        except Exception as e:
+            logger.error(f"Failed to write {len(entries)} deferred audit events: {e}")
+            failed.extend((app, row, attempts) for row, attempts in entries)
+    return failed
+
+
+def _requeue(failed: list) -> None:
+    """Put failed rows back on the queue, dropping those out of attempts."""
+    for app, row, attempts in failed:
+        if attempts < DEFERRED_MAX_ATTEMPTS:
+            _deferred_queue.put((app, row, attempts))
+        else:
+            logger.error(
+                f"Dropping deferred audit event after {attempts} attempts: {row}"
+            )
+
+
+def _writer_loop() -> None:
+    while not _writer_stop.is_set():
+        failed = _write_batch(_drain(block=True))
+        _requeue(failed)
+        if failed:
+            # Back off so a database outage isn't retried in a tight loop
+            _writer_stop.wait(DEFERRED_RETRY_DELAY)
+
+
+def _stop_writer() -> None:
+    """Stop and join the writer thread, then flush what is left on the queue.
+
+    Joining first means a batch the writer has already drained is written (or
+    re-queued) before the final flush runs, rather than lost at exit.
+    """
+    _writer_stop.set()
+    _deferred_queue.put(None)
+    if _writer is not None:
+        _writer.join()
+    AuditService.flush_deferred()
+
+
+def _start_writer() -> None:
+    """Start the deferred audit writer thread on first use."""
+    global _writer
+    if _writer is not None:
+        return
+    with _writer_lock:
+        if _writer is None:
+            _writer = threading.Thread(
+                target=_writer_loop, name="audit_writer", daemon=True
+            )
+            _writer.start()
+            atexit.register(_stop_writer)
@@ -13,6 +13,33 @@ from apps.api.services.discovery.azure_discovery import AzureDiscoveryClient
 from apps.api.services.discovery.base import BaseDiscoveryProvider
 from apps.api.services.discovery.gcp_discovery import GCPDiscoveryClient
 from apps.api.services.discovery.k8s_discovery import KubernetesDiscoveryClient
+from apps.api.services.errors import NotFoundError, ValidationError
+from apps.api.utils.pydal_helpers import execute_sql, is_postgres
+
+# PostgreSQL NOTIFY channel the worker LISTENs on; payload is the job id.
+# Must match JOB_READY_CHANNEL in apps/worker/discovery/executor.py.
+JOB_READY_CHANNEL = "job_ready"
+
+# Local scan providers handled by the scanner service
+LOCAL_SCAN_PROVIDERS = ["network", "http_screenshot", "banner"]
+
+# Static SQL for the short, hot scanner/job endpoints (PostgreSQL only). Fixed
+# statement text lets the server and driver reuse parsing and plans.
+_SQL_GET_JOB = "SELECT * FROM discovery_jobs WHERE id = %s"
+_SQL_PENDING_JOBS = (
+    "SELECT * FROM discovery_jobs "
+    "WHERE enabled AND provider = ANY(%s) AND ("
+    "(schedule_interval = 0 AND last_run_at IS NULL) "
+    "OR (schedule_interval > 0 AND (next_run_at IS NULL OR next_run_at <= now()))"
+    ") ORDER BY schedule_interval > 0, id"
+)
+_SQL_MARK_JOB_RUNNING = (
+    "WITH job AS ("
+    "UPDATE discovery_jobs SET last_run_at = now() WHERE id = %s RETURNING id"
+    ") INSERT INTO discovery_history (job_id, started_at, status, "
+    "entities_discovered, entities_updated, entities_created, created_at, updated_at) "
+    "SELECT id, now(), 'running', 0, 0, 0, now(), now() FROM job RETURNING job_id"
+)
 
 
 class DiscoveryService:
@@ -38,12 +65,13 @@ class DiscoveryService:
             Configured discovery client instance
 
         Raises:
-            Exception: If job not found or invalid provider type
+            NotFoundError: If job not found
+            ValidationError: If provider type is unsupported
         """
         job = self.db.discovery_jobs[job_id]
 
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
         config = job.as_dict()
         config["provider_type"] = job.provider
@@ -64,7 +92,7 @@ class DiscoveryService:
         elif provider_type == "kubernetes":
             return KubernetesDiscoveryClient(config)
         else:
-            raise Exception(f"Unsupported provider type: {provider_type}")
+            raise ValidationError(f"Unsupported provider type: {provider_type}")
 
     # Discovery Job Management
 
@@ -92,12 +120,17 @@ class DiscoveryService:
 
     def get_job(self, job_id: int) -> Dict[str, Any]:
         """Get discovery job details."""
-        job = self.db.discovery_jobs[job_id]
+        if is_postgres(self.db):
+            rows = execute_sql(self.db, _SQL_GET_JOB, (job_id,), as_dict=True)
+            job = rows[0] if rows else None
+        else:
+            row = self.db.discovery_jobs[job_id]
+            job = row.as_dict() if row else None
 
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
-        return self._sanitize_job(job.as_dict())
+        return self._sanitize_job(job)
 
     def create_job(
         self,
@@ -120,7 +153,7 @@ class DiscoveryService:
             "banner",
         ]
         if provider.lower() not in valid_providers:
-            raise Exception(
+            raise ValidationError(
                 f"Invalid provider: {provider}. Must be one of {valid_providers}"
             )
 
@@ -144,9 +177,25 @@ class DiscoveryService:
         )
 
         self.db.commit()
+        self._notify_job_ready(job_id)
 
         return self.get_job(job_id)
 
+    def _notify_job_ready(self, job_id: int) -> None:
+        """Wake the worker for a job that is due now (PostgreSQL only).
+
+        Best effort: the worker's periodic poll still picks the job up if
+        the notification is lost.
+        """
+        if not is_postgres(self.db):
+            return
+        try:
+            execute_sql(
+                self.db, "SELECT pg_notify(%s, %s)", (JOB_READY_CHANNEL, str(job_id))
+            )
+        except Exception as e:
+            logger.warning(f"Failed to notify worker for job {job_id}: {e}")
+
     def update_job(
         self,
         job_id: int,
@@ -160,7 +209,7 @@ class DiscoveryService:
         job = self.db.discovery_jobs[job_id]
 
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
         update_data = {}
         if name is not None:
@@ -175,6 +224,7 @@ class DiscoveryService:
             update_data["enabled"] = enabled
 
         if update_data:
+            update_data["updated_at"] = datetime.now(timezone.utc)
             self.db(self.db.discovery_jobs.id == job_id).update(**update_data)
             self.db.commit()
 
@@ -185,7 +235,7 @@ class DiscoveryService:
         job = self.db.discovery_jobs[job_id]
 
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
         # Delete associated history records
         self.db(self.db.discovery_history.job_id == job_id).delete()
@@ -233,7 +283,8 @@ class DiscoveryService:
     def queue_job_for_worker(self, job_id: int) -> Dict[str, Any]:
         """Queue a discovery job for the worker service by setting next_run_at = now.
 
-        The worker polls discovery_jobs and will pick this up on its next cycle.
+        The worker is woken immediately via NOTIFY job_ready on PostgreSQL and
+        otherwise picks the job up on its next poll.
 
         Args:
             job_id: Discovery job ID
@@ -243,12 +294,13 @@ class DiscoveryService:
         """
         job = self.db.discovery_jobs[job_id]
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
         self.db(self.db.discovery_jobs.id == job_id).update(
             next_run_at=datetime.now(timezone.utc),
         )
         self.db.commit()
+        self._notify_job_ready(job_id)
 
         logger.info(f"Discovery job {job_id} queued for worker execution")
         return {
@@ -271,7 +323,7 @@ class DiscoveryService:
         job = self.db.discovery_jobs[job_id]
 
         if not job:
-            raise Exception(f"Discovery job not found: {job_id}")
+            raise NotFoundError(f"Discovery job not found: {job_id}")
 
         try:
             client = self._get_discovery_client(job_id)
@@ -1525,8 +1577,13 @@ class DiscoveryService:
         Returns:
             List of pending job dictionaries
         """
-        # Get local scan providers
-        local_providers = ["network", "http_screenshot", "banner"]
+        if is_postgres(self.db):
+            rows = execute_sql(
+                self.db, _SQL_PENDING_JOBS, (LOCAL_SCAN_PROVIDERS,), as_dict=True
+            )
+            return [self._sanitize_job(row) for row in rows]
+
+        local_providers = LOCAL_SCAN_PROVIDERS
 
         # Find pending one-time jobs (never run)
         pending_jobs = self.db(
@@ -1563,11 +1620,21 @@ class DiscoveryService:
             Updated job info
 
         Raises:
-            Exception: If job not found
+            NotFoundError: If job not found
         """
+        if is_postgres(self.db):
+            # Stamp the job and open its history entry in one statement
+            if not execute_sql(self.db, _SQL_MARK_JOB_RUNNING, (job_id,)):
+                raise NotFoundError(f"Job not found: {job_id}")
+            return {
+                "success": True,
+                "message": "Job marked as running",
+                "job_id": job_id,
+            }
+
         job = self.db.discovery_jobs[job_id]
         if not job:
-            raise Exception(f"Job not found: {job_id}")
+            raise NotFoundError(f"Job not found: {job_id}")
 
         # Update job status
         self.db(self.db.discovery_jobs.id == job_id).update(
@@ -1610,11 +1677,11 @@ class DiscoveryService:
             Completion status
 
         Raises:
-            Exception: If job not found
+            NotFoundError: If job not found
         """
         job = self.db.discovery_jobs[job_id]
         if not job:
-            raise Exception(f"Job not found: {job_id}")
+            raise NotFoundError(f"Job not found: {job_id}")
 
         # Find the running history entry
         history_entry = (
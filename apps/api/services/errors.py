@@ -0,0 +1,24 @@
+"""Typed exceptions raised by the service layer.
+
+Handlers catch these by type to pick a status code instead of matching on
+exception message text. All subclass Exception, so existing broad
+``except Exception`` handlers keep working unchanged.
+"""
+
+# flake8: noqa: E501
+
+
+class ServiceError(Exception):
+    """Base class for service-layer errors."""
+
+
+class NotFoundError(ServiceError):
+    """Requested resource does not exist (HTTP 404)."""
+
+
+class ValidationError(ServiceError):
+    """Input failed a business-rule check (HTTP 400)."""
+
+
+class ConflictError(ServiceError):
+    """Operation conflicts with the resource's current state (HTTP 409)."""
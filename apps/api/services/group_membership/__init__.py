@@ -6,6 +6,9 @@ Enterprise feature for group ownership, access requests, and provider write-back
 # flake8: noqa: E501
 
 
-from apps.api.services.group_membership.service import GroupMembershipService
+from apps.api.services.group_membership.service import (
+    GroupMembershipService,
+    invalidate_owner_cache,
+)
 
-__all__ = ["GroupMembershipService"]
+__all__ = ["GroupMembershipService", "invalidate_owner_cache"]
@@ -10,15 +10,85 @@ Enterprise feature providing:
 # flake8: noqa: E501
 
 import datetime
+import json
 import logging
 import secrets
+import threading
+from collections import Counter
 from datetime import timezone
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from cachetools import TTLCache
 
 from apps.api.services.audit.service import AuditService
+from apps.api.utils.async_utils import run_in_threadpool, run_parallel
+from apps.api.utils.pydal_helpers import (
+    decode_cursor,
+    encode_cursor,
+    execute_sql,
+    is_postgres,
+    keyset_after,
+)
 
 logger = logging.getLogger(__name__)
 
+# Ownership checks repeat for the same (identity, group) pair across bursts of
+# requests. Every writer of group ownership or memberships in this process
+# (this service, the identities API, access review decisions) calls
+# invalidate_owner_cache(); other worker processes converge within the TTL.
+_owner_cache = TTLCache(maxsize=10_000, ttl=30)
+_owner_cache_lock = threading.RLock()
+# identity_id -> ids of every group it owns, under the same invalidation. Most
+# identities own nothing, so the pending-requests inbox answers from here.
+_owned_groups_cache = TTLCache(maxsize=10_000, ttl=30)
+
+# Member and pending-request counts for a page of groups in one round-trip
+# (PostgreSQL; other backends count projected group_id columns in Python).
+# One statement per (include_members, include_pending) combination, indexed by
+# (include_members << 1) | include_pending, so each shape is its own prepared
+# statement and no page scans a table it does not report on. Rows are always
+# (group_id, member count, pending count).
+_SQL_MEMBER_COUNTS = (
+    "SELECT group_id, count(*), 0 FROM identity_group_memberships "
+    "WHERE group_id = ANY({ids}) GROUP BY group_id"
+)
+_SQL_PENDING_COUNTS = (
+    "SELECT group_id, 0, count(*) FROM group_access_requests "
+    "WHERE group_id = ANY({ids}) AND status = {status} GROUP BY group_id"
+)
+_SQL_MEMBER_AND_PENDING_COUNTS = (
+    "SELECT group_id, count(*) FILTER (WHERE kind = 'member'), "
+    "count(*) FILTER (WHERE kind = 'pending') FROM ("
+    "SELECT group_id, 'member' AS kind FROM identity_group_memberships "
+    "WHERE group_id = ANY({ids}) "
+    "UNION ALL SELECT group_id, 'pending' FROM group_access_requests "
+    "WHERE group_id = ANY({ids_again}) AND status = {status}"
+    ") counts GROUP BY group_id"
+)
+
+
+def _group_counts_statements(ids: str, ids_again: str, status: str) -> list:
+    """Render the four count statements for one placeholder style."""
+    params = {"ids": ids, "ids_again": ids_again, "status": status}
+    return [
+        None,
+        _SQL_PENDING_COUNTS.format(**params),
+        _SQL_MEMBER_COUNTS.format(**params),
+        _SQL_MEMBER_AND_PENDING_COUNTS.format(**params),
+    ]
+
+
+# execute_sql on the engine (one %s per bound value) and the asyncpg pool ($n)
+_SQL_GROUP_COUNTS = _group_counts_statements("%s", "%s", "%s")
+_ASYNC_SQL_GROUP_COUNTS = _group_counts_statements("$1", "$1", "$2")
+
+
+def invalidate_owner_cache() -> None:
+    """Drop cached ownership checks after an ownership or membership write."""
+    with _owner_cache_lock:
+        _owner_cache.clear()
+        _owned_groups_cache.clear()
+
 
 class GroupMembershipService:
     """Service for managing group membership requests and approvals."""
@@ -40,52 +110,196 @@ class GroupMembershipService:
     PROVIDER_LDAP = "ldap"
     PROVIDER_OKTA = "okta"
 
-    def __init__(self, db):
-        """Initialize service with database connection."""
+    def __init__(self, db, pool=None):
+        """Initialize service with database connection.
+
+        Args:
+            db: penguin-dal database
+            pool: Optional asyncpg AsyncPool for hot reads (PostgreSQL only)
+        """
         self.db = db
+        self.pool = pool
 
     def _generate_village_id(self) -> str:
         """Generate a unique village ID for requests."""
         return secrets.token_hex(16)
 
+    async def _page(
+        self,
+        query,
+        sort_field,
+        id_field,
+        limit: int,
+        offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
+        descending: bool = False,
+        parse_cursor=None,
+    ):
+        """Fetch one page in (sort, id) order by offset or keyset cursor.
+
+        A cursor replaces the offset. One extra row is fetched to tell whether
+        another page follows, and the COUNT only runs when include_total is
+        set, concurrently with the page on the executor.
+
+        Returns:
+            Tuple of (total or None, rows, next_cursor or None)
+
+        Raises:
+            ValueError: If the cursor is malformed
+        """
+        db = self.db
+
+        page_query = query
+        if cursor:
+            after = decode_cursor(cursor, parse_cursor)
+            page_query &= keyset_after(sort_field, id_field, after, descending)
+            offset = 0
+        orderby = [~sort_field, ~id_field] if descending else [sort_field, id_field]
+        select = run_in_threadpool(
+            lambda: list(
+                db(page_query).select(
+                    orderby=orderby, limitby=(offset, offset + limit + 1)
+                )
+            )
+        )
+
+        if include_total:
+            total, rows = await run_parallel(run_in_threadpool(db(query).count), select)
+        else:
+            total, rows = None, await select
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            next_cursor = encode_cursor(rows[-1][sort_field.name], rows[-1].id)
+        return total, rows, next_cursor
+
     # ==================== Group Management ====================
 
-    def list_groups(
+    async def list_groups(
         self,
         tenant_id: int = 1,
         include_members: bool = False,
         include_pending: bool = False,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """List all groups with optional member counts and pending requests."""
         db = self.db
 
         query = db.identity_groups.is_active == True  # noqa: E712
 
-        total = db(query).count()
-        groups = db(query).select(
-            orderby=db.identity_groups.name, limitby=(offset, offset + limit)
+        total, groups, next_cursor = await self._page(
+            query,
+            db.identity_groups.name,
+            db.identity_groups.id,
+            limit,
+            offset,
+            cursor,
+            include_total,
         )
+        counts = None
+        shape = (include_members << 1) | include_pending
+        if self.pool is not None and groups and shape:
+            args = [[group.id for group in groups]]
+            if include_pending:
+                args.append(self.STATUS_PENDING)
+            counts = self._counts_from_rows(
+                await self.pool.fetch(_ASYNC_SQL_GROUP_COUNTS[shape], *args)
+            )
+        result = await run_in_threadpool(
+            self._groups_to_dicts, groups, include_members, include_pending, counts
+        )
+
+        return {
+            "groups": result,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+
+    def _groups_to_dicts(
+        self,
+        groups,
+        include_members: bool,
+        include_pending: bool,
+        counts: Optional[Tuple[Counter, Counter]] = None,
+    ) -> List[Dict[str, Any]]:
+        """Convert a page of groups to dictionaries with optional counts.
+
+        Counts already fetched by the caller are used as given; otherwise
+        they are queried here.
+        """
+        member_counts, pending_counts = counts or (Counter(), Counter())
+        group_ids = [group.id for group in groups]
+        if counts is None and group_ids and (include_members or include_pending):
+            member_counts, pending_counts = self._group_counts(
+                group_ids, include_members, include_pending
+            )
 
         result = []
         for group in groups:
             group_data = self._group_to_dict(group)
 
             if include_members:
-                group_data["member_count"] = db(
-                    db.identity_group_memberships.group_id == group.id
-                ).count()
+                group_data["member_count"] = member_counts[group.id]
 
             if include_pending:
-                group_data["pending_request_count"] = db(
-                    (db.group_access_requests.group_id == group.id)
-                    & (db.group_access_requests.status == self.STATUS_PENDING)
-                ).count()
+                group_data["pending_request_count"] = pending_counts[group.id]
 
             result.append(group_data)
 
-        return {"groups": result, "total": total, "limit": limit, "offset": offset}
+        return result
+
+    def _group_counts(
+        self,
+        group_ids: List[int],
+        include_members: bool = True,
+        include_pending: bool = True,
+    ) -> Tuple[Counter, Counter]:
+        """Count members and/or pending requests for a page of groups at once.
+
+        Returns:
+            Tuple of (member counts, pending request counts) keyed by group ID;
+            a count that was not requested is an empty Counter
+        """
+        db = self.db
+
+        if is_postgres(db):
+            params = [group_ids] * (include_members + include_pending)
+            if include_pending:
+                params.append(self.STATUS_PENDING)
+            shape = (include_members << 1) | include_pending
+            return self._counts_from_rows(
+                execute_sql(db, _SQL_GROUP_COUNTS[shape], tuple(params))
+            )
+
+        member_counts, pending_counts = Counter(), Counter()
+        if include_members:
+            memberships = db(
+                db.identity_group_memberships.group_id.belongs(group_ids)
+            ).select(db.identity_group_memberships.group_id)
+            member_counts = Counter(m.group_id for m in memberships)
+        if include_pending:
+            pending = db(
+                db.group_access_requests.group_id.belongs(group_ids)
+                & (db.group_access_requests.status == self.STATUS_PENDING)
+            ).select(db.group_access_requests.group_id)
+            pending_counts = Counter(r.group_id for r in pending)
+        return member_counts, pending_counts
+
+    @staticmethod
+    def _counts_from_rows(rows) -> Tuple[Counter, Counter]:
+        """Split (group_id, members, pending) rows into two Counters."""
+        return (
+            Counter({group_id: members for group_id, members, _ in rows}),
+            Counter({group_id: pending for group_id, _, pending in rows}),
+        )
 
     def get_group(self, group_id: int) -> Optional[Dict[str, Any]]:
         """Get group details including members and ownership info."""
@@ -171,6 +385,7 @@ class GroupMembershipService:
         if updates:
             db(db.identity_groups.id == group_id).update(**updates)
             db.commit()
+            invalidate_owner_cache()
 
             # Audit log
             AuditService.log(
@@ -266,13 +481,15 @@ class GroupMembershipService:
 
         return self._request_to_dict(request)
 
-    def list_requests(
+    async def list_requests(
         self,
         group_id: Optional[int] = None,
         requester_id: Optional[int] = None,
         status: Optional[str] = None,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """List access requests with optional filters."""
         db = self.db
@@ -286,50 +503,80 @@ class GroupMembershipService:
         if status:
             query &= db.group_access_requests.status == status
 
-        total = db(query).count()
-        requests = db(query).select(
-            orderby=~db.group_access_requests.created_at,
-            limitby=(offset, offset + limit),
+        return await self._request_page(query, limit, offset, cursor, include_total)
+
+    async def _request_page(
+        self,
+        query,
+        limit: int,
+        offset: int,
+        cursor: Optional[str],
+        include_total: bool,
+    ) -> Dict[str, Any]:
+        """Fetch one page of access requests, newest first."""
+        db = self.db
+
+        total, requests, next_cursor = await self._page(
+            query,
+            db.group_access_requests.created_at,
+            db.group_access_requests.id,
+            limit,
+            offset,
+            cursor,
+            include_total,
+            descending=True,
+            parse_cursor=datetime.datetime.fromisoformat,
         )
 
         return {
-            "requests": [self._request_to_dict(r) for r in requests],
+            "requests": await run_in_threadpool(self._requests_to_dicts, requests),
             "total": total,
             "limit": limit,
             "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
         }
 
-    def get_pending_requests_for_owner(
+    async def get_pending_requests_for_owner(
         self,
         owner_identity_id: int,
         limit: int = 50,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
-        """Get all pending requests for groups owned by this identity."""
+        """Get all pending requests for groups owned by this identity.
+
+        Identities that own no groups are answered from the owned-groups
+        cache without a database round-trip.
+        """
         db = self.db
 
         # Get groups owned directly or via owning group membership
-        owned_group_ids = self._get_owned_group_ids(owner_identity_id)
+        with _owner_cache_lock:
+            owned_group_ids = _owned_groups_cache.get(owner_identity_id)
+        if owned_group_ids is None:
+            owned_group_ids = await run_in_threadpool(
+                self._get_owned_group_ids, owner_identity_id
+            )
+            with _owner_cache_lock:
+                _owned_groups_cache[owner_identity_id] = owned_group_ids
 
         if not owned_group_ids:
-            return {"requests": [], "total": 0, "limit": limit, "offset": offset}
+            return {
+                "requests": [],
+                "total": 0,
+                "limit": limit,
+                "offset": offset,
+                "next_cursor": None,
+                "has_more": False,
+            }
 
         query = db.group_access_requests.group_id.belongs(owned_group_ids) & (
             db.group_access_requests.status == self.STATUS_PENDING
         )
 
-        total = db(query).count()
-        requests = db(query).select(
-            orderby=~db.group_access_requests.created_at,
-            limitby=(offset, offset + limit),
-        )
-
-        return {
-            "requests": [self._request_to_dict(r) for r in requests],
-            "total": total,
-            "limit": limit,
-            "offset": offset,
-        }
+        return await self._request_page(query, limit, offset, cursor, include_total)
 
     # ==================== Approval/Denial ====================
 
@@ -371,7 +618,7 @@ class GroupMembershipService:
             self._finalize_approval(request_id, approver_id)
 
         # Audit log
-        AuditService.log(
+        AuditService.log_deferred(
             action="approve",
             resource_type="group_access_request",
             resource_id=request_id,
@@ -428,7 +675,7 @@ class GroupMembershipService:
         db.commit()
 
         # Audit log
-        AuditService.log(
+        AuditService.log_deferred(
             action="deny",
             resource_type="group_access_request",
             resource_id=request_id,
@@ -470,36 +717,139 @@ class GroupMembershipService:
         approver_id: int,
         comment: Optional[str] = None,
     ) -> Dict[str, Any]:
-        """Bulk approve multiple requests."""
+        """Bulk approve multiple requests.
+
+        Requests, ownership, approvals, completed memberships and audit
+        entries are each read or written with one statement for the whole
+        batch rather than per request. Duplicate ids are approved once.
+        """
+        db = self.db
         results = {"approved": [], "failed": []}
 
+        request_ids = list(dict.fromkeys(request_ids))
+        requests = {
+            r.id: r
+            for r in db(db.group_access_requests.id.belongs(request_ids)).select()
+        }
+        groups = {
+            group.id: group
+            for group in db(
+                db.identity_groups.id.belongs({r.group_id for r in requests.values()})
+            ).select()
+        }
+        owned = self._owned_among(approver_id, groups.values())
+
+        allowed = []
         for request_id in request_ids:
-            try:
-                self.approve_request(request_id, approver_id, comment)
-                results["approved"].append(request_id)
-            except Exception as e:
-                results["failed"].append({"id": request_id, "error": str(e)})
+            request = requests.get(request_id)
+            if not request:
+                error = "Request not found"
+            elif request.status != self.STATUS_PENDING:
+                error = f"Request is not pending (status: {request.status})"
+            elif request.group_id not in owned:
+                error = "Not authorized to approve this request"
+            else:
+                allowed.append(request)
+                continue
+            results["failed"].append({"id": request_id, "error": error})
+
+        if not allowed:
+            return results
+
+        # Record all approvals
+        now = datetime.datetime.now(timezone.utc)
+        db.group_access_approvals.bulk_insert(
+            [
+                {
+                    "tenant_id": request.tenant_id,
+                    "request_id": request.id,
+                    "approver_id": approver_id,
+                    "decision": "approved",
+                    "comment": comment,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+                for request in allowed
+            ]
+        )
+        db.commit()
+
+        # Finalize the requests whose approval mode is now satisfied
+        approvals = Counter(
+            a.request_id
+            for a in db(
+                db.group_access_approvals.request_id.belongs([r.id for r in allowed])
+                & (db.group_access_approvals.decision == "approved")
+            ).select(db.group_access_approvals.request_id)
+        )
+        completed = [
+            r
+            for r in allowed
+            if self._approvals_satisfy(groups[r.group_id], approvals[r.id])
+        ]
+        if completed:
+            self._finalize_approvals(completed, groups, approver_id)
+
+        AuditService.log_many(
+            [
+                {
+                    "action": "approve",
+                    "resource_type": "group_access_request",
+                    "resource_id": request.id,
+                    "identity_id": approver_id,
+                    "details": {
+                        "category": "group_access_approved",
+                        "group_id": request.group_id,
+                        "requester_id": request.requester_id,
+                        "comment": comment,
+                    },
+                }
+                for request in allowed
+            ]
+        )
 
+        results["approved"] = [r.id for r in allowed]
         return results
 
     # ==================== Membership Management ====================
 
-    def get_group_members(
+    async def get_group_members(
         self,
         group_id: int,
         limit: int = 100,
         offset: int = 0,
+        cursor: Optional[str] = None,
+        include_total: bool = True,
     ) -> Dict[str, Any]:
         """Get all members of a group."""
         db = self.db
 
         query = db.identity_group_memberships.group_id == group_id
 
-        total = db(query).count()
-        memberships = db(query).select(
-            orderby=db.identity_group_memberships.created_at,
-            limitby=(offset, offset + limit),
+        total, memberships, next_cursor = await self._page(
+            query,
+            db.identity_group_memberships.created_at,
+            db.identity_group_memberships.id,
+            limit,
+            offset,
+            cursor,
+            include_total,
+            parse_cursor=datetime.datetime.fromisoformat,
         )
+        members = await run_in_threadpool(self._members_to_dicts, memberships)
+
+        return {
+            "members": members,
+            "total": total,
+            "limit": limit,
+            "offset": offset,
+            "next_cursor": next_cursor,
+            "has_more": next_cursor is not None,
+        }
+
+    def _members_to_dicts(self, memberships) -> List[Dict[str, Any]]:
+        """Convert a page of memberships to member dictionaries."""
+        db = self.db
 
         members = []
         for m in memberships:
@@ -521,7 +871,7 @@ class GroupMembershipService:
                     }
                 )
 
-        return {"members": members, "total": total, "limit": limit, "offset": offset}
+        return members
 
     def add_member(
         self,
@@ -557,6 +907,7 @@ class GroupMembershipService:
             updated_at=now,
         )
         db.commit()
+        invalidate_owner_cache()
 
         # Sync to provider if enabled
         group = db.identity_groups[group_id]
@@ -564,7 +915,7 @@ class GroupMembershipService:
             self._sync_membership_to_provider(group_id, identity_id, "add")
 
         # Audit log
-        AuditService.log(
+        AuditService.log_deferred(
             action="create",
             resource_type="identity_group_membership",
             resource_id=membership_id,
@@ -607,9 +958,10 @@ class GroupMembershipService:
         # Delete membership
         db(db.identity_group_memberships.id == membership.id).delete()
         db.commit()
+        invalidate_owner_cache()
 
         # Audit log
-        AuditService.log(
+        AuditService.log_deferred(
             action="delete",
             resource_type="identity_group_membership",
             resource_id=membership.id,
@@ -627,6 +979,20 @@ class GroupMembershipService:
 
     def is_group_owner(self, identity_id: int, group_id: int) -> bool:
         """Check if identity is an owner of the group (direct or via owning group)."""
+        key = (identity_id, group_id)
+        with _owner_cache_lock:
+            if key in _owner_cache:
+                return _owner_cache[key]
+            owned = _owned_groups_cache.get(identity_id)
+            if owned is not None:
+                return group_id in owned
+        is_owner = self._resolve_group_owner(identity_id, group_id)
+        with _owner_cache_lock:
+            _owner_cache[key] = is_owner
+        return is_owner
+
+    def _resolve_group_owner(self, identity_id: int, group_id: int) -> bool:
+        """Look up group ownership in the database."""
         db = self.db
 
         group = db.identity_groups[group_id]
@@ -652,6 +1018,43 @@ class GroupMembershipService:
 
         return False
 
+    def _owned_among(self, identity_id: int, groups) -> Set[int]:
+        """Return the ids of the given group rows owned by this identity.
+
+        Direct ownership is read off the rows; ownership through an owning
+        group takes one membership query for all of them. A cached owned-groups
+        set answers without any query, and fresh results seed the per-group
+        ownership cache for the single-request approve/deny paths.
+        """
+        db = self.db
+
+        groups = list(groups)
+        with _owner_cache_lock:
+            cached = _owned_groups_cache.get(identity_id)
+        if cached is not None:
+            return {group.id for group in groups if group.id in cached}
+
+        owned = set()
+        via_group = {}
+        for group in groups:
+            if group.owner_identity_id == identity_id:
+                owned.add(group.id)
+            elif group.owner_group_id:
+                via_group.setdefault(group.owner_group_id, []).append(group.id)
+
+        if via_group:
+            memberships = db(
+                db.identity_group_memberships.group_id.belongs(list(via_group))
+                & (db.identity_group_memberships.identity_id == identity_id)
+            ).select(db.identity_group_memberships.group_id)
+            for membership in memberships:
+                owned.update(via_group[membership.group_id])
+
+        with _owner_cache_lock:
+            for group in groups:
+                _owner_cache[(identity_id, group.id)] = group.id in owned
+        return owned
+
     def _get_owned_group_ids(self, identity_id: int) -> List[int]:
         """Get all group IDs owned by this identity."""
         db = self.db
@@ -690,12 +1093,16 @@ class GroupMembershipService:
             & (db.group_access_approvals.decision == "approved")
         ).count()
 
+        return self._approvals_satisfy(group, approvals)
+
+    def _approvals_satisfy(self, group, approvals: int) -> bool:
+        """Check if an approval count meets the group's approval mode."""
         if group.approval_mode == self.APPROVAL_MODE_ANY:
             return approvals >= 1
 
         elif group.approval_mode == self.APPROVAL_MODE_ALL:
             # Count total owners
-            total_owners = self._count_group_owners(request.group_id)
+            total_owners = self._count_group_owners(group.id)
             return approvals >= total_owners
 
         elif group.approval_mode == self.APPROVAL_MODE_THRESHOLD:
@@ -726,46 +1133,84 @@ class GroupMembershipService:
 
         request = db.group_access_requests[request_id]
         group = db.identity_groups[request.group_id]
+        self._finalize_approvals([request], {group.id: group}, final_approver_id)
 
-        # Get provider member ID from identity
-        identity = db.identities[request.requester_id]
-        provider_member_id = None
-        if identity and identity.attributes:
-            attrs = identity.attributes
-            if isinstance(attrs, str):
-                import json
-
-                attrs = json.loads(attrs)
-            if group.provider == self.PROVIDER_LDAP:
-                provider_member_id = attrs.get("ldap_dn")
-            elif group.provider == self.PROVIDER_OKTA:
-                provider_member_id = attrs.get("okta_id")
-
-        # Create membership
-        now = datetime.datetime.now(timezone.utc)
-        membership_id = db.identity_group_memberships.insert(
-            group_id=request.group_id,
-            identity_id=request.requester_id,
-            expires_at=request.expires_at,
-            granted_via_request_id=request_id,
-            provider_member_id=provider_member_id,
-            created_at=now,
-            updated_at=now,
+    def _finalize_approvals(
+        self, requests: list, groups: Dict[int, Any], final_approver_id: int
+    ) -> None:
+        """Create memberships for approved requests and mark them approved.
+
+        Args:
+            requests: Pending request records whose approvals are complete
+            groups: Group records keyed by ID, covering every request's group
+            final_approver_id: Identity recording the final approval
+        """
+        db = self.db
+
+        # Provider member IDs come from requester identity attributes, only
+        # needed for LDAP/Okta groups
+        provider_requesters = [
+            r.requester_id
+            for r in requests
+            if groups[r.group_id].provider in (self.PROVIDER_LDAP, self.PROVIDER_OKTA)
+        ]
+        identities = (
+            {
+                identity.id: identity
+                for identity in db(
+                    db.identities.id.belongs(provider_requesters)
+                ).select()
+            }
+            if provider_requesters
+            else {}
         )
 
+        now = datetime.datetime.now(timezone.utc)
+        memberships = []
+        for request in requests:
+            group = groups[request.group_id]
+            identity = identities.get(request.requester_id)
+            provider_member_id = None
+            if identity and identity.attributes:
+                attrs = identity.attributes
+                if isinstance(attrs, str):
+                    attrs = json.loads(attrs)
+                if group.provider == self.PROVIDER_LDAP:
+                    provider_member_id = attrs.get("ldap_dn")
+                elif group.provider == self.PROVIDER_OKTA:
+                    provider_member_id = attrs.get("okta_id")
+
+            memberships.append(
+                {
+                    "group_id": request.group_id,
+                    "identity_id": request.requester_id,
+                    "expires_at": request.expires_at,
+                    "granted_via_request_id": request.id,
+                    "provider_member_id": provider_member_id,
+                    "created_at": now,
+                    "updated_at": now,
+                }
+            )
+
+        # Create memberships
+        db.identity_group_memberships.bulk_insert(memberships)
+
         # Update request status
-        db(db.group_access_requests.id == request_id).update(
+        db(db.group_access_requests.id.belongs([r.id for r in requests])).update(
             status=self.STATUS_APPROVED,
-            decided_at=datetime.datetime.now(datetime.timezone.utc),
+            decided_at=now,
             decided_by_id=final_approver_id,
         )
         db.commit()
+        invalidate_owner_cache()
 
         # Sync to provider if enabled
-        if group.sync_enabled and group.provider != self.PROVIDER_INTERNAL:
-            self._sync_membership_to_provider(
-                request.group_id, request.requester_id, "add"
-            )
+        for request in requests:
+            group = groups[request.group_id]
+            if group.sync_enabled and group.provider != self.PROVIDER_INTERNAL:
+                self._sync_membership_to_provider(
+                    request.group_id, request.requester_id, "add"
+                )
 
     def _sync_membership_to_provider(
         self,
@@ -869,6 +1314,10 @@ class GroupMembershipService:
             "updated_at": group.updated_at.isoformat() if group.updated_at else None,
         }
 
+    def _requests_to_dicts(self, requests) -> List[Dict[str, Any]]:
+        """Convert a page of request records to dictionaries."""
+        return [self._request_to_dict(r) for r in requests]
+
     def _request_to_dict(self, request) -> Dict[str, Any]:
         """Convert request record to dictionary."""
         db = self.db
@@ -983,6 +1432,7 @@ class GroupMembershipService:
                 # Delete membership
                 db(db.identity_group_memberships.id == membership.id).delete()
                 db.commit()
+                invalidate_owner_cache()
                 results["removed"] += 1
 
                 # Audit log
@@ -243,12 +243,13 @@ class SearchService:
         """
         db_query = self.db.issues.id > 0
 
-        # Text search (case-insensitive)
+        # Text search (case-insensitive); lower(col) LIKE matches the
+        # issues_*_trgm_idx GIN expressions
         if query:
-            search_pattern = f"%{query}%"
-            db_query &= self.db.issues.title.ilike(
+            search_pattern = f"%{query.lower()}%"
+            db_query &= self.db.issues.title.lower().like(
                 search_pattern
-            ) | self.db.issues.description.ilike(search_pattern)
+            ) | self.db.issues.description.lower().like(search_pattern)
 
         # Status filter
         if status:
@@ -8,9 +8,17 @@ ensuring uniform error handling and success responses.
 # flake8: noqa: E501
 
 
-from typing import Any, Optional, Tuple
+import dataclasses
+from itertools import islice
+from typing import Any, Iterator, Optional, Tuple
 
-from flask import jsonify
+import orjson
+from flask import Response, jsonify
+
+# Items encoded per chunk when streaming a paginated body; large enough to keep
+# per-chunk overhead negligible, small enough that a 1000-row page is never
+# held as one encoded buffer.
+STREAM_CHUNK_ITEMS = 100
 
 
 class ApiResponse:
@@ -201,3 +209,68 @@ class ApiResponse:
             return ApiResponse.internal_error("Database connection failed")
         """
         return jsonify({"error": message}), 500
+
+    @staticmethod
+    def orjson(data: Any, status_code: int = 200) -> Tuple[Response, int]:
+        """
+        Generate a success response encoded with orjson.
+
+        Dataclasses and datetimes are serialized natively and pre-encoded JSON
+        can be spliced in with ``orjson.Fragment`` without being re-parsed.
+
+        Args:
+            data: Data to return (dict, list, dataclass, or primitive)
+            status_code: HTTP status code (default: 200)
+
+        Returns:
+            Tuple of (Response, status_code)
+
+        Example:
+            return ApiResponse.orjson({"id": 1, "metadata": orjson.Fragment(raw)})
+        """
+        return (
+            Response(
+                orjson.dumps(data, option=orjson.OPT_NAIVE_UTC),
+                mimetype="application/json",
+            ),
+            status_code,
+        )
+
+    @staticmethod
+    def stream_paginated(page: Any, status_code: int = 200) -> Tuple[Response, int]:
+        """
+        Generate a paginated response whose items are encoded incrementally.
+
+        Items are encoded with orjson in chunks of STREAM_CHUNK_ITEMS as the
+        body is consumed, followed by the remaining PaginatedResponse fields,
+        so the encoded document is never held as one buffer. ``page.items``
+        may be a lazy iterable (e.g. rows from iter_sql), in which case the
+        page itself is never materialized either.
+
+        Args:
+            page: PaginatedResponse (items may be dicts or dataclasses)
+            status_code: HTTP status code (default: 200)
+
+        Returns:
+            Tuple of (streaming Response, status_code)
+
+        Example:
+            return ApiResponse.stream_paginated(PaginatedResponse(...))
+        """
+        metadata = {
+            field.name: getattr(page, field.name)
+            for field in dataclasses.fields(page)
+            if field.name != "items"
+        }
+
+        def generate() -> Iterator[bytes]:
+            yield b'{"items":['
+            items = iter(page.items)
+            separator = b""
+            while chunk := list(islice(items, STREAM_CHUNK_ITEMS)):
+                # Drop the chunk's brackets and join chunks with a comma
+                yield separator + orjson.dumps(chunk, option=orjson.OPT_NAIVE_UTC)[1:-1]
+                separator = b","
+            yield b"]," + orjson.dumps(metadata)[1:]
+
+        return Response(generate(), mimetype="application/json"), status_code
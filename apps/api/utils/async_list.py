@@ -0,0 +1,99 @@
+"""
+Newest-first list pages over the asyncpg pool.
+
+asyncpg prepares every statement server-side and caches it per connection
+(see shared.database.async_pool), so a statement is parsed and planned once
+per connection as long as its text does not change. List endpoints only vary
+by which filters are active, so the SQL is built from the active filter set
+alone: each combination is one fixed statement text, reused across requests
+and prepared once, with every value sent as a parameter.
+"""
+
+# flake8: noqa: E501
+
+
+from functools import lru_cache
+from typing import Any, Hashable, List, Optional, Sequence, Tuple
+
+from apps.api.utils.count_cache import cached_count_async
+from apps.api.utils.pydal_helpers import trim_page
+
+
+@lru_cache(maxsize=256)
+def list_page_sql(
+    table: str, columns: str, conditions: Tuple[str, ...], keyset: bool
+) -> Tuple[str, str]:
+    """
+    Build the page and count statements for one filter combination.
+
+    Each condition holds one value and refers to it as ``{0}`` (possibly more
+    than once); values are numbered $1, $2, ... in condition order. The page
+    statement then takes (created_at, id) of the previous page's last row when
+    keyset is set, followed by LIMIT and OFFSET.
+
+    Args:
+        table: Table name
+        columns: Select list, e.g. "id, name, created_at"
+        conditions: SQL conditions with a ``{0}`` placeholder each
+        keyset: True to continue after a (created_at, id) cursor
+
+    Returns:
+        Tuple of (page_sql, count_sql)
+
+    Example:
+        list_page_sql("ipam_vlans", "*", ("status = {0}",), False)
+    """
+    where = [cond.format(f"${n}") for n, cond in enumerate(conditions, 1)]
+    count_where = " AND ".join(where) or "TRUE"
+    n = len(conditions)
+    if keyset:
+        where.append(f"(created_at, id) < (${n + 1}, ${n + 2})")
+        n += 2
+    page_where = " AND ".join(where) or "TRUE"
+    return (
+        f"SELECT {columns} FROM {table} WHERE {page_where} "
+        f"ORDER BY created_at DESC, id DESC LIMIT ${n + 1} OFFSET ${n + 2}",
+        f"SELECT count(*) FROM {table} WHERE {count_where}",
+    )
+
+
+async def fetch_list_page(
+    pool: Any,
+    table: str,
+    columns: str,
+    filters: Sequence[Tuple[str, Any]],
+    count_key: Optional[Tuple[Hashable, ...]],
+    after: Optional[tuple] = None,
+    offset: int = 0,
+    limit: int = 50,
+) -> Tuple[Optional[int], List[dict], Optional[str]]:
+    """
+    Fetch one newest-first page and, optionally, the cached filtered total.
+
+    Args:
+        pool: AsyncPool (current_app.db_async_read)
+        table: Table name
+        columns: Select list
+        filters: (condition, value) pairs for the active filters
+        count_key: cached_count key, or None to skip the total
+        after: (created_at, id) from decode_cursor; replaces offset
+        offset: Rows to skip when no cursor is given
+        limit: Page size
+
+    Returns:
+        Tuple of (total or None, rows as dicts, next_cursor or None)
+    """
+    conditions = tuple(cond for cond, _ in filters)
+    values = [value for _, value in filters]
+    page_sql, count_sql = list_page_sql(table, columns, conditions, bool(after))
+
+    total = None
+    if count_key is not None:
+        total = await cached_count_async(
+            count_key, lambda: pool.fetchval(count_sql, *values)
+        )
+
+    page_args = [*values, *(after or ()), limit + 1, 0 if after else offset]
+    rows = [dict(record) for record in await pool.fetch(page_sql, *page_args)]
+    rows, next_cursor = trim_page(rows, limit)
+    return total, rows, next_cursor
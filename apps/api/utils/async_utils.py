@@ -8,8 +8,11 @@ Python 3.12 optimizations with asyncio TaskGroups for structured concurrency.
 
 
 import asyncio
+import os
+import time
+import weakref
 from concurrent.futures import ThreadPoolExecutor
-from functools import wraps
+from functools import partial, wraps
 from typing import Any, Callable, ParamSpec, TypeVar
 
 try:
@@ -19,9 +22,41 @@ try:
 except ImportError:
     FLASK_AVAILABLE = False
 
+try:
+    from prometheus_client import Histogram
+
+    PROMETHEUS_AVAILABLE = True
+except ImportError:
+    PROMETHEUS_AVAILABLE = False
+
 # Thread pool for blocking operations (PyDAL database calls)
 _executor = ThreadPoolExecutor(max_workers=20, thread_name_prefix="pydal_")
 
+# Separate pool for CPU-bound work such as password hashing. hashlib releases
+# the GIL while hashing, so one thread per core runs in parallel without
+# tying up the DB executor or its connection slots.
+_cpu_executor = ThreadPoolExecutor(
+    max_workers=os.cpu_count() or 4, thread_name_prefix="cpu_"
+)
+
+# Maximum blocking DB calls in flight at once. Defaults to the executor size,
+# which matches penguin-dal's connection capacity (pool_size=10 + overflow=10).
+# Excess callers wait on the event loop instead of queueing threads and
+# opening connections all at once during bursts.
+DB_CONCURRENCY_LIMIT = int(os.getenv("DB_CONCURRENCY_LIMIT", "20"))
+
+# asyncio.Semaphore binds to the loop that first waits on it, so keep one per
+# event loop; entries vanish with their loop
+_db_semaphores = weakref.WeakKeyDictionary()
+
+if PROMETHEUS_AVAILABLE:
+    # Sustained non-zero waits mean the DB pool/executor is undersized
+    db_semaphore_wait_seconds = Histogram(
+        "elder_db_semaphore_wait_seconds",
+        "Time blocking DB calls waited for a run_in_threadpool slot",
+        buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+    )
+
 # Type hints for better IDE support
 P = ParamSpec("P")
 T = TypeVar("T")
@@ -35,7 +70,8 @@ async def run_in_threadpool(
 
     This is essential for PyDAL operations since PyDAL is synchronous but we want
     to use async Flask endpoints for better concurrency. Automatically copies
-    Flask request context into the thread if available.
+    Flask request context into the thread if available. At most
+    DB_CONCURRENCY_LIMIT calls run at once per event loop; the rest wait.
 
     Args:
         func: The blocking function to run
@@ -108,7 +144,38 @@ async def run_in_threadpool(
     else:
         wrapped_func = safe_wrapper
 
-    return await loop.run_in_executor(_executor, wrapped_func)
+    semaphore = _db_semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _db_semaphores[loop] = asyncio.Semaphore(DB_CONCURRENCY_LIMIT)
+
+    wait_start = time.perf_counter()
+    async with semaphore:
+        if PROMETHEUS_AVAILABLE:
+            db_semaphore_wait_seconds.observe(time.perf_counter() - wait_start)
+        return await loop.run_in_executor(_executor, wrapped_func)
+
+
+async def run_cpu_bound(func: Callable[P, T], *args: P.args, **kwargs: P.kwargs) -> T:
+    """
+    Run a CPU-bound function on the CPU executor.
+
+    Use this for work that neither touches the database nor needs the Flask
+    request context, e.g. password hashing, so it does not occupy a
+    run_in_threadpool slot.
+
+    Args:
+        func: The CPU-bound function to run
+        *args: Positional arguments to pass to the function
+        **kwargs: Keyword arguments to pass to the function
+
+    Returns:
+        The result of the function call
+
+    Example:
+        >>> password_hash = await run_cpu_bound(generate_password_hash, password)
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_cpu_executor, partial(func, *args, **kwargs))
 
 
 def to_thread(func: Callable[P, T]) -> Callable[P, asyncio.Task[T]]:
@@ -0,0 +1,97 @@
+"""
+HTTP response compression for Elder API.
+
+List endpoints return large, repetitive JSON (usernames, timestamps, field
+names repeated per item), which gzip shrinks several times over. This module
+registers an ``after_request`` hook that gzip-encodes JSON responses for
+clients that accept it, including chunked responses from
+``ApiResponse.stream_paginated``, which are compressed chunk by chunk so they
+keep streaming.
+"""
+
+# flake8: noqa: E501
+
+
+import gzip
+import zlib
+from typing import Iterable, Iterator
+
+from flask import Flask, Response, request
+
+# Bodies smaller than this gain little and cost a compressor per response
+COMPRESS_MIN_SIZE = 1024
+
+# zlib level 6 is gzip's default; higher levels cost CPU for little JSON gain
+COMPRESS_LEVEL = 6
+
+COMPRESS_MIMETYPES = ("application/json",)
+
+
+def _gzip_stream(chunks: Iterable[bytes], level: int) -> Iterator[bytes]:
+    """
+    Gzip-encode an iterable of chunks into one gzip member.
+
+    Each chunk is sync-flushed so clients can decode it as soon as it arrives.
+    """
+    compressor = zlib.compressobj(level, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk) + compressor.flush(zlib.Z_SYNC_FLUSH)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def compress_response(response: Response) -> Response:
+    """
+    Gzip-encode a response when the client accepts it and it is worth it.
+
+    Args:
+        response: Outgoing Flask response
+
+    Returns:
+        The same response, compressed in place where applicable
+    """
+    if (
+        response.mimetype not in COMPRESS_MIMETYPES
+        or response.status_code < 200
+        or response.status_code in (204, 304)
+    ):
+        return response
+
+    # Representation depends on Accept-Encoding whether or not we compress
+    response.vary.add("Accept-Encoding")
+
+    if (
+        request.method == "HEAD"
+        or "Content-Encoding" in response.headers
+        or not request.accept_encodings["gzip"]
+    ):
+        return response
+
+    if response.is_streamed:
+        response.response = _gzip_stream(response.response, COMPRESS_LEVEL)
+        response.headers.pop("Content-Length", None)
+    else:
+        data = response.get_data()
+        if len(data) < COMPRESS_MIN_SIZE:
+            return response
+        response.set_data(gzip.compress(data, COMPRESS_LEVEL, mtime=0))
+
+    response.headers["Content-Encoding"] = "gzip"
+    # Strong validators identify exact bytes; the encoded body no longer matches
+    etag, weak = response.get_etag()
+    if etag and not weak:
+        response.set_etag(etag, weak=True)
+    return response
+
+
+def init_compression(app: Flask) -> None:
+    """
+    Register response compression on the app.
+
+    Args:
+        app: Flask application
+    """
+    app.after_request(compress_response)
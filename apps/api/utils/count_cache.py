@@ -0,0 +1,101 @@
+"""Short-lived cache for paginated list totals.
+
+Offset-paginated list endpoints run a COUNT(*) over the filtered query on every
+page request, and it is usually the most expensive query of the request. Paging
+through one listing repeats the same count, so totals are cached per
+(resource, filters) key, excluding page and per_page.
+
+Only totals above COUNT_CACHE_MIN_TOTAL are cached so small result sets stay
+exact. Writes in this process drop the resource's totals; other worker
+processes converge within the TTL. Page rows are always read fresh.
+
+Counts usually run on a read replica, which may not have replayed a write yet.
+For COUNT_CACHE_SETTLE_SECONDS after a resource is invalidated its totals are
+counted but not stored, so a pre-write total is never cached for the full TTL.
+"""
+
+# flake8: noqa: E501
+
+
+import threading
+import time
+from typing import Awaitable, Callable, Hashable, Tuple
+
+from cachetools import TTLCache
+
+COUNT_CACHE_MIN_TOTAL = 100
+
+# Replica lag allowance after a write before totals are cached again
+COUNT_CACHE_SETTLE_SECONDS = 5
+
+_count_cache = TTLCache(maxsize=1024, ttl=60)
+_cache_lock = threading.RLock()
+# resource -> time.monotonic() of its last invalidation
+_invalidated_at = {}
+
+
+def _store(key: Tuple[Hashable, ...], total: int) -> None:
+    """Cache a fresh total unless it is small or its resource just changed."""
+    if total <= COUNT_CACHE_MIN_TOTAL:
+        return
+    with _cache_lock:
+        invalidated = _invalidated_at.get(key[0])
+        if (
+            invalidated is not None
+            and time.monotonic() - invalidated < COUNT_CACHE_SETTLE_SECONDS
+        ):
+            return
+        _count_cache[key] = total
+
+
+def cached_count(key: Tuple[Hashable, ...], count: Callable[[], int]) -> int:
+    """
+    Return the total for key, calling count() on a miss.
+
+    Args:
+        key: Tuple starting with the resource name, followed by filter values
+        count: Callable running the COUNT query
+
+    Returns:
+        Cached or freshly counted total
+
+    Example:
+        total = cached_count(("issues", status, priority), db(query).count)
+    """
+    with _cache_lock:
+        if key in _count_cache:
+            return _count_cache[key]
+
+    total = count()
+    _store(key, total)
+    return total
+
+
+async def cached_count_async(
+    key: Tuple[Hashable, ...], count: Callable[[], Awaitable[int]]
+) -> int:
+    """
+    Async variant of cached_count for counts awaited on the event loop.
+
+    Args:
+        key: Tuple starting with the resource name, followed by filter values
+        count: Coroutine function running the COUNT query
+
+    Returns:
+        Cached or freshly counted total
+    """
+    with _cache_lock:
+        if key in _count_cache:
+            return _count_cache[key]
+
+    total = await count()
+    _store(key, total)
+    return total
+
+
+def invalidate_counts(resource: str) -> None:
+    """Drop every cached total for a resource after a write to it."""
+    with _cache_lock:
+        _invalidated_at[resource] = time.monotonic()
+        for key in [key for key in _count_cache if key[0] == resource]:
+            _count_cache.pop(key, None)
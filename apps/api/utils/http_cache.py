@@ -0,0 +1,74 @@
+"""
+HTTP conditional-request utilities for Elder API.
+
+This module provides weak ETag helpers so read endpoints can answer
+``If-None-Match`` revalidations with 304 Not Modified instead of serializing
+and sending a payload the client already has.
+"""
+
+# flake8: noqa: E501
+
+
+import hashlib
+from typing import Any, Optional, Tuple
+
+from flask import Response, request
+
+
+def weak_etag(*parts: Any) -> str:
+    """
+    Build an opaque weak ETag value from the parts that identify a representation.
+
+    Parts should be cheap, change-detecting values such as ids and
+    ``updated_at`` timestamps rather than the full payload.
+
+    Args:
+        *parts: Values identifying the representation (ids, timestamps, page info)
+
+    Returns:
+        Hex digest suitable for ``Response.set_etag(value, weak=True)``
+
+    Example:
+        etag = weak_etag("entity", row.id, row.updated_at)
+    """
+    return hashlib.blake2b(repr(parts).encode(), digest_size=8).hexdigest()
+
+
+def not_modified(etag: str) -> Optional[Tuple[Response, int]]:
+    """
+    Generate a 304 response if the client already holds this representation.
+
+    Args:
+        etag: ETag value from weak_etag()
+
+    Returns:
+        Tuple of (empty response, 304) if If-None-Match matches, None otherwise
+
+    Example:
+        if cached := not_modified(etag):
+            return cached
+    """
+    if not request.if_none_match.contains_weak(etag):
+        return None
+    response = Response(status=304)
+    response.set_etag(etag, weak=True)
+    return response, 304
+
+
+def with_etag(result: Tuple[Response, int], etag: str) -> Tuple[Response, int]:
+    """
+    Attach a weak ETag to a (response, status) tuple.
+
+    Args:
+        result: Tuple of (response, status_code) from an ApiResponse helper
+        etag: ETag value from weak_etag()
+
+    Returns:
+        The same tuple with the ETag header set
+
+    Example:
+        return with_etag(ApiResponse.success(data), etag)
+    """
+    response, status_code = result
+    response.set_etag(etag, weak=True)
+    return response, status_code
@@ -0,0 +1,57 @@
+"""
+orjson-backed Flask JSON provider for Elder API.
+
+Installed as ``app.json`` so every ``jsonify`` call and ``request.get_json``
+goes through orjson instead of the stdlib encoder, with compact separators
+and raw UTF-8. Dates and datetimes keep Flask's RFC 822 format
+(``Wed, 01 Jan 2025 00:00:00 GMT``, naive values treated as UTC) so existing
+``jsonify`` clients see no change; ``ApiResponse.orjson`` emits ISO 8601.
+"""
+
+# flake8: noqa: E501
+
+
+import datetime
+import decimal
+from typing import Any
+
+import orjson
+from flask import Response
+from flask.json.provider import JSONProvider
+from werkzeug.http import http_date
+
+# Datetimes are passed through to _default so they keep Flask's format
+_ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_NON_STR_KEYS
+
+
+def _default(obj: Any) -> Any:
+    """Encode the extra types Flask's default provider supports."""
+    if isinstance(obj, datetime.date):
+        return http_date(obj)
+    if isinstance(obj, decimal.Decimal):
+        return str(obj)
+    if hasattr(obj, "__html__"):
+        return str(obj.__html__())
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+class OrjsonProvider(JSONProvider):
+    """Flask JSON provider that serializes with orjson."""
+
+    mimetype = "application/json"
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        """Serialize obj to a JSON string; stdlib json kwargs are ignored."""
+        return orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS).decode()
+
+    def loads(self, s: str | bytes, **kwargs: Any) -> Any:
+        """Deserialize JSON text or bytes."""
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any) -> Response:
+        """Build a JSON response from bytes without a str round-trip."""
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=_default, option=_ORJSON_OPTIONS),
+            mimetype=self.mimetype,
+        )
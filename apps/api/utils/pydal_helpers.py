@@ -8,11 +8,15 @@ simplifying the use of run_in_threadpool with database queries.
 # flake8: noqa: E501
 
 
-from typing import Any, List, Optional
+import base64
+from typing import Any, Callable, Iterator, List, Optional
 
+import orjson
 from flask import request
+from penguin_dal import Row, Rows
+from sqlalchemy import func
 
-from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.async_utils import run_in_threadpool, run_parallel
 
 
 async def get_by_id(table: Any, resource_id: int) -> Optional[Any]:
@@ -225,6 +229,350 @@ async def commit_db(db: Any) -> None:
     return await run_in_threadpool(lambda: db.commit())
 
 
+# Filtered row count carried on every row of a page (window aggregate)
+_WINDOW_TOTAL = func.count().over().label("_total")
+
+
+def select_with_total(
+    query: Any,
+    *columns: Any,
+    orderby: Optional[Any] = None,
+    limitby: Optional[tuple] = None,
+) -> tuple[Any, int]:
+    """
+    Select one page of rows and the filtered total in a single query.
+
+    COUNT(*) OVER () rides along on every row, so the predicate is evaluated
+    in one round-trip instead of a count() followed by a select(). A page
+    past the end returns no rows to carry the total, so only then is a
+    separate count issued. Blocking; call it inside run_in_threadpool.
+
+    Args:
+        query: penguin-dal query set, e.g. db(db.identities.id > 0)
+        *columns: Columns to select (FieldProxy or SQLAlchemy columns)
+        orderby: Optional ordering specification
+        limitby: Optional (offset, limit) tuple
+
+    Returns:
+        Tuple of (rows without the total column, total_count)
+
+    Example:
+        rows, total = await run_in_threadpool(
+            select_with_total,
+            db(query),
+            *db.identity_groups.table.columns,
+            orderby=db.identity_groups.name,
+            limitby=(offset, offset + per_page),
+        )
+    """
+    rows = query.select(*columns, _WINDOW_TOTAL, orderby=orderby, limitby=limitby)
+    if rows:
+        total = rows[0]["_total"]
+        return (
+            Rows(
+                [
+                    Row({key: value for key, value in row.items() if key != "_total"})
+                    for row in rows
+                ]
+            ),
+            total,
+        )
+    if limitby and limitby[0]:
+        return rows, query.count()
+    return rows, 0
+
+
+def is_postgres(db: Any) -> bool:
+    """
+    Check whether a penguin-dal database instance is backed by PostgreSQL.
+
+    Raw-SQL fast paths (JSONB casts, RETURNING, CTEs) are only taken on
+    PostgreSQL; other backends (SQLite in tests) use the query builder.
+
+    Args:
+        db: penguin-dal database instance
+
+    Returns:
+        True if the underlying SQLAlchemy dialect is PostgreSQL
+
+    Example:
+        if is_postgres(db):
+            rows = execute_sql(db, SQL, (org_id,), as_dict=True)
+    """
+    engine = getattr(db, "engine", None)
+    dialect = getattr(engine, "dialect", None)
+    return getattr(dialect, "name", None) == "postgresql"
+
+
+def execute_sql(
+    db: Any, query: str, placeholders: Optional[tuple] = None, as_dict: bool = False
+) -> Any:
+    """
+    Run one raw SQL statement on the engine in its own transaction.
+
+    penguin-dal exposes the SQLAlchemy engine but no raw-SQL method, so
+    statements go through exec_driver_sql and commit when they succeed.
+    Blocking; call it inside run_in_threadpool.
+
+    Args:
+        db: penguin-dal database instance
+        query: Raw SQL with driver-native placeholders (%s on PostgreSQL)
+        placeholders: Positional parameters for the query
+        as_dict: Return rows as dicts keyed by column name instead of tuples
+
+    Returns:
+        List of rows for statements that return rows, otherwise the rowcount
+
+    Example:
+        rows = execute_sql(db, "SELECT id FROM entities WHERE tenant_id = %s", (1,))
+    """
+    with db.engine.begin() as conn:
+        if placeholders:
+            result = conn.exec_driver_sql(query, tuple(placeholders))
+        else:
+            result = conn.exec_driver_sql(query)
+        if not result.returns_rows:
+            return result.rowcount
+        if as_dict:
+            keys = list(result.keys())
+            return [dict(zip(keys, row)) for row in result]
+        return [tuple(row) for row in result]
+
+
+def _sql_values(proxy: Any, table: str, fields: dict) -> list:
+    """
+    Check fields against the table's columns and adapt values for execute_sql.
+
+    Column names are interpolated into raw SQL, so unknown keys are rejected.
+    dict and list values are encoded as JSON text for json/jsonb columns.
+    """
+    unknown = set(fields) - set(proxy.table.c.keys())
+    if unknown:
+        raise ValueError(f"Unknown {table} columns: {sorted(unknown)}")
+    return [
+        orjson.dumps(v).decode() if isinstance(v, (dict, list)) else v
+        for v in fields.values()
+    ]
+
+
+def insert_returning(db: Any, table: str, fields: dict) -> dict:
+    """
+    Insert one row and return it as stored.
+
+    On PostgreSQL the INSERT carries RETURNING *, so the row comes back with
+    the write instead of from a second SELECT. Other backends insert through
+    the query builder and re-read the row. Blocking; call it inside
+    run_in_threadpool.
+
+    Args:
+        db: penguin-dal database instance
+        table: Table name
+        fields: Column -> value mapping; every key must be a column of table
+
+    Returns:
+        The inserted row as a dict, including database defaults and id
+
+    Example:
+        row = await run_in_threadpool(
+            insert_returning, db, "ipam_vlans", {"vid": 10, "name": "mgmt"}
+        )
+    """
+    proxy = getattr(db, table)
+    if is_postgres(db):
+        values = _sql_values(proxy, table, fields)
+        columns = ", ".join(f'"{column}"' for column in fields)
+        placeholders = ", ".join(["%s"] * len(fields))
+        rows = execute_sql(
+            db,
+            f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders}) RETURNING *',
+            values,
+            as_dict=True,
+        )
+        return rows[0]
+
+    record_id = proxy.insert(**fields)
+    db.commit()
+    return proxy[record_id].as_dict()
+
+
+def update_returning(
+    db: Any, table: str, record_id: int, fields: dict
+) -> Optional[dict]:
+    """
+    Update one row by id and return its new state.
+
+    On PostgreSQL the UPDATE carries RETURNING *, so the row comes back with
+    the write instead of from a second SELECT. Other backends update through
+    the query builder and re-read the row. An empty ``fields`` only reads.
+    Blocking; call it inside run_in_threadpool.
+
+    Args:
+        db: penguin-dal database instance
+        table: Table name
+        record_id: Row ID
+        fields: Column -> value mapping; every key must be a column of table
+
+    Returns:
+        The updated row as a dict, or None if no row has that id
+
+    Example:
+        row = await run_in_threadpool(
+            update_returning, db, "ipam_prefixes", id, {"status": "deprecated"}
+        )
+    """
+    proxy = getattr(db, table)
+    if fields and is_postgres(db):
+        values = _sql_values(proxy, table, fields)
+        assignments = ", ".join(f'"{column}" = %s' for column in fields)
+        rows = execute_sql(
+            db,
+            f'UPDATE "{table}" SET {assignments} WHERE id = %s RETURNING *',
+            (*values, record_id),
+            as_dict=True,
+        )
+        return rows[0] if rows else None
+
+    if fields:
+        if not db(proxy.id == record_id).update(**fields):
+            return None
+        db.commit()
+    row = proxy[record_id]
+    return row.as_dict() if row else None
+
+
+def iter_sql(
+    db: Any, query: str, placeholders: Optional[tuple] = None, batch_size: int = 500
+) -> Iterator[dict]:
+    """
+    Iterate a raw SQL query row by row using a server-side cursor.
+
+    Unlike execute_sql, rows are fetched from the driver in batches of
+    ``batch_size`` instead of being materialized up front, so memory stays
+    flat regardless of result size. Intended for streaming responses.
+
+    Args:
+        db: penguin-dal database instance
+        query: Raw SQL with driver-native placeholders
+        placeholders: Positional parameters for the query
+        batch_size: Rows fetched from the cursor per round-trip
+
+    Yields:
+        One dict per row keyed by column name
+
+    Example:
+        for row in iter_sql(db, "SELECT id, name FROM entities WHERE tenant_id = %s", (1,)):
+            yield orjson.dumps(row)
+    """
+    with db.engine.connect() as conn:
+        result = conn.execution_options(
+            stream_results=True, yield_per=batch_size
+        ).exec_driver_sql(query, placeholders or ())
+        keys = list(result.keys())
+        for row in result:
+            yield dict(zip(keys, row))
+
+
+def encode_cursor(sort_value: Any, row_id: int) -> str:
+    """
+    Encode the (sort value, id) of a page's last row as an opaque cursor.
+
+    Args:
+        sort_value: Value of the ordering column (datetimes become ISO strings)
+        row_id: Primary key, the tiebreaker for equal sort values
+
+    Returns:
+        URL-safe cursor string
+
+    Example:
+        next_cursor = encode_cursor(last.name, last.id)
+    """
+    return base64.urlsafe_b64encode(orjson.dumps([sort_value, row_id])).decode()
+
+
+def decode_cursor(
+    cursor: str, parse: Optional[Callable[[Any], Any]] = None
+) -> tuple[Any, int]:
+    """
+    Decode a cursor produced by encode_cursor.
+
+    Args:
+        cursor: Cursor string from a previous page
+        parse: Optional converter for the sort value (e.g. datetime.fromisoformat)
+
+    Returns:
+        Tuple of (sort_value, row_id)
+
+    Raises:
+        ValueError: If the cursor is malformed
+
+    Example:
+        after = decode_cursor(request.args["cursor"], datetime.fromisoformat)
+    """
+    try:
+        sort_value, row_id = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+        if not isinstance(row_id, int):
+            raise TypeError(row_id)
+        if parse is not None and sort_value is not None:
+            sort_value = parse(sort_value)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    return sort_value, row_id
+
+
+def keyset_after(
+    sort_field: Any, id_field: Any, after: tuple[Any, int], descending: bool = False
+) -> Any:
+    """
+    Build the keyset predicate for rows that follow ``after`` in (sort, id) order.
+
+    Unlike OFFSET, the database seeks straight to the position through an
+    index on the sort column instead of scanning and discarding earlier rows.
+
+    Args:
+        sort_field: penguin-dal field the page is ordered by
+        id_field: Primary key field used as tiebreaker
+        after: (sort_value, id) from decode_cursor
+        descending: True when the page is ordered by (~sort_field, ~id_field)
+
+    Returns:
+        penguin-dal query to AND with the list filter
+
+    Example:
+        query &= keyset_after(db.groups.name, db.groups.id, decode_cursor(cursor))
+    """
+    sort_value, row_id = after
+    if descending:
+        return (sort_field < sort_value) | (
+            (sort_field == sort_value) & (id_field < row_id)
+        )
+    return (sort_field > sort_value) | (
+        (sort_field == sort_value) & (id_field > row_id)
+    )
+
+
+def trim_page(
+    rows: List[Any], limit: int, sort_name: str = "created_at"
+) -> tuple[List[Any], Optional[str]]:
+    """
+    Drop the look-ahead row of a page fetched with limit + 1 rows.
+
+    Args:
+        rows: Page rows (penguin-dal Rows or dicts) in keyset order
+        limit: Requested page size
+        sort_name: Name of the ordering column
+
+    Returns:
+        Tuple of (at most limit rows, next_cursor or None on the last page)
+
+    Example:
+        items, next_cursor = trim_page(rows.as_list(), per_page)
+    """
+    if len(rows) <= limit:
+        return rows, None
+    rows = rows[:limit]
+    return rows, encode_cursor(rows[-1][sort_name], rows[-1]["id"])
+
+
 class PaginationParams:
     """
     Helper class for extracting and managing pagination parameters from Flask requests.
@@ -298,6 +646,10 @@ async def paginated_query(
     """
     Execute a paginated query with count.
 
+    The count and the page select run concurrently, so latency is the slower
+    of the two rather than their sum. Prefer select_with_total, which needs
+    only one query, when its columns fit the caller.
+
     Args:
         query: penguin-dal query object
         pagination: PaginationParams instance
@@ -315,12 +667,15 @@ async def paginated_query(
             orderby=~db.entities.created_at
         )
     """
-    # Run count and select queries in parallel
-    total = await query_count(query)
-    rows = await query_select(
-        query,
-        orderby=orderby,
-        limitby=(pagination.offset, pagination.offset + pagination.per_page),
+    # Run count and select queries in parallel; each opens its own session,
+    # so the shared query set is safe across the two pool threads
+    total, rows = await run_parallel(
+        query_count(query),
+        query_select(
+            query,
+            orderby=orderby,
+            limitby=(pagination.offset, pagination.offset + pagination.per_page),
+        ),
     )
 
     return rows, total
@@ -0,0 +1,85 @@
+"""Organization to tenant_id lookups with a short-lived in-process cache.
+
+Create and update endpoints for tenant-scoped resources read the owning
+organization only to check it exists and copy its tenant_id. An
+organization's tenant almost never changes, so organization rows are cached
+per worker process. Organization writes in this process drop their entry;
+other worker processes converge within the TTL.
+"""
+
+# flake8: noqa: E501
+
+
+import threading
+from typing import Any, Optional, Tuple
+
+from cachetools import TTLCache
+
+from apps.api.utils.async_utils import run_in_threadpool
+
+_org_tenant_cache = TTLCache(maxsize=4096, ttl=60)
+_cache_lock = threading.RLock()
+
+
+async def get_organization(db: Any, org_id: int) -> Optional[Any]:
+    """
+    Look up an organization row, serving repeat lookups from cache.
+
+    Only existing organizations are cached, so an organization created after
+    a miss is found on the next call.
+
+    Args:
+        db: penguin-dal database
+        org_id: Organization ID
+
+    Returns:
+        Organization row, or None if it does not exist
+
+    Example:
+        org = await get_organization(db, org_id)
+        if not org:
+            return ApiResponse.not_found("Organization", org_id)
+    """
+    with _cache_lock:
+        if org_id in _org_tenant_cache:
+            return _org_tenant_cache[org_id]
+
+    def load():
+        return db(db.organizations.id == org_id).select().first()
+
+    org = await run_in_threadpool(load)
+    if org is not None:
+        with _cache_lock:
+            _org_tenant_cache[org_id] = org
+    return org
+
+
+async def get_org_tenant_id(db: Any, org_id: int) -> Tuple[bool, Optional[int]]:
+    """
+    Look up an organization's tenant_id through the organization cache.
+
+    Args:
+        db: penguin-dal database
+        org_id: Organization ID
+
+    Returns:
+        Tuple of (organization exists, tenant_id or None)
+
+    Example:
+        found, tenant_id = await get_org_tenant_id(db, data.organization_id)
+        if not found:
+            return jsonify({"error": "Organization not found"}), 404
+    """
+    org = await get_organization(db, org_id)
+    if org is None:
+        return False, None
+    return True, org.tenant_id
+
+
+def invalidate_org_tenant(org_id: Optional[int] = None) -> None:
+    """Drop one organization's cached row, or all of them."""
+    with _cache_lock:
+        if org_id is None:
+            _org_tenant_cache.clear()
+        else:
+            _org_tenant_cache.pop(org_id, None)
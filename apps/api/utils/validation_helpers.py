@@ -16,6 +16,7 @@ from croniter import croniter
 from flask import current_app
 
 from apps.api.utils.async_utils import run_in_threadpool
+from apps.api.utils.tenant_cache import get_organization
 
 from .api_responses import ApiResponse
 
@@ -26,6 +27,9 @@ async def validate_organization_and_get_tenant(
     """
     Validate that an organization exists and has a tenant assigned.
 
+    Organization rows come from the tenant_cache lookup cache; see
+    invalidate_org_tenant().
+
     Args:
         org_id: Organization ID to validate
 
@@ -46,12 +50,7 @@ async def validate_organization_and_get_tenant(
             return error
         # org and tenant_id are now available for use
     """
-    db = current_app.db
-
-    def get_org():
-        return db.organizations[org_id]
-
-    org = await run_in_threadpool(get_org)
+    org = await get_organization(current_app.db, org_id)
 
     if not org:
         return None, None, ApiResponse.not_found("Organization", org_id)
@@ -1,13 +1,16 @@
 """Discovery job executor for the worker service.
 
 Polls discovery_jobs table directly for pending cloud discovery jobs
-(aws, gcp, azure, kubernetes) and executes them. Scanner-type jobs
+(aws, gcp, azure, kubernetes) and executes them. On PostgreSQL it also
+LISTENs on the job_ready channel so jobs created or queued through the API
+run immediately instead of waiting for the next poll. Scanner-type jobs
 (network, banner, http_screenshot) are NOT handled here — those are
 polled by the scanner service via the API.
 """
 
 # flake8: noqa: E501
 
+import asyncio
 import logging
 from datetime import datetime, timezone
 from typing import Optional
@@ -21,6 +24,9 @@ logger = logging.getLogger(__name__)
 # Cloud provider types handled by the worker
 CLOUD_PROVIDERS = {"aws", "gcp", "azure", "kubernetes"}
 
+# NOTIFY channel raised by the API (apps/api/services/discovery/service.py)
+JOB_READY_CHANNEL = "job_ready"
+
 
 class DiscoveryExecutor:
     """Polls DB for pending discovery jobs and executes them.
@@ -51,7 +57,8 @@ class DiscoveryExecutor:
         Returns jobs where:
         - enabled = True
         - provider is a cloud type (aws, gcp, azure, kubernetes)
-        - next_run_at <= now OR last_run_at is None (never run)
+        - last_run_at is None (never run), next_run_at <= now (queued),
+          or schedule_interval has elapsed since last_run_at
         """
         now = datetime.now(timezone.utc)
 
@@ -60,29 +67,55 @@ class DiscoveryExecutor:
                 self.db_read.discovery_jobs.provider.belongs(list(CLOUD_PROVIDERS))
             )
 
-            # Filter by schedule: either never run or overdue
+            # Filter by schedule: never run, queued, or overdue
             jobs = self.db_read(query).select()
-
-            pending = []
-            for job in jobs:
-                if job.last_run_at is None:
-                    # Never been run — execute immediately
-                    pending.append(job)
-                elif job.schedule_interval:
-                    # Check if enough time has passed since last run
-                    last_run = job.last_run_at
-                    if last_run.tzinfo is None:
-                        last_run = last_run.replace(tzinfo=timezone.utc)
-                    elapsed = (now - last_run).total_seconds()
-                    if elapsed >= job.schedule_interval:
-                        pending.append(job)
-
-            return pending
+            return [job for job in jobs if self._is_due(job, now)]
 
         except Exception as e:
             logger.error(f"Failed to query pending discovery jobs: {e}")
             return []
 
+    @staticmethod
+    def _is_due(job, now: datetime) -> bool:
+        """Check whether a job has never run, was queued, or is overdue."""
+        if job.last_run_at is None:
+            # Never been run — execute immediately
+            return True
+        next_run = job.next_run_at
+        if next_run is not None:
+            if next_run.tzinfo is None:
+                next_run = next_run.replace(tzinfo=timezone.utc)
+            if next_run <= now:
+                # Queued through the API
+                return True
+        if job.schedule_interval:
+            # Check if enough time has passed since last run
+            last_run = job.last_run_at
+            if last_run.tzinfo is None:
+                last_run = last_run.replace(tzinfo=timezone.utc)
+            return (now - last_run).total_seconds() >= job.schedule_interval
+        return False
+
+    def claim_job(self, job) -> bool:
+        """Atomically take a due job so no other poll or notification runs it.
+
+        Stamps last_run_at and clears next_run_at only if last_run_at still
+        holds the value this job was read with; a concurrent claim changes it
+        first, so exactly one caller wins.
+
+        Args:
+            job: discovery_jobs row read before claiming
+
+        Returns:
+            True if this caller claimed the job
+        """
+        jobs = self.db_write.discovery_jobs
+        claimed = self.db_write(
+            (jobs.id == job.id) & (jobs.last_run_at == job.last_run_at)
+        ).update(last_run_at=datetime.now(timezone.utc), next_run_at=None)
+        self.db_write.commit()
+        return bool(claimed)
+
     def execute_job(self, job_id: int) -> Optional[dict]:
         """Execute a single discovery job.
 
@@ -128,7 +161,73 @@ class DiscoveryExecutor:
 
         executed = 0
         for job in pending:
+            if not self.claim_job(job):
+                continue
             self.execute_job(job.id)
             executed += 1
 
         return executed
+
+    def execute_if_due(self, job_id: int) -> Optional[dict]:
+        """Execute a notified job if it is a due, enabled cloud discovery job.
+
+        Args:
+            job_id: ID from a job_ready notification
+
+        Returns:
+            Result dict from execute_job(), or None if the job was skipped
+        """
+        job = self.db_write.discovery_jobs[job_id]
+        if not job or not job.enabled or job.provider not in CLOUD_PROVIDERS:
+            return None
+        if not self._is_due(job, datetime.now(timezone.utc)):
+            return None
+        if not self.claim_job(job):
+            # A poll or another notification already took it
+            return None
+        return self.execute_job(job_id)
+
+    async def listen_for_jobs(self) -> None:
+        """Execute jobs as they are announced on the job_ready channel.
+
+        Holds one dedicated connection in LISTEN mode and waits on its socket
+        from the event loop, so idle periods cost no queries. Returns
+        immediately on non-PostgreSQL databases; periodic polling still
+        covers scheduled re-runs and any missed notification.
+        """
+        engine = self.db_write.engine
+        if engine.dialect.name != "postgresql":
+            return
+
+        fairy = engine.raw_connection()
+        conn = fairy.driver_connection
+        loop = asyncio.get_running_loop()
+        ready: asyncio.Queue = asyncio.Queue()
+
+        def on_readable():
+            conn.poll()
+            while conn.notifies:
+                ready.put_nowait(conn.notifies.pop(0).payload)
+
+        try:
+            conn.set_session(autocommit=True)
+            with conn.cursor() as cur:
+                cur.execute(f"LISTEN {JOB_READY_CHANNEL}")
+            loop.add_reader(conn.fileno(), on_readable)
+            logger.info(f"Listening for discovery jobs on '{JOB_READY_CHANNEL}'")
+
+            while True:
+                payload = await ready.get()
+                try:
+                    job_id = int(payload)
+                except ValueError:
+                    logger.warning(f"Ignoring malformed job_ready payload: {payload!r}")
+                    continue
+                await asyncio.to_thread(self.execute_if_due, job_id)
+        finally:
+            try:
+                loop.remove_reader(conn.fileno())
+            except Exception:
+                pass
+            # Session state was changed (autocommit, LISTEN); never reuse it
+            fairy.invalidate()
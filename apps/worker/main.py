@@ -324,6 +324,16 @@ class WorkerService:
             discovery_jobs_executed.labels(provider="cloud", status="failed").inc()
             logger.error(f"Discovery poll failed: {e}", exc_info=True)
 
+    async def _listen_for_discovery_jobs(self):
+        """Run cloud discovery jobs as soon as the API announces them."""
+        try:
+            await self.discovery_executor.listen_for_jobs()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Discovery job listener stopped: {e}", exc_info=True)
+            logger.warning("Falling back to scheduled discovery polling only")
+
     def _setup_scheduled_syncs(self):
         """Setup scheduled sync tasks using aiocron."""
         logger.info("Setting up scheduled syncs")
@@ -398,6 +408,12 @@ class WorkerService:
         # Setup scheduled syncs (includes discovery polling)
         self._setup_scheduled_syncs()
 
+        # Pick up API-queued discovery jobs without waiting for the next poll
+        if self.discovery_executor:
+            self.sync_tasks.append(
+                asyncio.create_task(self._listen_for_discovery_jobs())
+            )
+
         logger.info(
             "Elder Worker Service started",
             health_port=settings.health_check_port,
@@ -14,6 +14,8 @@ from datetime import datetime, timezone
 
 from penguin_dal import DAL
 
+from shared.database.async_pool import create_async_pool
+
 logger = logging.getLogger(__name__)
 
 
@@ -157,6 +159,9 @@ def init_db(app):
     # Attach to Flask app for use in endpoints
     app.db = db
 
+    # Native asyncio pool for hot endpoints (PostgreSQL only, None otherwise)
+    app.db_async = create_async_pool(database_url)
+
     # Register per-request teardown to return connections to pool cleanly.
     # Without this, psycopg2 cursors go stale between requests — the pool hands
     # out a connection whose cursor is already closed, causing "cursor already
@@ -199,9 +204,11 @@ def init_db(app):
             read_url = read_url.replace("postgres://", "postgresql://", 1)
         logger.info("Initializing read replica connection")
         app.db_read = DAL(read_url, pool_size=10, migrate=False)
+        app.db_async_read = create_async_pool(read_url)
     else:
         # No replica configured — reads go to primary
         app.db_read = db
+        app.db_async_read = app.db_async
 
     # Create default admin user if not exists
     _create_default_admin(app, db)
@@ -0,0 +1,127 @@
+"""Native asyncio PostgreSQL connection pool for hot read/write paths.
+
+penguin-dal is synchronous, so every query from an async Flask view hops onto
+the run_in_threadpool executor. For the busiest endpoints this module offers an
+asyncpg pool that the event loop awaits directly, with no thread handoff.
+
+asyncpg pools are bound to the event loop that created them, so one pool is
+created lazily per running loop. Only PostgreSQL is supported; callers must
+fall back to penguin-dal when ``app.db_async`` is None (e.g. SQLite in tests).
+"""
+
+# flake8: noqa: E501
+
+import asyncio
+import logging
+import weakref
+from typing import Any, List, Optional
+
+import asyncpg
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Pool sizing: kept at the same order as the penguin-dal pool (10) and the
+# run_in_threadpool executor (20) so the database sees a bounded connection
+# count per worker process regardless of which path a request takes.
+ASYNC_POOL_MIN_SIZE = 5
+ASYNC_POOL_MAX_SIZE = 20
+ASYNC_POOL_MAX_INACTIVE_LIFETIME = 60
+
+# asyncpg prepares every statement server-side and keeps it per connection, so
+# hot queries are parsed and planned once per connection rather than per call.
+# Sized above the number of distinct statements the API issues through the
+# pool so none are evicted and re-prepared under load.
+ASYNC_POOL_STATEMENT_CACHE_SIZE = 512
+
+
+async def _init_connection(conn: asyncpg.Connection) -> None:
+    """Decode json/jsonb columns to Python objects like penguin-dal does."""
+    for typename in ("json", "jsonb"):
+        await conn.set_type_codec(
+            typename,
+            encoder=lambda value: orjson.dumps(value).decode(),
+            decoder=orjson.loads,
+            schema="pg_catalog",
+        )
+
+
+class AsyncPool:
+    """Lazily created, per-event-loop asyncpg pool."""
+
+    def __init__(
+        self,
+        database_url: str,
+        min_size: int = ASYNC_POOL_MIN_SIZE,
+        max_size: int = ASYNC_POOL_MAX_SIZE,
+        max_inactive_connection_lifetime: float = ASYNC_POOL_MAX_INACTIVE_LIFETIME,
+    ):
+        """
+        Initialize pool settings; no connections are opened until first use.
+
+        Args:
+            database_url: PostgreSQL URL (SQLAlchemy driver suffixes are stripped)
+            min_size: Connections kept open per event loop
+            max_size: Upper bound on connections per event loop
+            max_inactive_connection_lifetime: Seconds before idle connections close
+        """
+        scheme, sep, rest = database_url.partition("://")
+        self._dsn = scheme.split("+", 1)[0] + sep + rest
+        self._min_size = min_size
+        self._max_size = max_size
+        self._max_inactive = max_inactive_connection_lifetime
+        # event loop -> Future[asyncpg.Pool]; entries vanish with their loop
+        self._pools = weakref.WeakKeyDictionary()
+
+    async def pool(self) -> asyncpg.Pool:
+        """Return the pool for the running event loop, creating it on first use."""
+        loop = asyncio.get_running_loop()
+        future = self._pools.get(loop)
+        if future is None:
+            future = loop.create_future()
+            self._pools[loop] = future
+            try:
+                pool = await asyncpg.create_pool(
+                    self._dsn,
+                    min_size=self._min_size,
+                    max_size=self._max_size,
+                    max_inactive_connection_lifetime=self._max_inactive,
+                    statement_cache_size=ASYNC_POOL_STATEMENT_CACHE_SIZE,
+                    init=_init_connection,
+                )
+            except Exception as e:
+                del self._pools[loop]
+                future.set_exception(e)
+                # Mark retrieved so concurrent waiters own the error, not the loop
+                future.exception()
+                raise
+            future.set_result(pool)
+            logger.info("asyncpg pool created (max_size=%d)", self._max_size)
+        return await asyncio.shield(future)
+
+    async def fetch(self, query: str, *args: Any) -> List[asyncpg.Record]:
+        """Run a query and return all rows."""
+        return await (await self.pool()).fetch(query, *args)
+
+    async def fetchrow(self, query: str, *args: Any) -> Optional[asyncpg.Record]:
+        """Run a query and return the first row, or None."""
+        return await (await self.pool()).fetchrow(query, *args)
+
+    async def fetchval(self, query: str, *args: Any) -> Any:
+        """Run a query and return the first column of the first row."""
+        return await (await self.pool()).fetchval(query, *args)
+
+
+def create_async_pool(database_url: str) -> Optional[AsyncPool]:
+    """
+    Create an AsyncPool for PostgreSQL URLs.
+
+    Args:
+        database_url: Database URL in SQLAlchemy format
+
+    Returns:
+        AsyncPool for PostgreSQL, None for any other backend
+    """
+    if not database_url.startswith("postgresql"):
+        return None
+    return AsyncPool(database_url)
@@ -0,0 +1,96 @@
+"""
+Unit tests for deferred audit logging.
+
+No database required - the app's DAL is mocked.
+"""
+
+import threading
+from unittest.mock import MagicMock
+
+from flask import Flask
+
+from apps.api.services.audit import service as audit_module
+from apps.api.services.audit.service import AuditService
+
+
+class TestDeferredAudit:
+    """Test the deferred audit queue and its batched writes."""
+
+    def test_flush_deferred_batches_per_app(self):
+        """Test queued rows are written with one bulk insert per app."""
+        app = Flask(__name__)
+        app.db = MagicMock()
+        for resource_id in (1, 2, 3):
+            row = AuditService._build_row(
+                action="approve",
+                resource_type="group_access_request",
+                resource_id=resource_id,
+            )
+            audit_module._deferred_queue.put((app, row, 0))
+
+        AuditService.flush_deferred()
+
+        app.db.audit_logs.bulk_insert.assert_called_once()
+        rows = app.db.audit_logs.bulk_insert.call_args[0][0]
+        assert [r["resource_id"] for r in rows] == [1, 2, 3]
+        assert audit_module._deferred_queue.empty()
+
+    def test_write_failure_is_retried_then_dropped(self):
+        """Test a failed insert is retried up to the attempt limit, not raised."""
+        app = Flask(__name__)
+        app.db = MagicMock()
+        app.db.audit_logs.bulk_insert.side_effect = RuntimeError("db down")
+        audit_module._deferred_queue.put(
+            (app, AuditService._build_row(action="deny", resource_type="x"), 0)
+        )
+
+        AuditService.flush_deferred()
+
+        assert (
+            app.db.audit_logs.bulk_insert.call_count
+            == audit_module.DEFERRED_MAX_ATTEMPTS
+        )
+        assert audit_module._deferred_queue.empty()
+
+    def test_transient_failure_is_written_on_retry(self):
+        """Test a row whose first insert fails is written on the next attempt."""
+        app = Flask(__name__)
+        app.db = MagicMock()
+        app.db.audit_logs.bulk_insert.side_effect = [RuntimeError("db down"), None]
+        audit_module._deferred_queue.put(
+            (app, AuditService._build_row(action="approve", resource_type="x"), 0)
+        )
+
+        AuditService.flush_deferred()
+
+        assert app.db.audit_logs.bulk_insert.call_count == 2
+        app.db.commit.assert_called_once()
+        assert audit_module._deferred_queue.empty()
+
+    def test_stop_writer_joins_thread_and_flushes(self, monkeypatch):
+        """Test stopping the writer waits for it and writes everything queued."""
+        app = Flask(__name__)
+        app.db = MagicMock()
+        stop = threading.Event()
+        monkeypatch.setattr(audit_module, "_writer_stop", stop)
+        writer = threading.Thread(target=audit_module._writer_loop, daemon=True)
+        monkeypatch.setattr(audit_module, "_writer", writer)
+        writer.start()
+        for resource_id in (1, 2):
+            row = AuditService._build_row(
+                action="approve",
+                resource_type="group_access_request",
+                resource_id=resource_id,
+            )
+            audit_module._deferred_queue.put((app, row, 0))
+
+        audit_module._stop_writer()
+
+        assert not writer.is_alive()
+        written = [
+            r["resource_id"]
+            for call in app.db.audit_logs.bulk_insert.call_args_list
+            for r in call[0][0]
+        ]
+        assert sorted(written) == [1, 2]
+        assert audit_module._deferred_queue.empty()
@@ -0,0 +1,32 @@
+"""
+Unit tests for the asyncpg pool wrapper.
+
+No database required - pool creation is lazy and not exercised here.
+"""
+
+import pytest
+
+pytest.importorskip("asyncpg")
+
+from shared.database.async_pool import AsyncPool, create_async_pool  # noqa: E402
+
+
+class TestAsyncPool:
+    """Test AsyncPool construction."""
+
+    def test_create_async_pool_postgres(self):
+        """Test PostgreSQL URLs get a pool."""
+        pool = create_async_pool("postgresql://elder:secret@db:5432/elder")
+
+        assert isinstance(pool, AsyncPool)
+
+    def test_create_async_pool_other_backends(self):
+        """Test non-PostgreSQL URLs fall back to penguin-dal."""
+        assert create_async_pool("sqlite:///elder.db") is None
+        assert create_async_pool("mysql://elder:secret@db/elder") is None
+
+    def test_driver_suffix_stripped(self):
+        """Test SQLAlchemy driver suffixes are removed for asyncpg."""
+        pool = AsyncPool("postgresql+psycopg2://elder:secret@db:5432/elder")
+
+        assert pool._dsn == "postgresql://elder:secret@db:5432/elder"
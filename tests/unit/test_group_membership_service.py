@@ -0,0 +1,208 @@
+"""
+Unit tests for Group Membership Service.
+
+Tests ownership checks, their caching, and group listing counts.
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from apps.api.services.group_membership import service as service_module
+from apps.api.services.group_membership.service import GroupMembershipService
+
+
+class TestGroupMembershipService:
+    """Test GroupMembershipService ownership checks."""
+
+    @pytest.fixture(autouse=True)
+    def clear_owner_cache(self):
+        """Isolate tests from the process-level ownership cache."""
+        service_module.invalidate_owner_cache()
+        yield
+        service_module.invalidate_owner_cache()
+
+    @pytest.fixture
+    def mock_db(self):
+        """Create mock PyDAL database."""
+        db = MagicMock()
+        db.identity_groups = MagicMock()
+        db.identity_group_memberships = MagicMock()
+        db.commit = MagicMock()
+        return db
+
+    @pytest.fixture
+    def service(self, mock_db):
+        """Create GroupMembershipService instance."""
+        return GroupMembershipService(mock_db)
+
+    def test_is_group_owner_direct(self, service, mock_db):
+        """Test direct owner is recognized."""
+        mock_group = MagicMock()
+        mock_group.owner_identity_id = 10
+        mock_group.owner_group_id = None
+        mock_db.identity_groups.__getitem__.return_value = mock_group
+
+        assert service.is_group_owner(10, 1) is True
+        assert service.is_group_owner(11, 1) is False
+
+    def test_is_group_owner_cached(self, service, mock_db):
+        """Test repeated checks for the same pair skip the database."""
+        mock_group = MagicMock()
+        mock_group.owner_identity_id = 10
+        mock_group.owner_group_id = None
+        mock_db.identity_groups.__getitem__.return_value = mock_group
+
+        assert service.is_group_owner(10, 1) is True
+        assert service.is_group_owner(10, 1) is True
+
+        assert mock_db.identity_groups.__getitem__.call_count == 1
+
+    def test_update_group_invalidates_owner_cache(self, service, mock_db):
+        """Test ownership changes are visible to the next check."""
+        mock_group = MagicMock()
+        mock_group.owner_identity_id = 10
+        mock_group.owner_group_id = None
+        mock_db.identity_groups.__getitem__.return_value = mock_group
+
+        assert service.is_group_owner(10, 1) is True
+
+        mock_group.owner_identity_id = 20
+        service.get_group = MagicMock(return_value={"id": 1})
+        with patch.object(service_module, "AuditService"):
+            service.update_group(group_id=1, owner_identity_id=20, updated_by=10)
+
+        assert service.is_group_owner(10, 1) is False
+        assert service.is_group_owner(20, 1) is True
+
+    def test_group_counts_batched(self, service, mock_db):
+        """Test member and pending counts take one query each per page."""
+        groups = []
+        for group_id in (1, 2, 3):
+            group = MagicMock()
+            group.id = group_id
+            group.approval_mode = None
+            group.approval_threshold = None
+            group.provider = None
+            group.sync_enabled = None
+            group.created_at = None
+            group.updated_at = None
+            groups.append(group)
+
+        mock_db().select.side_effect = [
+            [MagicMock(group_id=1), MagicMock(group_id=1), MagicMock(group_id=3)],
+            [MagicMock(group_id=2)],
+        ]
+
+        result = service._groups_to_dicts(
+            groups, include_members=True, include_pending=True
+        )
+
+        assert [g["member_count"] for g in result] == [2, 0, 1]
+        assert [g["pending_request_count"] for g in result] == [0, 1, 0]
+        assert mock_db().select.call_count == 2
+
+    def test_bulk_approve_requests_batched(self, service, mock_db):
+        """Test bulk approval classifies ids and writes each step once."""
+        pending = MagicMock(id=1, group_id=5, status="pending", requester_id=7)
+        approved = MagicMock(id=2, group_id=5, status="approved")
+        group = MagicMock(
+            id=5,
+            owner_identity_id=10,
+            approval_mode="any",
+            provider="internal",
+        )
+
+        mock_db().select.side_effect = [
+            [pending, approved],  # requests
+            [group],  # groups
+            [MagicMock(request_id=1)],  # approvals
+        ]
+
+        with patch.object(service_module, "AuditService") as audit:
+            result = service.bulk_approve_requests([1, 2, 3, 1], approver_id=10)
+
+        assert result["approved"] == [1]
+        assert result["failed"] == [
+            {"id": 2, "error": "Request is not pending (status: approved)"},
+            {"id": 3, "error": "Request not found"},
+        ]
+        mock_db.group_access_approvals.bulk_insert.assert_called_once()
+        memberships = mock_db.identity_group_memberships.bulk_insert.call_args[0][0]
+        assert [(m["group_id"], m["identity_id"]) for m in memberships] == [(5, 7)]
+        assert len(audit.log_many.call_args[0][0]) == 1
+
+    def test_bulk_approve_requests_not_owner(self, service, mock_db):
+        """Test ownership via an owning group is resolved in one query."""
+        owned = MagicMock(id=1, group_id=5, status="pending", requester_id=7)
+        foreign = MagicMock(id=2, group_id=6, status="pending", requester_id=7)
+        owned_group = MagicMock(id=5, owner_identity_id=1, owner_group_id=50)
+        foreign_group = MagicMock(id=6, owner_identity_id=1, owner_group_id=60)
+        owned_group.approval_mode = "any"
+        owned_group.provider = "internal"
+
+        mock_db().select.side_effect = [
+            [owned, foreign],  # requests
+            [owned_group, foreign_group],  # groups
+            [MagicMock(group_id=50)],  # approver's owning-group memberships
+            [MagicMock(request_id=1)],  # approvals
+        ]
+
+        with patch.object(service_module, "AuditService"):
+            result = service.bulk_approve_requests([1, 2], approver_id=10)
+
+        assert result["approved"] == [1]
+        assert result["failed"] == [
+            {"id": 2, "error": "Not authorized to approve this request"}
+        ]
+
+    def test_group_counts_precomputed(self, service, mock_db):
+        """Test counts fetched through the async pool skip the database."""
+        group = MagicMock(id=1)
+        counts = service._counts_from_rows([(1, 4, 2)])
+
+        result = service._groups_to_dicts([group], True, True, counts)
+
+        assert result[0]["member_count"] == 4
+        assert result[0]["pending_request_count"] == 2
+        mock_db().select.assert_not_called()
+
+    def test_owned_groups_cache_answers_ownership(self, service, mock_db):
+        """Test a cached owned-groups set skips the ownership queries."""
+        service_module._owned_groups_cache[10] = [5]
+        groups = [MagicMock(id=5), MagicMock(id=6)]
+
+        assert service._owned_among(10, groups) == {5}
+        assert service.is_group_owner(10, 5) is True
+        assert service.is_group_owner(10, 6) is False
+        mock_db().select.assert_not_called()
+        mock_db.identity_groups.__getitem__.assert_not_called()
+
+    def test_group_counts_members_only(self, service, mock_db):
+        """Test only the requested count is queried."""
+        mock_db().select.return_value = [MagicMock(group_id=1)]
+
+        member_counts, pending_counts = service._group_counts(
+            [1], include_members=True, include_pending=False
+        )
+
+        assert member_counts == {1: 1}
+        assert pending_counts == {}
+        assert mock_db().select.call_count == 1
+
+    def test_group_counts_specialized_sql(self, service, mock_db):
+        """Test PostgreSQL runs the statement for the requested counts."""
+        with (
+            patch.object(service_module, "is_postgres", return_value=True),
+            patch.object(
+                service_module, "execute_sql", return_value=[(1, 0, 3)]
+            ) as execute_sql,
+        ):
+            _, pending_counts = service._group_counts(
+                [1], include_members=False, include_pending=True
+            )
+
+        _, sql, params = execute_sql.call_args[0]
+        assert "identity_group_memberships" not in sql
+        assert params == ([1], "pending")
+        assert pending_counts == {1: 3}
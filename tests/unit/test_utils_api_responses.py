@@ -156,3 +156,79 @@ class TestApiResponse:
             assert status_code == 500
             data = json.loads(response.data)
             assert data["error"] == "Database error"
+
+    def test_orjson(self, app):
+        """Test orjson response splices pre-encoded fragments."""
+        import orjson
+
+        with app.app_context():
+            response, status_code = ApiResponse.orjson(
+                {"id": 1, "metadata": orjson.Fragment(b'{"a": [1, 2]}')}
+            )
+
+            assert status_code == 200
+            assert response.mimetype == "application/json"
+            data = json.loads(response.data)
+            assert data == {"id": 1, "metadata": {"a": [1, 2]}}
+
+    def test_stream_paginated(self, app):
+        """Test streamed pages decode to the same body as a buffered one."""
+        from dataclasses import dataclass
+
+        from apps.api.models.dataclasses import PaginatedResponse
+        from apps.api.utils import api_responses
+
+        @dataclass
+        class Item:
+            id: int
+
+        items = [Item(id=i) for i in range(api_responses.STREAM_CHUNK_ITEMS + 5)]
+        page = PaginatedResponse(items=items, total=205, page=1, per_page=105, pages=2)
+
+        with app.app_context():
+            response, status_code = ApiResponse.stream_paginated(page)
+
+            assert status_code == 200
+            assert response.is_streamed
+            data = json.loads(response.get_data())
+            assert data["total"] == 205
+            assert data["pages"] == 2
+            assert [item["id"] for item in data["items"]] == list(range(105))
+
+    def test_stream_paginated_empty(self, app):
+        """Test an empty page streams a valid document."""
+        from apps.api.models.dataclasses import PaginatedResponse
+
+        page = PaginatedResponse(items=[], total=0, page=1, per_page=50, pages=0)
+
+        with app.app_context():
+            response, _ = ApiResponse.stream_paginated(page)
+
+            assert json.loads(response.get_data())["items"] == []
+
+    def test_stream_paginated_lazy_items(self, app):
+        """Test generator items stream with every PaginatedResponse field."""
+        from apps.api.models.dataclasses import PaginatedResponse
+
+        page = PaginatedResponse(
+            items=({"id": i} for i in range(3)),
+            total=None,
+            page=1,
+            per_page=3,
+            pages=None,
+            next_cursor="abc",
+        )
+
+        with app.app_context():
+            response, _ = ApiResponse.stream_paginated(page)
+            body = response.get_data()
+
+            assert body.startswith(b'{"items":[')
+            assert json.loads(body) == {
+                "items": [{"id": 0}, {"id": 1}, {"id": 2}],
+                "total": None,
+                "page": 1,
+                "per_page": 3,
+                "pages": None,
+                "next_cursor": "abc",
+            }
@@ -0,0 +1,110 @@
+"""
+Unit tests for asyncpg list page helpers.
+
+No database required - the pool is mocked.
+"""
+
+import asyncio
+from datetime import datetime, timezone
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from apps.api.utils import count_cache
+from apps.api.utils.async_list import fetch_list_page, list_page_sql
+from apps.api.utils.pydal_helpers import decode_cursor
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from the process-level count cache."""
+    count_cache._count_cache.clear()
+    count_cache._invalidated_at.clear()
+    yield
+    count_cache._count_cache.clear()
+    count_cache._invalidated_at.clear()
+
+
+class TestListPageSql:
+    """Test statement text per filter combination."""
+
+    def test_no_filters(self):
+        """Test an unfiltered page only takes LIMIT and OFFSET."""
+        page_sql, count_sql = list_page_sql("ipam_vlans", "id", (), False)
+
+        assert page_sql == (
+            "SELECT id FROM ipam_vlans WHERE TRUE "
+            "ORDER BY created_at DESC, id DESC LIMIT $1 OFFSET $2"
+        )
+        assert count_sql == "SELECT count(*) FROM ipam_vlans WHERE TRUE"
+
+    def test_filters_and_keyset(self):
+        """Test values are numbered in order and the cursor follows them."""
+        page_sql, count_sql = list_page_sql(
+            "ipam_vlans",
+            "*",
+            ("status = {0}", "(lower(name) LIKE {0} OR lower(description) LIKE {0})"),
+            True,
+        )
+
+        assert page_sql == (
+            "SELECT * FROM ipam_vlans WHERE status = $1 AND "
+            "(lower(name) LIKE $2 OR lower(description) LIKE $2) AND "
+            "(created_at, id) < ($3, $4) "
+            "ORDER BY created_at DESC, id DESC LIMIT $5 OFFSET $6"
+        )
+        assert count_sql == (
+            "SELECT count(*) FROM ipam_vlans WHERE status = $1 AND "
+            "(lower(name) LIKE $2 OR lower(description) LIKE $2)"
+        )
+
+    def test_same_filters_same_text(self):
+        """Test a filter combination always yields the same statement."""
+        first = list_page_sql("issues", "*", ("status = {0}",), False)
+
+        assert list_page_sql("issues", "*", ("status = {0}",), False) is first
+
+
+class TestFetchListPage:
+    """Test page fetching over a mocked pool."""
+
+    def test_page_total_and_cursor(self):
+        """Test the look-ahead row yields a cursor and the total is counted."""
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        pool = MagicMock()
+        pool.fetchval = AsyncMock(return_value=3)
+        pool.fetch = AsyncMock(
+            return_value=[{"id": i, "created_at": ts} for i in (3, 2, 1)]
+        )
+
+        total, rows, next_cursor = asyncio.run(
+            fetch_list_page(
+                pool,
+                "issues",
+                "*",
+                [("status = {0}", "OPEN")],
+                ("issues", "OPEN"),
+                offset=0,
+                limit=2,
+            )
+        )
+
+        assert total == 3
+        assert [row["id"] for row in rows] == [3, 2]
+        assert decode_cursor(next_cursor, datetime.fromisoformat) == (ts, 2)
+        assert pool.fetch.call_args[0][1:] == ("OPEN", 3, 0)
+
+    def test_keyset_skips_total(self):
+        """Test a cursor page seeks past the cursor and skips the count."""
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+        pool = MagicMock()
+        pool.fetchval = AsyncMock()
+        pool.fetch = AsyncMock(return_value=[])
+
+        total, rows, next_cursor = asyncio.run(
+            fetch_list_page(pool, "issues", "*", [], None, after=(ts, 7), limit=2)
+        )
+
+        assert (total, rows, next_cursor) == (None, [], None)
+        assert pool.fetch.call_args[0][1:] == (ts, 7, 3, 0)
+        pool.fetchval.assert_not_called()
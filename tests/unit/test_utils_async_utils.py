@@ -0,0 +1,55 @@
+"""
+Unit tests for async utility functions.
+
+No external dependencies required - pure unit tests.
+"""
+
+import asyncio
+import threading
+import time
+
+from apps.api.utils import async_utils
+from apps.api.utils.async_utils import run_in_threadpool
+
+
+class TestRunInThreadpool:
+    """Test run_in_threadpool helper."""
+
+    def test_returns_result(self):
+        """Test blocking function result is returned."""
+        result = asyncio.run(run_in_threadpool(lambda x, y: x + y, 2, y=3))
+
+        assert result == 5
+
+    def test_concurrency_limited(self, monkeypatch):
+        """Test no more than DB_CONCURRENCY_LIMIT calls run at once."""
+        monkeypatch.setattr(async_utils, "DB_CONCURRENCY_LIMIT", 2)
+        lock = threading.Lock()
+        state = {"active": 0, "peak": 0}
+
+        def blocking_call():
+            with lock:
+                state["active"] += 1
+                state["peak"] = max(state["peak"], state["active"])
+            time.sleep(0.02)
+            with lock:
+                state["active"] -= 1
+
+        async def burst():
+            await asyncio.gather(*(run_in_threadpool(blocking_call) for _ in range(8)))
+
+        asyncio.run(burst())
+
+        assert state["peak"] == 2
+
+
+class TestRunCpuBound:
+    """Test run_cpu_bound helper."""
+
+    def test_runs_on_cpu_executor(self):
+        """Test work runs outside the DB executor."""
+        result = asyncio.run(
+            async_utils.run_cpu_bound(lambda: threading.current_thread().name)
+        )
+
+        assert result.startswith("cpu_")
@@ -0,0 +1,74 @@
+"""
+Unit tests for HTTP response compression.
+
+No external dependencies required - pure unit tests.
+"""
+
+import gzip
+
+import pytest
+from flask import Flask, Response, jsonify
+
+from apps.api.utils.compression import COMPRESS_MIN_SIZE, init_compression
+
+
+@pytest.fixture
+def client():
+    """Create a Flask test client with compression enabled."""
+    app = Flask(__name__)
+    init_compression(app)
+
+    @app.route("/large")
+    def large():
+        return jsonify({"items": ["username"] * COMPRESS_MIN_SIZE})
+
+    @app.route("/small")
+    def small():
+        return jsonify({"ok": True})
+
+    @app.route("/stream")
+    def stream():
+        def generate():
+            yield b'{"items":['
+            yield b",".join(b'"username"' for _ in range(COMPRESS_MIN_SIZE))
+            yield b"]}"
+
+        return Response(generate(), mimetype="application/json")
+
+    return app.test_client()
+
+
+class TestCompression:
+    """Test the gzip after_request hook."""
+
+    def test_large_json_is_gzipped(self, client):
+        """Test large JSON bodies are gzip-encoded when accepted."""
+        response = client.get("/large", headers={"Accept-Encoding": "gzip, br"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Accept-Encoding" in response.headers["Vary"]
+        body = gzip.decompress(response.get_data())
+        assert body.count(b"username") == COMPRESS_MIN_SIZE
+
+    def test_not_accepted(self, client):
+        """Test clients without gzip get the identity encoding."""
+        response = client.get("/large")
+
+        assert "Content-Encoding" not in response.headers
+        assert "Accept-Encoding" in response.headers["Vary"]
+
+    def test_small_body_uncompressed(self, client):
+        """Test bodies under the minimum size are sent as-is."""
+        response = client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+        assert "Content-Encoding" not in response.headers
+        assert response.get_json() == {"ok": True}
+
+    def test_streamed_body_gzipped(self, client):
+        """Test streamed responses are compressed without buffering."""
+        response = client.get("/stream", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert "Content-Length" not in response.headers
+        body = gzip.decompress(response.get_data())
+        assert body.startswith(b'{"items":[') and body.endswith(b"]}")
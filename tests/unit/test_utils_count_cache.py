@@ -0,0 +1,77 @@
+"""
+Unit tests for the paginated total cache.
+
+No external dependencies required - pure unit tests.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.api.utils import count_cache
+from apps.api.utils.count_cache import (
+    COUNT_CACHE_MIN_TOTAL,
+    COUNT_CACHE_SETTLE_SECONDS,
+    cached_count,
+    invalidate_counts,
+)
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from the process-level cache."""
+    count_cache._count_cache.clear()
+    count_cache._invalidated_at.clear()
+    yield
+    count_cache._count_cache.clear()
+    count_cache._invalidated_at.clear()
+
+
+class TestCountCache:
+    """Test cached_count thresholds and invalidation."""
+
+    def test_large_total_cached(self):
+        """Test a large total is counted once per filter key."""
+        count = MagicMock(return_value=COUNT_CACHE_MIN_TOTAL + 1)
+
+        assert cached_count(("issues", "open"), count) == COUNT_CACHE_MIN_TOTAL + 1
+        assert cached_count(("issues", "open"), count) == COUNT_CACHE_MIN_TOTAL + 1
+        assert count.call_count == 1
+
+        cached_count(("issues", "closed"), count)
+        assert count.call_count == 2
+
+    def test_small_total_not_cached(self):
+        """Test small totals are recounted so they stay exact."""
+        count = MagicMock(return_value=3)
+
+        cached_count(("issues", None), count)
+        cached_count(("issues", None), count)
+
+        assert count.call_count == 2
+
+    def test_invalidate_counts_per_resource(self):
+        """Test invalidation drops only the written resource's totals."""
+        count = MagicMock(return_value=COUNT_CACHE_MIN_TOTAL + 1)
+        cached_count(("ipam_vlans", 1), count)
+        cached_count(("ipam_addresses", 1), count)
+
+        invalidate_counts("ipam_vlans")
+        cached_count(("ipam_vlans", 1), count)
+        cached_count(("ipam_addresses", 1), count)
+
+        assert count.call_count == 3
+
+    def test_not_cached_right_after_invalidation(self):
+        """Test totals counted while a replica may lag the write are not kept."""
+        count = MagicMock(return_value=COUNT_CACHE_MIN_TOTAL + 1)
+
+        invalidate_counts("issues")
+        cached_count(("issues", "open"), count)
+        cached_count(("issues", "open"), count)
+        assert count.call_count == 2
+
+        count_cache._invalidated_at["issues"] -= COUNT_CACHE_SETTLE_SECONDS
+        cached_count(("issues", "open"), count)
+        cached_count(("issues", "open"), count)
+        assert count.call_count == 3
@@ -0,0 +1,60 @@
+"""
+Unit tests for HTTP conditional-request utilities.
+
+No external dependencies required - pure unit tests.
+"""
+
+from datetime import datetime, timezone
+
+import pytest
+from flask import Flask, jsonify
+
+from apps.api.utils.http_cache import not_modified, weak_etag, with_etag
+
+
+@pytest.fixture
+def app():
+    """Create Flask app for testing."""
+    app = Flask(__name__)
+    return app
+
+
+class TestHttpCache:
+    """Test ETag helper functions."""
+
+    def test_weak_etag_is_stable(self):
+        """Test same parts produce the same ETag."""
+        ts = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+        assert weak_etag("entity", 1, ts) == weak_etag("entity", 1, ts)
+        assert weak_etag("entity", 1, ts) != weak_etag("entity", 2, ts)
+
+    def test_not_modified_matching(self, app):
+        """Test 304 when If-None-Match carries the weak ETag."""
+        etag = weak_etag("entity", 1)
+
+        with app.test_request_context(headers={"If-None-Match": f'W/"{etag}"'}):
+            response, status_code = not_modified(etag)
+
+            assert status_code == 304
+            assert response.headers["ETag"] == f'W/"{etag}"'
+
+    def test_not_modified_mismatch(self, app):
+        """Test no short-circuit when ETag differs or header is absent."""
+        etag = weak_etag("entity", 1)
+
+        with app.test_request_context(headers={"If-None-Match": 'W/"other"'}):
+            assert not_modified(etag) is None
+
+        with app.test_request_context():
+            assert not_modified(etag) is None
+
+    def test_with_etag(self, app):
+        """Test ETag header is attached to a response tuple."""
+        etag = weak_etag("entity", 1)
+
+        with app.test_request_context():
+            response, status_code = with_etag((jsonify({"id": 1}), 200), etag)
+
+            assert status_code == 200
+            assert response.headers["ETag"] == f'W/"{etag}"'
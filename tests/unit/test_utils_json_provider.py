@@ -0,0 +1,72 @@
+"""
+Unit tests for the orjson Flask JSON provider.
+
+No external dependencies required - pure unit tests.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, timezone
+from decimal import Decimal
+
+import pytest
+from flask import Flask, jsonify, request
+from flask.json.provider import DefaultJSONProvider
+
+from apps.api.utils.json_provider import OrjsonProvider
+
+
+@dataclass
+class _Item:
+    id: int
+    name: str
+
+
+@pytest.fixture
+def app():
+    """Create Flask app using the orjson provider."""
+    app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    return app
+
+
+class TestOrjsonProvider:
+    """Test OrjsonProvider serialization."""
+
+    def test_jsonify(self, app):
+        """Test jsonify emits compact UTF-8 JSON with RFC 822 datetimes."""
+        with app.app_context():
+            response = jsonify(
+                {"name": "café", "at": datetime(2026, 1, 1), 1: Decimal("1.5")}
+            )
+
+        assert response.mimetype == "application/json"
+        assert response.get_data() == (
+            '{"name":"café","at":"Thu, 01 Jan 2026 00:00:00 GMT","1":"1.5"}'.encode()
+        )
+
+    def test_dates_match_default_provider(self, app):
+        """Test dates and datetimes serialize as Flask's default provider does."""
+        values = {
+            "naive": datetime(2025, 1, 1, 12, 30),
+            "aware": datetime(2025, 1, 1, 12, 30, tzinfo=timezone.utc),
+            "day": date(2025, 1, 1),
+        }
+
+        assert app.json.loads(app.json.dumps(values)) == json.loads(
+            DefaultJSONProvider(app).dumps(values)
+        )
+
+    def test_dataclass(self, app):
+        """Test dataclasses serialize natively."""
+        assert app.json.dumps(_Item(id=1, name="x")) == '{"id":1,"name":"x"}'
+
+    def test_loads(self, app):
+        """Test request bodies are parsed with orjson."""
+        with app.test_request_context(json={"id": 1}):
+            assert request.get_json() == {"id": 1}
+
+    def test_unsupported_type(self, app):
+        """Test unknown types raise TypeError."""
+        with pytest.raises(TypeError):
+            app.json.dumps({"x": object()})
@@ -5,6 +5,8 @@ These tests use mocking to avoid external dependencies.
 No network calls or real database required.
 """
 
+import sqlite3
+from datetime import datetime, timezone
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,15 +15,25 @@ from flask import Flask
 from apps.api.utils.pydal_helpers import (
     PaginationParams,
     commit_db,
+    decode_cursor,
     delete_record,
+    encode_cursor,
+    execute_sql,
     get_by_id,
     insert_record,
+    insert_returning,
+    is_postgres,
+    iter_sql,
+    keyset_after,
     paginated_query,
     query_count,
     query_delete,
     query_select,
     query_update,
+    select_with_total,
+    trim_page,
     update_record,
+    update_returning,
 )
 
 
@@ -218,6 +230,228 @@ class TestPyDALHelpers:
 
         mock_threadpool.assert_called_once()
 
+    def test_is_postgres(self):
+        """Test PostgreSQL dialect detection."""
+        mock_db = Mock()
+        mock_db.engine.dialect.name = "postgresql"
+        assert is_postgres(mock_db) is True
+
+        mock_db.engine.dialect.name = "sqlite"
+        assert is_postgres(mock_db) is False
+
+        assert is_postgres(object()) is False
+
+    def test_iter_sql(self):
+        """Test raw SQL iteration yields dict rows lazily."""
+        sqlalchemy = pytest.importorskip("sqlalchemy")
+
+        mock_db = Mock()
+        mock_db.engine = sqlalchemy.create_engine("sqlite://")
+        with mock_db.engine.begin() as conn:
+            conn.exec_driver_sql("CREATE TABLE t (id INTEGER, name TEXT)")
+            conn.exec_driver_sql("INSERT INTO t VALUES (1, 'a'), (2, 'b'), (3, 'c')")
+
+        rows = iter_sql(mock_db, "SELECT id, name FROM t WHERE id > ?", (1,), 1)
+
+        assert next(rows) == {"id": 2, "name": "b"}
+        assert list(rows) == [{"id": 3, "name": "c"}]
+
+    def test_execute_sql_real_dal(self, tmp_path):
+        """Test raw SQL runs through a real penguin-dal instance's engine."""
+        penguin_dal = pytest.importorskip("penguin_dal")
+
+        path = tmp_path / "elder.db"
+        with sqlite3.connect(path) as conn:
+            conn.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)")
+        db = penguin_dal.DAL(f"sqlite:///{path}", migrate=False, pool_size=1)
+
+        assert execute_sql(db, "INSERT INTO t (name) VALUES (?), (?)", ("a", "b")) == 2
+        assert execute_sql(db, "SELECT COUNT(*) FROM t") == [(2,)]
+        assert execute_sql(
+            db, "SELECT id, name FROM t WHERE name = ?", ("b",), as_dict=True
+        ) == [{"id": 2, "name": "b"}]
+        assert execute_sql(db, "DELETE FROM t WHERE id = ?", (1,)) == 1
+        assert db(db.t.id > 0).count() == 1
+
+
+class TestKeysetPagination:
+    """Test keyset cursor helpers."""
+
+    def test_cursor_round_trip(self):
+        """Test cursors decode to the values they were built from."""
+        assert decode_cursor(encode_cursor("admins", 7)) == ("admins", 7)
+
+    def test_cursor_datetime(self):
+        """Test datetime sort values survive with a parser."""
+        ts = datetime(2026, 1, 1, 12, 30, tzinfo=timezone.utc)
+
+        cursor = encode_cursor(ts, 3)
+
+        assert decode_cursor(cursor, datetime.fromisoformat) == (ts, 3)
+
+    def test_decode_cursor_invalid(self):
+        """Test malformed cursors raise ValueError."""
+        for cursor in ("not-base64!", encode_cursor("a", 1)[:-4], "W10="):
+            with pytest.raises(ValueError, match="Invalid cursor"):
+                decode_cursor(cursor)
+
+    def test_keyset_after(self):
+        """Test keyset predicates order on (sort, id) in both directions."""
+        sqlalchemy = pytest.importorskip("sqlalchemy")
+        name, id_ = sqlalchemy.column("name"), sqlalchemy.column("id")
+
+        def sql(clause):
+            return str(clause.compile(compile_kwargs={"literal_binds": True}))
+
+        assert sql(keyset_after(name, id_, ("b", 2))) == (
+            "name > 'b' OR name = 'b' AND id > 2"
+        )
+        assert sql(keyset_after(name, id_, ("b", 2), descending=True)) == (
+            "name < 'b' OR name = 'b' AND id < 2"
+        )
+
+    def test_trim_page(self):
+        """Test the look-ahead row becomes the next cursor's position."""
+        rows = [{"id": i, "created_at": f"2026-01-0{i}"} for i in (3, 2, 1)]
+
+        page, next_cursor = trim_page(rows, 2)
+
+        assert page == rows[:2]
+        assert decode_cursor(next_cursor) == ("2026-01-02", 2)
+        assert trim_page(rows, 3) == (rows, None)
+
+
+class TestSelectWithTotal:
+    """Test single-query page and total selection."""
+
+    def test_total_from_window_column(self):
+        """Test the total comes from the page rows and is stripped from them."""
+        penguin_dal = pytest.importorskip("penguin_dal")
+        query = Mock()
+        query.select.return_value = penguin_dal.Rows(
+            [
+                penguin_dal.Row({"id": 1, "_total": 7}),
+                penguin_dal.Row({"id": 2, "_total": 7}),
+            ]
+        )
+
+        rows, total = select_with_total(query, limitby=(0, 2))
+
+        assert total == 7
+        assert [row.as_dict() for row in rows] == [{"id": 1}, {"id": 2}]
+        query.count.assert_not_called()
+
+    def test_empty_first_page(self):
+        """Test an empty first page means zero without a count query."""
+        query = Mock()
+        query.select.return_value = []
+
+        assert select_with_total(query, limitby=(0, 50)) == ([], 0)
+        query.count.assert_not_called()
+
+    def test_page_past_end_counts(self):
+        """Test a page past the end falls back to a count query."""
+        query = Mock()
+        query.select.return_value = []
+        query.count.return_value = 12
+
+        assert select_with_total(query, limitby=(100, 150)) == ([], 12)
+
+
+class TestUpdateReturning:
+    """Test single-row updates that return the new row."""
+
+    @pytest.fixture
+    def pg_db(self):
+        """Mock PostgreSQL database with an ipam_prefixes table."""
+        db = Mock()
+        db.engine.dialect.name = "postgresql"
+        db.ipam_prefixes.table.c.keys.return_value = ["id", "status", "tags"]
+        return db
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_postgres_returning(self, mock_execute, pg_db):
+        """Test PostgreSQL updates and reads back in one statement."""
+        mock_execute.return_value = [{"id": 3, "status": "deprecated"}]
+
+        row = update_returning(pg_db, "ipam_prefixes", 3, {"status": "deprecated"})
+
+        assert row == {"id": 3, "status": "deprecated"}
+        _, sql, params = mock_execute.call_args[0]
+        assert sql == (
+            'UPDATE "ipam_prefixes" SET "status" = %s WHERE id = %s RETURNING *'
+        )
+        assert params == ("deprecated", 3)
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_postgres_missing_row(self, mock_execute, pg_db):
+        """Test no returned row means the id is unknown."""
+        mock_execute.return_value = []
+
+        assert update_returning(pg_db, "ipam_prefixes", 3, {"status": "x"}) is None
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_postgres_json_values_encoded(self, mock_execute, pg_db):
+        """Test dict values are sent as JSON text."""
+        mock_execute.return_value = [{"id": 3}]
+
+        update_returning(pg_db, "ipam_prefixes", 3, {"tags": {"env": "prod"}})
+
+        assert mock_execute.call_args[0][2] == ('{"env":"prod"}', 3)
+
+    def test_unknown_column_rejected(self, pg_db):
+        """Test column names outside the table never reach the SQL."""
+        with pytest.raises(ValueError, match="Unknown ipam_prefixes columns"):
+            update_returning(pg_db, "ipam_prefixes", 3, {"id = 1; --": 1})
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_other_backend_rereads(self, mock_execute):
+        """Test other backends update through the query builder."""
+        db = Mock()
+        db.engine.dialect.name = "sqlite"
+        db.return_value.update.return_value = 1
+        db.ipam_prefixes.__getitem__ = Mock(
+            return_value=Mock(as_dict=Mock(return_value={"id": 3}))
+        )
+
+        assert update_returning(db, "ipam_prefixes", 3, {"status": "x"}) == {"id": 3}
+        mock_execute.assert_not_called()
+
+
+class TestInsertReturning:
+    """Test single-row inserts that return the stored row."""
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_postgres_returning(self, mock_execute):
+        """Test PostgreSQL inserts and reads back in one statement."""
+        db = Mock()
+        db.engine.dialect.name = "postgresql"
+        db.ipam_vlans.table.c.keys.return_value = ["id", "vid", "name"]
+        mock_execute.return_value = [{"id": 5, "vid": 10, "name": "mgmt"}]
+
+        row = insert_returning(db, "ipam_vlans", {"vid": 10, "name": "mgmt"})
+
+        assert row == {"id": 5, "vid": 10, "name": "mgmt"}
+        _, sql, params = mock_execute.call_args[0]
+        assert sql == (
+            'INSERT INTO "ipam_vlans" ("vid", "name") VALUES (%s, %s) RETURNING *'
+        )
+        assert params == [10, "mgmt"]
+        db.ipam_vlans.insert.assert_not_called()
+
+    @patch("apps.api.utils.pydal_helpers.execute_sql")
+    def test_other_backend_rereads(self, mock_execute):
+        """Test other backends insert through the query builder."""
+        db = Mock()
+        db.engine.dialect.name = "sqlite"
+        db.ipam_vlans.insert.return_value = 5
+        db.ipam_vlans.__getitem__ = Mock(
+            return_value=Mock(as_dict=Mock(return_value={"id": 5}))
+        )
+
+        assert insert_returning(db, "ipam_vlans", {"vid": 10}) == {"id": 5}
+        mock_execute.assert_not_called()
+
 
 class TestPaginationParams:
     """Test PaginationParams class."""
@@ -0,0 +1,55 @@
+"""
+Unit tests for the organization tenant_id cache.
+
+No database required - the DAL is mocked.
+"""
+
+import asyncio
+from unittest.mock import MagicMock
+
+import pytest
+
+from apps.api.utils import tenant_cache
+from apps.api.utils.tenant_cache import get_org_tenant_id, invalidate_org_tenant
+
+
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Isolate tests from the process-level cache."""
+    invalidate_org_tenant()
+    yield
+    invalidate_org_tenant()
+
+
+class TestOrgTenantCache:
+    """Test get_org_tenant_id caching and invalidation."""
+
+    def test_repeat_lookup_cached(self):
+        """Test a second lookup for the same organization skips the database."""
+        db = MagicMock()
+        db().select().first.return_value = MagicMock(tenant_id=7)
+        db.reset_mock()
+
+        assert asyncio.run(get_org_tenant_id(db, 1)) == (True, 7)
+        assert asyncio.run(get_org_tenant_id(db, 1)) == (True, 7)
+
+        assert db().select().first.call_count == 1
+
+    def test_missing_org_not_cached(self):
+        """Test an unknown organization is reported and looked up again."""
+        db = MagicMock()
+        db().select().first.return_value = None
+        db.reset_mock()
+
+        assert asyncio.run(get_org_tenant_id(db, 2)) == (False, None)
+        assert 2 not in tenant_cache._org_tenant_cache
+
+    def test_invalidate_drops_entry(self):
+        """Test invalidation forces the next lookup to hit the database."""
+        db = MagicMock()
+        db().select().first.return_value = MagicMock(tenant_id=7)
+        asyncio.run(get_org_tenant_id(db, 1))
+
+        invalidate_org_tenant(1)
+
+        assert 1 not in tenant_cache._org_tenant_cache
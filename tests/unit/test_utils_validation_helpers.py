@@ -5,11 +5,13 @@ These tests use mocking to avoid external dependencies.
 No network calls or real database required.
 """
 
-from unittest.mock import Mock, patch
+import asyncio
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 from flask import Flask
 
+from apps.api.utils.tenant_cache import invalidate_org_tenant
 from apps.api.utils.validation_helpers import (
     validate_enum_value,
     validate_json_body,
@@ -28,6 +30,14 @@ def app():
     return app
 
 
+@pytest.fixture(autouse=True)
+def clear_org_tenant_cache():
+    """Isolate tests from memoized organization lookups."""
+    invalidate_org_tenant()
+    yield
+    invalidate_org_tenant()
+
+
 class TestValidationHelpers:
     """Test validation helper functions."""
 
@@ -110,7 +120,7 @@ class TestValidationHelpers:
 
     @pytest.mark.asyncio
     @patch("apps.api.utils.validation_helpers.current_app")
-    @patch("apps.api.utils.validation_helpers.run_in_threadpool")
+    @patch("apps.api.utils.tenant_cache.run_in_threadpool")
     async def test_validate_organization_and_get_tenant_success(
         self, mock_threadpool, mock_app, app
     ):
@@ -127,9 +137,34 @@ class TestValidationHelpers:
             assert tenant_id == 1
             assert error is None
 
+    def test_validate_organization_and_get_tenant_cached(self, app):
+        """Test repeated lookups are served from the cache until cleared."""
+        mock_org = Mock()
+        mock_org.tenant_id = 1
+        mock_app = Mock(db=MagicMock())
+        load = mock_app.db.return_value.select.return_value.first
+        load.return_value = mock_org
+
+        with (
+            app.app_context(),
+            patch("apps.api.utils.validation_helpers.current_app", mock_app),
+        ):
+            asyncio.run(validate_organization_and_get_tenant(1))
+            org, tenant_id, error = asyncio.run(validate_organization_and_get_tenant(1))
+
+            assert load.call_count == 1
+            assert org is mock_org
+            assert tenant_id == 1
+            assert error is None
+
+            invalidate_org_tenant(1)
+            asyncio.run(validate_organization_and_get_tenant(1))
+
+            assert load.call_count == 2
+
     @pytest.mark.asyncio
     @patch("apps.api.utils.validation_helpers.current_app")
-    @patch("apps.api.utils.validation_helpers.run_in_threadpool")
+    @patch("apps.api.utils.tenant_cache.run_in_threadpool")
     async def test_validate_organization_and_get_tenant_not_found(
         self, mock_threadpool, mock_app, app
     ):
@@ -147,7 +182,7 @@ class TestValidationHelpers:
 
     @pytest.mark.asyncio
     @patch("apps.api.utils.validation_helpers.current_app")
-    @patch("apps.api.utils.validation_helpers.run_in_threadpool")
+    @patch("apps.api.utils.tenant_cache.run_in_threadpool")
     async def test_validate_organization_and_get_tenant_no_tenant(
         self, mock_threadpool, mock_app, app
     ):